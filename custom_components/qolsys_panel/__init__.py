@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+from functools import partial
 import logging
+import shutil
 import ssl
 
 from qolsys_controller import qolsys_controller
@@ -17,21 +19,42 @@ from homeassistant.helpers import config_validation as cv, device_registry as dr
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
 from homeassistant.helpers.typing import ConfigType
 
+from .aggregator import StatisticsAggregator
 from .const import (
     CONF_RANDOM_MAC,
     DEFAULT_ARM_CODE_REQUIRED,
     DEFAULT_DISARM_CODE_REQUIRED,
+    DEFAULT_EVENT_JOURNAL,
+    DEFAULT_EXTERNAL_STATISTICS,
     DEFAULT_MOTION_SENSOR_DELAY,
     DEFAULT_MOTION_SENSOR_DELAY_ENABLED,
+    DEFAULT_OPTIMISTIC,
+    DEFAULT_SENSOR_DEADBAND_ENABLED,
+    DEFAULT_SENSOR_DEADBAND_MAX_INTERVAL,
+    DEFAULT_THROTTLE_FLAPPING,
     DOMAIN,
     OPTION_ARM_CODE,
     OPTION_DISARM_CODE,
+    OPTION_EVENT_JOURNAL,
+    OPTION_EXTERNAL_STATISTICS,
     OPTION_MOTION_SENSOR_DELAY,
     OPTION_MOTION_SENSOR_DELAY_ENABLED,
+    OPTION_OPTIMISTIC,
+    OPTION_SENSOR_DEADBAND_ENABLED,
+    OPTION_SENSOR_DEADBAND_MAX_INTERVAL,
+    OPTION_THROTTLE_FLAPPING,
 )
+from .feed import PanelFeed
+from .flapping import FlappingDetector
+from .journal import EventJournal, journal_directory
+from .recent_events import RecentEvents
+from .registry import PanelRegistry
+from .runtime import DATA_RUNTIME, QolsysPanelRuntime
 from .services import async_setup_services
 from .types import QolsysPanelConfigEntry
 from .utils import get_local_ip
+from .websocket_api import async_setup_websocket_api
+from .zone_index import ZoneIndex
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -76,8 +99,9 @@ def _setup_error(
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
-    """Set up Qolsys Panel services."""
+    """Set up Qolsys Panel services and WebSocket commands."""
     async_setup_services(hass)
+    async_setup_websocket_api(hass)
     return True
 
 
@@ -136,9 +160,60 @@ async def async_setup_entry(hass: HomeAssistant, entry: QolsysPanelConfigEntry)
         )
 
     entry.runtime_data = QolsysPanel
+    deadband_max_interval: int | None = None
+    if entry.options.get(
+        OPTION_SENSOR_DEADBAND_ENABLED, DEFAULT_SENSOR_DEADBAND_ENABLED
+    ):
+        deadband_max_interval = entry.options.get(
+            OPTION_SENSOR_DEADBAND_MAX_INTERVAL, DEFAULT_SENSOR_DEADBAND_MAX_INTERVAL
+        )
+    runtime = QolsysPanelRuntime(
+        optimistic=entry.options.get(OPTION_OPTIMISTIC, DEFAULT_OPTIMISTIC),
+        deadband_max_interval=deadband_max_interval,
+    )
+    hass.data.setdefault(DATA_RUNTIME, {})[entry.entry_id] = runtime
+    assert entry.unique_id is not None
+    # Started first, so that its tables are current when the other observers
+    # of an added object look it up.
+    runtime.registry = PanelRegistry(QolsysPanel, entry.unique_id)
+    runtime.registry.async_start()
+    entry.async_on_unload(runtime.registry.async_close)
+    runtime.events.async_start(QolsysPanel, entry.unique_id)
+    entry.async_on_unload(runtime.events.async_close)
+    runtime.feed = PanelFeed(QolsysPanel)
+    entry.async_on_unload(runtime.feed.async_close)
+    runtime.zones = ZoneIndex(QolsysPanel)
+    runtime.zones.async_start()
+    entry.async_on_unload(runtime.zones.async_close)
+    runtime.recent_events = RecentEvents(QolsysPanel)
+    runtime.recent_events.async_start(runtime.feed)
+    entry.async_on_unload(runtime.recent_events.async_close)
+    runtime.flapping = FlappingDetector(
+        hass,
+        entry.entry_id,
+        QolsysPanel,
+        throttle=entry.options.get(OPTION_THROTTLE_FLAPPING, DEFAULT_THROTTLE_FLAPPING),
+    )
+    runtime.flapping.async_start()
+    entry.async_on_unload(runtime.flapping.async_close)
+    if entry.options.get(OPTION_EXTERNAL_STATISTICS, DEFAULT_EXTERNAL_STATISTICS):
+        runtime.statistics = StatisticsAggregator(hass)
+        runtime.statistics.async_start()
+        entry.async_on_unload(runtime.statistics.async_close)
+    if entry.options.get(OPTION_EVENT_JOURNAL, DEFAULT_EVENT_JOURNAL):
+        journal = EventJournal(
+            hass, QolsysPanel, journal_directory(hass, entry.unique_id)
+        )
+        try:
+            await journal.async_start(runtime.feed)
+        except OSError as err:
+            _LOGGER.warning("Panel event journal disabled, cannot open it: %s", err)
+        else:
+            runtime.journal = journal
+            entry.async_on_unload(journal.async_close)
 
     # Log once when the connection to the panel is lost and once when it is
-    # restored.
+    # restored, and record the outage for diagnostics.
     was_connected = True
 
     def _check_connection() -> None:
@@ -146,8 +221,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: QolsysPanelConfigEntry)
         state = QolsysPanel.controller_state
         if was_connected and state == ControllerState.RECONNECTING:
             _LOGGER.info("Connection to Qolsys Panel lost, reconnecting")
+            runtime.connection.lost()
         elif not was_connected and state == ControllerState.CONNECTED:
             _LOGGER.info("Connection to Qolsys Panel restored")
+            runtime.connection.restored()
         was_connected = state == ControllerState.CONNECTED
 
     def _on_panel_status_update() -> None:
@@ -188,9 +265,24 @@ async def async_unload_entry(
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         QolsysPanel = entry.runtime_data
         await QolsysPanel.stop()
+        hass.data.get(DATA_RUNTIME, {}).pop(entry.entry_id, None)
     return unload_ok
 
 
+async def async_remove_entry(
+    hass: HomeAssistant, entry: QolsysPanelConfigEntry
+) -> None:
+    """Delete the event journal of a removed entry."""
+    if entry.unique_id is not None:
+        await hass.async_add_executor_job(
+            partial(
+                shutil.rmtree,
+                journal_directory(hass, entry.unique_id),
+                ignore_errors=True,
+            )
+        )
+
+
 async def async_migrate_entry(
     hass: HomeAssistant, config_entry: QolsysPanelConfigEntry
 ) -> bool:
@@ -0,0 +1,239 @@
+"""Aggregation of sensor values into recorder external statistics."""
+
+from __future__ import annotations
+
+from collections import deque
+from datetime import UTC, datetime
+import logging
+import math
+from typing import Any
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_utc_time_change
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds in a short bucket and in a published statistic period.
+BUCKET_SECONDS = 300
+HOUR_SECONDS = 3600
+
+# Closed hours kept for publishing while the recorder is not available.
+MAX_PENDING_HOURS = 24
+
+
+class Accumulator:
+    """Time weighted mean, minimum and maximum of a value over a period.
+
+    Accumulators of consecutive periods merge into the one of their union.
+    """
+
+    __slots__ = ("area", "duration", "end", "max", "min", "start")
+
+    def __init__(self, start: float, end: float) -> None:
+        """Set up an empty accumulator for the period from start to end."""
+        self.start = start
+        self.end = end
+        self.min = math.inf
+        self.max = -math.inf
+        self.area = 0.0
+        self.duration = 0.0
+
+    def hold(self, value: float, since: float, until: float) -> None:
+        """Account for a value held from since to until, within the period."""
+        since, until = max(since, self.start), min(until, self.end)
+        if until < since:
+            return
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.area += value * (until - since)
+        self.duration += until - since
+
+    def merge(self, other: Accumulator) -> None:
+        """Add the values of an accumulator of a period within this one."""
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.area += other.area
+        self.duration += other.duration
+
+    @property
+    def mean(self) -> float | None:
+        """Return the time weighted mean, None when no time was accounted."""
+        return self.area / self.duration if self.duration else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the period and its values for diagnostics."""
+        return {
+            "start": datetime.fromtimestamp(self.start, UTC).isoformat(),
+            "mean": None if (mean := self.mean) is None else round(mean, 3),
+            "min": None if math.isinf(self.min) else self.min,
+            "max": None if math.isinf(self.max) else self.max,
+        }
+
+
+class StatisticSeries:
+    """Values of one sensor, accumulated by 5 minute bucket and by hour.
+
+    A value is held until the next one, so each bucket gets the time
+    weighted mean of the values over its period. Closed buckets are folded
+    into their hour and the last hour of them is kept. A closed hour becomes
+    a statistic row waiting to be published.
+
+    With a sum, the row also has the last value as its state and the
+    increase of the value since the first sample as its sum. A value lower
+    than the previous one is taken as a meter reset.
+    """
+
+    def __init__(self, metadata: StatisticMetaData) -> None:
+        """Set up an empty series."""
+        self.metadata = metadata
+        self.has_sum = metadata["has_sum"]
+        self.recent: deque[Accumulator] = deque(maxlen=HOUR_SECONDS // BUCKET_SECONDS)
+        self.pending: deque[StatisticData] = deque(maxlen=MAX_PENDING_HOURS)
+        self._value: float | None = None
+        self._since = 0.0
+        self._bucket: Accumulator | None = None
+        self._hour: Accumulator | None = None
+        self._sum = 0.0
+
+    def add(self, now: float, value: float) -> None:
+        """Add a value notified at the given timestamp."""
+        self.advance(now)
+        if self.has_sum and self._value is not None:
+            self._sum += value - self._value if value >= self._value else value
+        self._value = value
+        self._since = now
+        self._bucket_at(now).hold(value, now, now)
+
+    def advance(self, now: float) -> None:
+        """Hold the current value until now, closing the periods that ended."""
+        if self._value is None:
+            return
+        while True:
+            bucket = self._bucket_at(self._since)
+            bucket.hold(self._value, self._since, now)
+            if now < bucket.end:
+                break
+            self._close_bucket(bucket)
+            self._since = bucket.end
+        self._since = now
+
+    def _bucket_at(self, timestamp: float) -> Accumulator:
+        """Return the open bucket, opening the one of the timestamp if none."""
+        if self._bucket is None:
+            start = timestamp - timestamp % BUCKET_SECONDS
+            self._bucket = Accumulator(start, start + BUCKET_SECONDS)
+        return self._bucket
+
+    def _close_bucket(self, bucket: Accumulator) -> None:
+        """Fold a closed bucket into its hour, closing the hour at its end."""
+        self._bucket = None
+        self.recent.append(bucket)
+        if self._hour is None:
+            start = bucket.start - bucket.start % HOUR_SECONDS
+            self._hour = Accumulator(start, start + HOUR_SECONDS)
+        self._hour.merge(bucket)
+        if bucket.end < self._hour.end:
+            return
+        hour, self._hour = self._hour, None
+        hour_start = datetime.fromtimestamp(hour.start, UTC)
+        if self.has_sum and self._value is not None:
+            self.pending.append(
+                StatisticData(start=hour_start, state=self._value, sum=self._sum)
+            )
+        elif (mean := hour.mean) is not None:
+            self.pending.append(
+                StatisticData(start=hour_start, mean=mean, min=hour.min, max=hour.max)
+            )
+
+
+class StatisticsAggregator:
+    """Hourly external statistics of the sensors of a config entry.
+
+    The values are accumulated in memory and the closed hours of every
+    series are published together, shortly after each hour. The recorder
+    keeps external statistics by hour only, so the 5 minute buckets stay in
+    memory, for diagnostics.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Set up an aggregator without series."""
+        self._hass = hass
+        self._series: dict[str, StatisticSeries] = {}
+        # Sum of the last published row of each sum series, read on first use.
+        self._sum_bases: dict[str, float] = {}
+        self._cancel_publish: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Publish the closed hours shortly after each hour."""
+        self._cancel_publish = async_track_utc_time_change(
+            self._hass, self._async_publish, minute=0, second=10
+        )
+
+    @callback
+    def async_close(self) -> None:
+        """Stop publishing."""
+        if self._cancel_publish is not None:
+            self._cancel_publish()
+            self._cancel_publish = None
+
+    def has_series(self, statistic_id: str) -> bool:
+        """Return whether a series is kept for the statistic."""
+        return statistic_id in self._series
+
+    @callback
+    def async_add_series(self, metadata: StatisticMetaData) -> None:
+        """Keep a series for the statistic of the metadata."""
+        self._series[metadata["statistic_id"]] = StatisticSeries(metadata)
+
+    @callback
+    def async_record(self, statistic_id: str, now: datetime, value: float) -> None:
+        """Add a value to the series of a statistic."""
+        self._series[statistic_id].add(now.timestamp(), value)
+
+    async def _async_publish(self, now: datetime) -> None:
+        """Close the periods that ended and publish the closed hours."""
+        timestamp = now.timestamp()
+        for series in self._series.values():
+            series.advance(timestamp)
+        if "recorder" not in self._hass.config.components:
+            return
+        for statistic_id, series in list(self._series.items()):
+            if not series.pending:
+                continue
+            rows = list(series.pending)
+            series.pending.clear()
+            if series.has_sum:
+                base = await self._async_sum_base(statistic_id)
+                for row in rows:
+                    row["sum"] = base + row.get("sum", 0.0)
+            _LOGGER.debug("Publishing %s hours of %s", len(rows), statistic_id)
+            async_add_external_statistics(self._hass, series.metadata, rows)
+
+    async def _async_sum_base(self, statistic_id: str) -> float:
+        """Return the sum published for a statistic before the entry was set up."""
+        if (base := self._sum_bases.get(statistic_id)) is None:
+            last = await get_instance(self._hass).async_add_executor_job(
+                get_last_statistics, self._hass, 1, statistic_id, False, {"sum"}
+            )
+            base = 0.0
+            if last:
+                base = last[statistic_id][0].get("sum") or 0.0
+            self._sum_bases[statistic_id] = base
+        return base
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the 5 minute buckets of each series for diagnostics."""
+        return {
+            statistic_id: {
+                "buckets": [bucket.as_dict() for bucket in series.recent],
+                "pending_hours": len(series.pending),
+            }
+            for statistic_id, series in sorted(self._series.items())
+        }
@@ -26,6 +26,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
+from .command import CommandPriority
 from .entity import QolsysPartitionEntity
 from .types import QolsysPanelConfigEntry
 
@@ -137,7 +138,11 @@ class PartitionAlarmControlPanel(QolsysPartitionEntity, AlarmControlPanelEntity)
     async def async_alarm_disarm(self, code: str | None = None) -> None:
         """Disarm this panel."""
         try:
-            await self._partition.disarm(user_code=code or "")
+            await self._async_run_command(
+                "disarm",
+                lambda: self._partition.disarm(user_code=code or ""),
+                CommandPriority.SECURITY,
+            )
         except QolsysUserCodeError as err:
             raise HomeAssistantError("DISARM: Invalid user code") from err
         except QolsysOperationTimeoutError as err:
@@ -161,9 +166,24 @@ class PartitionAlarmControlPanel(QolsysPartitionEntity, AlarmControlPanelEntity)
     async def _async_alarm_arm_custom(
         self, arm_mode: PartitionArmingType, code: str | None = None
     ) -> None:
-        """Arm with custom mode."""
+        """Arm with custom mode, see QolsysPanelRuntime.async_arm."""
+        if (runtime := self._runtime) is None:
+            await self._async_arm(arm_mode, code)
+            return
+        await runtime.async_arm(
+            self._partition_id, arm_mode, lambda: self._async_arm(arm_mode, code)
+        )
+
+    async def _async_arm(
+        self, arm_mode: PartitionArmingType, code: str | None = None
+    ) -> None:
+        """Send an arming command."""
         try:
-            await self._partition.arm(arm_mode, user_code=code or "")
+            await self._async_run_command(
+                "arm",
+                lambda: self._partition.arm(arm_mode, user_code=code or ""),
+                CommandPriority.SECURITY,
+            )
         except QolsysUserCodeError as err:
             raise HomeAssistantError(f"{arm_mode.name}: Invalid user code") from err
         except QolsysOperationTimeoutError as err:
@@ -35,6 +35,8 @@ from .entity import (
     QolsysPartitionEntity,
     QolsysZoneEntity,
 )
+from .runtime import async_get_runtime
+from .zone_index import OPEN_ZONE_STATUSES, ZoneIndex, zone_sort_key
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -113,6 +115,7 @@ async def async_setup_entry(
     QolsysPanel = config_entry.runtime_data
     unique_id = config_entry.unique_id
     assert unique_id is not None
+    runtime = async_get_runtime(hass, config_entry.entry_id)
 
     # Add Doorbell Binary Sensor
     entities.append(QolsysDoorbellSensor(hass, QolsysPanel, unique_id))
@@ -149,6 +152,14 @@ async def async_setup_entry(
         entities.append(PartitionEntryDelaySensor(QolsysPanel, partition.id, unique_id))
         entities.append(PartitionQuickExitSensor(QolsysPanel, partition.id, unique_id))
 
+        # Add Partition Ready To Arm Binary Sensor
+        if runtime is not None and runtime.zones is not None:
+            entities.append(
+                PartitionReadySensor(
+                    QolsysPanel, partition.id, unique_id, runtime.zones
+                )
+            )
+
     # Add Automation Device Status Sensors
     for device in QolsysPanel.state.automation_devices:
         for service in device.service_get_protocol(StatusService):  # type: ignore[type-abstract]
@@ -206,6 +217,8 @@ class PartitionQuickExitSensor(QolsysPartitionEntity, BinarySensorEntity):
     """A binary sensor entity for a partition quick exit window."""
 
     _attr_device_class = BinarySensorDeviceClass.RUNNING
+    # The countdown timing changes with every window.
+    _unrecorded_attributes = frozenset({"delay", "start_time"})
 
     def __init__(
         self, QolsysPanel: qolsys_controller, partition_id: str, unique_id: str
@@ -230,6 +243,61 @@ class PartitionQuickExitSensor(QolsysPartitionEntity, BinarySensorEntity):
         }
 
 
+class PartitionReadySensor(QolsysPartitionEntity, BinarySensorEntity):
+    """A binary sensor entity showing whether a partition is ready to arm."""
+
+    _unrecorded_attributes = frozenset({"blocking_zones"})
+
+    def __init__(
+        self,
+        QolsysPanel: qolsys_controller,
+        partition_id: str,
+        unique_id: str,
+        zones: ZoneIndex,
+    ) -> None:
+        """Set up a binary sensor entity for partition readiness."""
+        super().__init__(QolsysPanel, partition_id, unique_id)
+        self._zones = zones
+        self._attr_unique_id = f"{self._partition_unique_id}_ready"
+        self._attr_translation_key = "partition_ready"
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the not ready zones of the partition and auto bypass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._zones.async_listen_summary(
+                self._partition_id, self.async_write_ha_state
+            )
+        )
+        self._subscribe(
+            self.QolsysPanel.state,
+            QolsysNotification.PANEL_SETTINGS_UPDATE,
+            self.schedule_update_ha_state,
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop observing changes."""
+        await super().async_will_remove_from_hass()
+        self._unsubscribe(
+            self.QolsysPanel.state,
+            QolsysNotification.PANEL_SETTINGS_UPDATE,
+            self.schedule_update_ha_state,
+        )
+
+    @property
+    def is_on(self) -> bool:
+        """Return if no zone keeps this partition from arming."""
+        return not self._zones.blocking_zones(self._partition_id)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the names of the zones keeping the partition from arming."""
+        blocking = self._zones.blocking_zones(self._partition_id)
+        return {
+            "blocking_zones": [blocking[i] for i in sorted(blocking, key=zone_sort_key)]
+        }
+
+
 class PartitionAlarmSensor(QolsysPartitionEntity, BinarySensorEntity):
     """A binary sensor entity showing partition alarm."""
 
@@ -421,6 +489,7 @@ class ZonesSensor(QolsysZoneEntity, BinarySensorEntity):
     """A binary sensor entity for a zone in a Qolsys Panel."""
 
     _attr_name = None
+    _unrecorded_attributes = frozenset({"event_rate"})
 
     def __init__(
         self, QolsysPanel: qolsys_controller, zone_id: str, unique_id: str
@@ -432,16 +501,21 @@ class ZonesSensor(QolsysZoneEntity, BinarySensorEntity):
     @property
     def is_on(self) -> bool:
         """Return if this zone is on."""
-        if self._zone.sensorstatus in {
-            ZoneStatus.OPEN,
-            ZoneStatus.ALARMED,
-            ZoneStatus.ACTIVATED,
-            ZoneStatus.DISCONNECTED,
-            ZoneStatus.INACTIVE,
-        }:
-            return True
+        return self._zone.sensorstatus in OPEN_ZONE_STATUSES
 
-        return False
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the updates of the zone in the last minute, while flapping.
+
+        The rate changes on every update, so it is left out while the zone
+        is quiet to keep it from writing a state of its own.
+        """
+        runtime = self._runtime
+        if runtime is None or runtime.flapping is None:
+            return None
+        if not runtime.flapping.is_flapping(self._zone_id):
+            return None
+        return {"event_rate": runtime.flapping.event_rate(self._zone_id)}
 
     @property
     def device_class(self) -> BinarySensorDeviceClass | None:
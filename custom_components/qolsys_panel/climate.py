@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -13,6 +14,7 @@ from qolsys_controller.enum_qolsys import (
     QolsysTemperatureUnit,
 )
 
+from custom_components.qolsys_panel.command import CommandCoalescer
 from custom_components.qolsys_panel.entity import QolsysAutomationDeviceEntity
 from homeassistant.components.climate import ClimateEntity, ClimateEntityFeature
 from homeassistant.components.climate.const import (
@@ -73,6 +75,7 @@ class AutomationDevice_Climate(QolsysAutomationDeviceEntity, ClimateEntity):
         self._service: ThermostatService = service
         self._attr_name = f"Thermostat{'' if endpoint == 0 else endpoint} - {self._service.automation_device.device_name}"
         self._attr_target_temperature_step = self._service.target_temperature_step
+        self._setpoint_coalescer = CommandCoalescer()
 
         self._attr_supported_features = ClimateEntityFeature(0)
         if self._service.supports_target_temperature():
@@ -167,22 +170,44 @@ class AutomationDevice_Climate(QolsysAutomationDeviceEntity, ClimateEntity):
         return self._service.max_temp
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
-        await self._service.set_hvac_mode(QolsysHvacMode(hvac_mode))
+        await self._async_send_command(
+            "climate.set_hvac_mode",
+            lambda: self._service.set_hvac_mode(QolsysHvacMode(hvac_mode)),
+        )
 
     async def async_turn_off(self) -> None:
-        await self._service.turn_off()
+        await self._async_send_command("climate.turn_off", self._service.turn_off)
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
-        await self._service.set_fan_mode(QolsysFanMode(fan_mode))
+        await self._async_send_command(
+            "climate.set_fan_mode",
+            lambda: self._service.set_fan_mode(QolsysFanMode(fan_mode)),
+        )
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
+        setpoints: list[tuple[float, QolsysHvacMode]] = []
+
         if value := kwargs.get(ATTR_TARGET_TEMP_HIGH):
-            await self._service.set_temperature(value, QolsysHvacMode.COOL)
+            setpoints.append((value, QolsysHvacMode.COOL))
 
         if value := kwargs.get(ATTR_TARGET_TEMP_LOW):
-            await self._service.set_temperature(value, QolsysHvacMode.HEAT)
+            setpoints.append((value, QolsysHvacMode.HEAT))
 
         if value := kwargs.get(ATTR_TEMPERATURE):
             hvac_mode = self._service.hvac_mode
             if hvac_mode is not None:
-                await self._service.set_temperature(value, hvac_mode)
+                setpoints.append((value, hvac_mode))
+
+        if not setpoints:
+            return
+
+        # High and low setpoints are one target: send them together and let a
+        # newer target replace them while a previous one is still in flight.
+        async def _send() -> None:
+            await asyncio.gather(
+                *(self._service.set_temperature(temp, mode) for temp, mode in setpoints)
+            )
+
+        await self._async_send_command(
+            "climate.set_temperature", _send, coalescer=self._setpoint_coalescer
+        )
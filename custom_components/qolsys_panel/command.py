@@ -0,0 +1,263 @@
+"""Command helpers for the Qolsys Panel integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from enum import IntEnum
+import time
+from typing import Any
+
+from qolsys_controller.errors import QolsysOperationTimeoutError
+
+from .utils import RollingStats
+
+
+class CommandPriority(IntEnum):
+    """Priority classes for commands sent to the panel, highest first."""
+
+    SECURITY = 0
+    INTERACTIVE = 1
+    BACKGROUND = 2
+
+
+# Priority of the commands sent from the current task. Bulk services lower it
+# to BACKGROUND so their traffic yields to user and security commands.
+COMMAND_PRIORITY: ContextVar[CommandPriority] = ContextVar(
+    "qolsys_panel_command_priority", default=CommandPriority.INTERACTIVE
+)
+
+# Commands each priority class may have in flight at the same time.
+DEFAULT_PRIORITY_LIMITS: dict[CommandPriority, int] = {
+    CommandPriority.SECURITY: 2,
+    CommandPriority.INTERACTIVE: 4,
+    CommandPriority.BACKGROUND: 2,
+}
+
+
+# Seconds the controller waits for the panel to answer a command.
+CONTROLLER_COMMAND_TIMEOUT = 30.0
+
+# Lowest deadline of the command types the panel may take long to carry out:
+# cancelling them early reports a failure while the panel goes on.
+DEFAULT_DEADLINE_FLOORS: dict[str, float] = {
+    "arm": CONTROLLER_COMMAND_TIMEOUT,
+    "disarm": CONTROLLER_COMMAND_TIMEOUT,
+}
+
+
+class CommandCoalescer:
+    """Send one command at a time to a device, keeping only the latest target.
+
+    Used for continuous controls (brightness, cover position, setpoints) where a
+    slider produces a stream of values. While a command is in flight, a newer
+    request replaces the pending one; the replaced caller returns without
+    sending. The pending command is sent as soon as the in-flight one finishes.
+    """
+
+    def __init__(self) -> None:
+        """Set up an idle coalescer."""
+        self._busy = False
+        self._next: asyncio.Future[bool] | None = None
+
+    async def async_send(self, command: Callable[[], Awaitable[Any]]) -> bool:
+        """Send the command, or queue it behind the in-flight one.
+
+        Returns False if a newer command superseded this one before it was sent.
+        """
+        if self._busy:
+            if self._next is not None and not self._next.done():
+                self._next.set_result(False)
+            self._next = turn = asyncio.get_running_loop().create_future()
+            try:
+                if not await turn:
+                    return False
+            except asyncio.CancelledError:
+                if turn.done() and not turn.cancelled() and turn.result():
+                    # Our turn was handed over just as we were cancelled.
+                    self._release()
+                elif self._next is turn:
+                    self._next = None
+                raise
+        else:
+            self._busy = True
+
+        try:
+            await command()
+        finally:
+            self._release()
+        return True
+
+    def _release(self) -> None:
+        """Hand the device to the pending command, or go idle.
+
+        A pending command cancelled before its caller could clear it is
+        skipped.
+        """
+        turn, self._next = self._next, None
+        if turn is not None and not turn.done():
+            turn.set_result(True)
+        else:
+            self._busy = False
+
+
+class CommandScheduler:
+    """Admit commands to the panel by priority class.
+
+    Each class has its own in-flight limit, so security commands never wait
+    for automation traffic. A class only starts new commands while no higher
+    class has commands queued.
+    """
+
+    def __init__(self, limits: dict[CommandPriority, int] | None = None) -> None:
+        """Set up the scheduler with per-class in-flight limits."""
+        self._limits = dict(DEFAULT_PRIORITY_LIMITS if limits is None else limits)
+        self._in_flight = dict.fromkeys(CommandPriority, 0)
+        self._queues: dict[CommandPriority, deque[asyncio.Future[None]]] = {
+            priority: deque() for priority in CommandPriority
+        }
+        self._max_queue_depth = dict.fromkeys(CommandPriority, 0)
+        self._wait_time = {priority: RollingStats() for priority in CommandPriority}
+
+    def _can_start(self, priority: CommandPriority) -> bool:
+        """Return whether a command of this class may start now."""
+        if (
+            self._queues[priority]
+            or self._in_flight[priority] >= self._limits[priority]
+        ):
+            return False
+        return not any(self._queues[p] for p in CommandPriority if p < priority)
+
+    async def async_run[T](
+        self, priority: CommandPriority, command: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Run the command once its priority class has a free slot."""
+        start = time.monotonic()
+        if self._can_start(priority):
+            self._in_flight[priority] += 1
+        else:
+            queue = self._queues[priority]
+            queue.append(turn := asyncio.get_running_loop().create_future())
+            self._max_queue_depth[priority] = max(
+                self._max_queue_depth[priority], len(queue)
+            )
+            try:
+                await turn
+            except asyncio.CancelledError:
+                if turn.done() and not turn.cancelled():
+                    # The slot was granted just as we were cancelled.
+                    self._in_flight[priority] -= 1
+                elif turn in queue:
+                    queue.remove(turn)
+                self._wake()
+                raise
+        self._wait_time[priority].add(time.monotonic() - start)
+
+        try:
+            return await command()
+        finally:
+            self._in_flight[priority] -= 1
+            self._wake()
+
+    def _wake(self) -> None:
+        """Grant free slots to queued commands, highest class first."""
+        for priority in CommandPriority:
+            queue = self._queues[priority]
+            while queue and self._in_flight[priority] < self._limits[priority]:
+                turn = queue.popleft()
+                if turn.done():
+                    continue
+                self._in_flight[priority] += 1
+                turn.set_result(None)
+            if queue:
+                # Lower classes wait until this class has drained its queue.
+                return
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return queue metrics per priority class for diagnostics."""
+        return {
+            priority.name.lower(): {
+                "limit": self._limits[priority],
+                "in_flight": self._in_flight[priority],
+                "queue_depth": len(self._queues[priority]),
+                "max_queue_depth": self._max_queue_depth[priority],
+                "wait_time": self._wait_time[priority].as_dict(),
+            }
+            for priority in CommandPriority
+        }
+
+
+class CommandDeadlines:
+    """Per command type deadlines derived from observed round-trip times.
+
+    Each command gets a deadline of a multiple of the 95th percentile of the
+    recent round-trip times of its type, clamped to a range. Until enough
+    samples are collected, the maximum is used. A command that times out adds
+    the time it waited as a sample, so that the deadline grows again when the
+    panel slows down. A command type may have a floor of its own.
+    """
+
+    def __init__(
+        self,
+        *,
+        factor: float = 4.0,
+        minimum: float = 5.0,
+        maximum: float = 30.0,
+        min_samples: int = 5,
+        floors: dict[str, float] | None = None,
+    ) -> None:
+        """Set up the deadline policy."""
+        self._floors = dict(DEFAULT_DEADLINE_FLOORS if floors is None else floors)
+        self._factor = factor
+        self._minimum = minimum
+        self._maximum = maximum
+        self._min_samples = min_samples
+        self._rtt: dict[str, RollingStats] = {}
+        self._timeouts: dict[str, int] = {}
+
+    def deadline(self, command_type: str) -> float:
+        """Return the deadline in seconds for the next command of this type."""
+        floor = self._floors.get(command_type, 0.0)
+        minimum = max(self._minimum, floor)
+        maximum = max(self._maximum, floor)
+        stats = self._rtt.get(command_type)
+        if stats is None or stats.count < self._min_samples:
+            return maximum
+        p95 = stats.percentile(95) or 0.0
+        return min(max(p95 * self._factor, minimum), maximum)
+
+    async def async_run[T](
+        self, command_type: str, command: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Run the command, cancelling it if it misses its deadline.
+
+        Raises:
+            QolsysOperationTimeoutError: The panel did not answer in time.
+        """
+        start = time.monotonic()
+        stats = self._rtt.setdefault(command_type, RollingStats())
+        try:
+            async with asyncio.timeout(self.deadline(command_type)):
+                result = await command()
+        except (TimeoutError, QolsysOperationTimeoutError) as err:
+            self._timeouts[command_type] = self._timeouts.get(command_type, 0) + 1
+            # The round trip lasted at least this long.
+            stats.add(time.monotonic() - start)
+            if isinstance(err, QolsysOperationTimeoutError):
+                raise
+            raise QolsysOperationTimeoutError(command_type) from err
+        stats.add(time.monotonic() - start)
+        return result
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return round-trip statistics per command type for diagnostics."""
+        return {
+            command_type: {
+                **self._rtt.get(command_type, RollingStats()).as_dict(),
+                "deadline_s": round(self.deadline(command_type), 1),
+                "timeouts": self._timeouts.get(command_type, 0),
+            }
+            for command_type in sorted(self._rtt)
+        }
@@ -36,33 +36,37 @@ from .const import (
     CONFIG_DIR,
     DEFAULT_ARM_CODE_REQUIRED,
     DEFAULT_DISARM_CODE_REQUIRED,
+    DEFAULT_EVENT_JOURNAL,
+    DEFAULT_EXTERNAL_STATISTICS,
     DEFAULT_MOTION_SENSOR_DELAY,
     DEFAULT_MOTION_SENSOR_DELAY_ENABLED,
+    DEFAULT_OPTIMISTIC,
+    DEFAULT_SENSOR_DEADBAND_ENABLED,
+    DEFAULT_SENSOR_DEADBAND_MAX_INTERVAL,
+    DEFAULT_THROTTLE_FLAPPING,
     DEFAULT_TRIGGER_AUXILLIARY,
     DEFAULT_TRIGGER_FIRE,
     DEFAULT_TRIGGER_POLICE,
     DOMAIN,
     OPTION_ARM_CODE,
     OPTION_DISARM_CODE,
+    OPTION_EVENT_JOURNAL,
+    OPTION_EXTERNAL_STATISTICS,
     OPTION_MOTION_SENSOR_DELAY,
     OPTION_MOTION_SENSOR_DELAY_ENABLED,
+    OPTION_OPTIMISTIC,
+    OPTION_SENSOR_DEADBAND_ENABLED,
+    OPTION_SENSOR_DEADBAND_MAX_INTERVAL,
+    OPTION_THROTTLE_FLAPPING,
     OPTION_TRIGGER_AUXILLIARY,
     OPTION_TRIGGER_FIRE,
     OPTION_TRIGGER_POLICE,
 )
+from .debug import DEBUG_LOGGING, FLOW_LOGGERS
 from .types import QolsysPanelConfigEntry
 from .utils import get_local_ip
 
 _LOGGER = logging.getLogger(__name__)
-_LOGGER.setLevel(logging.DEBUG)
-
-# Force the qolsys_controller logger to DEBUG during config flow
-_qolsys_controller_logger = logging.getLogger("qolsys_controller")
-getattr(
-    _qolsys_controller_logger,
-    "orig_setLevel",
-    _qolsys_controller_logger.setLevel,
-)(logging.DEBUG)
 
 
 # Format of PKI directories is a 12-character hex string (MAC address without colons).
@@ -94,6 +98,15 @@ class QolsysPanelConfigFlow(ConfigFlow, domain=DOMAIN):
         self._pairing_task: asyncio.Task[dict[str, str]] | None = None
         self._plugin_ip: str = ""
         self._pairing_port: int = 0
+        # Whether the flow holds its loggers at DEBUG, see _try_connect.
+        self._debug_logging = False
+
+    @callback
+    def async_remove(self) -> None:
+        """Restore the log levels once the flow is over."""
+        if self._debug_logging:
+            self._debug_logging = False
+            DEBUG_LOGGING.release(FLOW_LOGGERS)
 
     @staticmethod
     @callback
@@ -481,6 +494,11 @@ class QolsysPanelConfigFlow(ConfigFlow, domain=DOMAIN):
         resume_pairing: bool = False,
         start_pairing: bool = False,
     ) -> dict[str, str]:
+        # Pairing and connection problems are diagnosed from the controller
+        # debug logs: keep them until the flow is over.
+        if not self._debug_logging:
+            self._debug_logging = True
+            DEBUG_LOGGING.acquire(FLOW_LOGGERS)
         self._error_placeholders = {}
         self._QolsysPanel.settings.config_directory = str(
             self._config_directory.resolve()
@@ -630,6 +648,40 @@ class QolsysPanelOptionsFlowHandler(OptionsFlowWithReload):
                         DEFAULT_MOTION_SENSOR_DELAY,
                     ),
                 ): int,
+                vol.Required(
+                    OPTION_OPTIMISTIC,
+                    default=options.get(OPTION_OPTIMISTIC, DEFAULT_OPTIMISTIC),
+                ): bool,
+                vol.Required(
+                    OPTION_THROTTLE_FLAPPING,
+                    default=options.get(
+                        OPTION_THROTTLE_FLAPPING, DEFAULT_THROTTLE_FLAPPING
+                    ),
+                ): bool,
+                vol.Required(
+                    OPTION_SENSOR_DEADBAND_ENABLED,
+                    default=options.get(
+                        OPTION_SENSOR_DEADBAND_ENABLED,
+                        DEFAULT_SENSOR_DEADBAND_ENABLED,
+                    ),
+                ): bool,
+                vol.Required(
+                    OPTION_SENSOR_DEADBAND_MAX_INTERVAL,
+                    default=options.get(
+                        OPTION_SENSOR_DEADBAND_MAX_INTERVAL,
+                        DEFAULT_SENSOR_DEADBAND_MAX_INTERVAL,
+                    ),
+                ): int,
+                vol.Required(
+                    OPTION_EXTERNAL_STATISTICS,
+                    default=options.get(
+                        OPTION_EXTERNAL_STATISTICS, DEFAULT_EXTERNAL_STATISTICS
+                    ),
+                ): bool,
+                vol.Required(
+                    OPTION_EVENT_JOURNAL,
+                    default=options.get(OPTION_EVENT_JOURNAL, DEFAULT_EVENT_JOURNAL),
+                ): bool,
             },
             extra=vol.PREVENT_EXTRA,
         )
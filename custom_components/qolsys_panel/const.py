@@ -13,13 +13,28 @@ OPTION_TRIGGER_AUXILLIARY = "option_trigger_auxilliary"
 OPTION_TRIGGER_FIRE = "option_trigger_fire"
 OPTION_ARM_CODE = "option_arm_code"
 OPTION_DISARM_CODE = "option_disarm_code"
+OPTION_OPTIMISTIC = "option_optimistic"
+OPTION_THROTTLE_FLAPPING = "option_throttle_flapping"
+OPTION_SENSOR_DEADBAND_ENABLED = "option_sensor_deadband_enabled"
+OPTION_SENSOR_DEADBAND_MAX_INTERVAL = "option_sensor_deadband_max_interval"
+OPTION_EXTERNAL_STATISTICS = "option_external_statistics"
+OPTION_EVENT_JOURNAL = "option_event_journal"
 
 SERVICE_TRIGGER_POLICE = "trigger_police"
 SERVICE_TRIGGER_AUXILLIARY = "trigger_auxilliary"
 SERVICE_TRIGGER_FIRE = "trigger_fire"
 SERVICE_QUICK_EXIT = "quick_exit"
+SERVICE_BULK_COMMAND = "bulk_command"
+SERVICE_BYPASS_ZONES = "bypass_zones"
+SERVICE_ARM_PARTITIONS = "arm_partitions"
+SERVICE_DISARM_PARTITIONS = "disarm_partitions"
+SERVICE_QUERY_ZONES = "query_zones"
+SERVICE_FLEET_REPORT = "fleet_report"
+SERVICE_RECENT_EVENTS = "recent_events"
+SERVICE_DEBUG_WINDOW = "debug_window"
 
 DEFAULT_QUICK_EXIT_DURATION = 120
+DEFAULT_BULK_MAX_CONCURRENCY = 4
 
 DEFAULT_ARM_CODE_REQUIRED = False
 DEFAULT_DISARM_CODE_REQUIRED = False
@@ -28,3 +43,25 @@ DEFAULT_TRIGGER_AUXILLIARY = False
 DEFAULT_TRIGGER_FIRE = False
 DEFAULT_MOTION_SENSOR_DELAY_ENABLED = False
 DEFAULT_MOTION_SENSOR_DELAY = 310
+DEFAULT_OPTIMISTIC = False
+# Seconds to wait for the panel to confirm an optimistic state before rolling back.
+DEFAULT_OPTIMISTIC_TIMEOUT = 10
+DEFAULT_THROTTLE_FLAPPING = False
+DEFAULT_SENSOR_DEADBAND_ENABLED = False
+# Seconds after which a value held back by a deadband is written anyway.
+DEFAULT_SENSOR_DEADBAND_MAX_INTERVAL = 900
+DEFAULT_EXTERNAL_STATISTICS = False
+DEFAULT_EVENT_JOURNAL = False
+
+# Deadbands of the numeric sensors by kind, as (absolute, relative to the last
+# written value). A state is written once the value moves by either; 0 turns
+# one off.
+SENSOR_DEADBANDS: dict[str, tuple[float, float]] = {
+    "signal_strength": (3.0, 0.0),
+    "temperature": (0.5, 0.0),
+    "humidity": (2.0, 0.0),
+    "battery_voltage": (0.05, 0.0),
+    "power": (5.0, 0.05),
+    "voltage": (1.0, 0.01),
+    "current": (0.1, 0.05),
+}
@@ -17,6 +17,7 @@ from homeassistant.components.cover import (
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
+from .command import CommandCoalescer
 from .entity import QolsysAutomationDeviceEntity
 from .types import QolsysPanelConfigEntry
 
@@ -68,6 +69,7 @@ class AutomationDevice_Cover(QolsysAutomationDeviceEntity, CoverEntity):
         assert cover is not None
         self._cover: CoverService = cover
         self._attr_name = f"GarageDoor{'' if endpoint == 0 else endpoint} - {self._cover.automation_device.device_name}"
+        self._position_coalescer = CommandCoalescer()
 
         self._attr_supported_features = CoverEntityFeature(0)
         if self._cover.supports_open():
@@ -83,15 +85,19 @@ class AutomationDevice_Cover(QolsysAutomationDeviceEntity, CoverEntity):
             self._attr_supported_features |= CoverEntityFeature.SET_POSITION
 
     async def async_open_cover(self, **kwargs: Any) -> None:
-        await self._cover.open()
+        await self._async_send_command("cover.open", self._cover.open)
 
     async def async_close_cover(self, **kwargs: Any) -> None:
-        await self._cover.close()
+        await self._async_send_command("cover.close", self._cover.close)
 
     async def async_set_cover_position(self, **kwargs: Any) -> None:
         position = kwargs.get(ATTR_POSITION)
         if position is not None:
-            await self._cover.set_current_position(position)
+            await self._async_send_command(
+                "cover.set_position",
+                lambda: self._cover.set_current_position(position),
+                coalescer=self._position_coalescer,
+            )
 
     @property
     def is_closed(self) -> bool | None:
@@ -0,0 +1,105 @@
+"""Debug logging limited to config flows and debug windows."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+import logging
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+CONTROLLER_LOGGER = "qolsys_controller"
+
+# Loggers at DEBUG while a config flow talks to the panel.
+FLOW_LOGGERS = (CONTROLLER_LOGGER, f"custom_components.{DOMAIN}.config_flow")
+
+
+def _set_level(logger: logging.Logger, level: int) -> None:
+    """Set the level of a logger, even one the logger integration overrides."""
+    getattr(logger, "orig_setLevel", logger.setLevel)(level)
+
+
+class ScopedDebugLogging:
+    """Loggers held at DEBUG, restored to their level once no longer held.
+
+    Flows and debug windows overlap, so each logger is held by count: the
+    first hold saves its level and the last release restores it.
+    """
+
+    def __init__(self) -> None:
+        """Set up without held loggers."""
+        self._holds: dict[str, int] = {}
+        self._levels: dict[str, int] = {}
+
+    def acquire(self, names: Iterable[str]) -> None:
+        """Hold loggers at DEBUG."""
+        for name in names:
+            if not self._holds.get(name):
+                logger = logging.getLogger(name)
+                self._levels[name] = logger.level
+                _set_level(logger, logging.DEBUG)
+            self._holds[name] = self._holds.get(name, 0) + 1
+
+    def release(self, names: Iterable[str]) -> None:
+        """Release loggers, restoring the level of those no longer held."""
+        for name in names:
+            if not self._holds.get(name):
+                continue
+            self._holds[name] -= 1
+            if not self._holds[name]:
+                del self._holds[name]
+                _set_level(logging.getLogger(name), self._levels.pop(name))
+
+
+DEBUG_LOGGING = ScopedDebugLogging()
+
+DATA_DEBUG_WINDOW: HassKey[DebugWindow] = HassKey(f"{DOMAIN}_debug_window")
+
+
+class DebugWindow:
+    """Controller debug logs for a limited time.
+
+    The records go to the queue handler Home Assistant installs on the root
+    logger, so they are formatted and written off the event loop. Opening
+    an open window moves its end.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Set up a closed window."""
+        self._hass = hass
+        self._cancel_close: CALLBACK_TYPE | None = None
+        self.until: datetime | None = None
+
+    @callback
+    def async_open(self, duration: timedelta) -> datetime:
+        """Log controller debug records for the duration, return its end."""
+        if self._cancel_close is None:
+            DEBUG_LOGGING.acquire((CONTROLLER_LOGGER,))
+        else:
+            self._cancel_close()
+        self._cancel_close = async_call_later(self._hass, duration, self._async_close)
+        self.until = dt_util.utcnow() + duration
+        return self.until
+
+    @callback
+    def _async_close(self, now: Any = None) -> None:
+        """Restore the level of the controller logs."""
+        if self._cancel_close is not None:
+            self._cancel_close()
+            self._cancel_close = None
+            self.until = None
+            DEBUG_LOGGING.release((CONTROLLER_LOGGER,))
+
+
+@callback
+def async_open_debug_window(hass: HomeAssistant, duration: timedelta) -> datetime:
+    """Open the controller debug window of Home Assistant, return its end."""
+    if (window := hass.data.get(DATA_DEBUG_WINDOW)) is None:
+        window = hass.data[DATA_DEBUG_WINDOW] = DebugWindow(hass)
+    return window.async_open(duration)
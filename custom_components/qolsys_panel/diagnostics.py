@@ -1,12 +1,24 @@
 """Diagnostics for Qolsys Panel."""
 
+import asyncio
+from collections.abc import Iterable, Mapping
+from datetime import timedelta
 from typing import Any
 
-from homeassistant.components.diagnostics import async_redact_data
+from qolsys_controller import qolsys_controller
+from qolsys_controller.partition import QolsysPartition
+
+from homeassistant.components.diagnostics import REDACTED
 from homeassistant.const import CONF_HOST, CONF_MAC
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.device_registry import DeviceEntry
+from homeassistant.util import dt as dt_util
 
-from .const import CONF_IMEI, CONF_RANDOM_MAC
+from .const import CONF_IMEI, CONF_RANDOM_MAC, DOMAIN
+from .journal import EventJournal
+from .registry import panel_lookup
+from .runtime import async_get_runtime
 from .types import QolsysPanelConfigEntry
 
 TO_REDACT = [
@@ -18,6 +30,137 @@ TO_REDACT = [
     "sensorname",
 ]
 
+# Payload keys holding lists of flat records, such as zone.to_dict() results.
+RECORD_LISTS = (
+    "partitions",
+    "zones",
+    "automation_devices",
+    "adc_devices",
+    "events",
+)
+
+# Records copied per event loop iteration before yielding to other tasks.
+SNAPSHOT_CHUNK_SIZE = 100
+
+# Period of the event journal entries in the config entry diagnostics.
+JOURNAL_PERIOD = timedelta(hours=24)
+
+
+async def _async_snapshot(records: Iterable[Any]) -> list[Any]:
+    """Copy controller records in chunks, yielding to the loop between chunks."""
+    snapshot: list[Any] = []
+    # Copy the references first: the controller may change its lists while we yield.
+    for index, record in enumerate(list(records), 1):
+        snapshot.append(record.to_dict())
+        if index % SNAPSHOT_CHUNK_SIZE == 0:
+            await asyncio.sleep(0)
+    return snapshot
+
+
+class DiagnosticsRedactor:
+    """Redactor compiled from the shape of the diagnostics payload.
+
+    Gives the same result as async_redact_data for payloads of this shape, but
+    only looks up the sensitive keys instead of walking and copying every
+    value. The payload and its records are flat mappings, so a record without
+    sensitive values is returned as is rather than copied.
+    """
+
+    def __init__(self, to_redact: Iterable[str], record_lists: Iterable[str]) -> None:
+        """Compile the redactor for the given keys and record lists."""
+        self._keys = tuple(dict.fromkeys(to_redact))
+        self._record_lists = tuple(record_lists)
+
+    def redact_record(self, record: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Redact the sensitive keys of a flat record."""
+        hits = [key for key in self._keys if record.get(key) not in (None, "")]
+        if not hits:
+            return record
+        return {**record, **dict.fromkeys(hits, REDACTED)}
+
+    def __call__(self, data: Mapping[str, Any]) -> dict[str, Any]:
+        """Redact a payload and its lists of records."""
+        redacted = dict(self.redact_record(data))
+        for key in self._record_lists:
+            if records := redacted.get(key):
+                redacted[key] = [self.redact_record(record) for record in records]
+        return redacted
+
+
+redact_diagnostics = DiagnosticsRedactor(TO_REDACT, RECORD_LISTS)
+
+
+def _panel_snapshot(QolsysPanel: qolsys_controller) -> dict[str, Any]:
+    """Return the panel settings."""
+    return {
+        "hardware_version": QolsysPanel.panel.HARDWARE_VERSION,
+        "panel_tamper_state": QolsysPanel.panel.PANEL_TAMPER_STATE,
+        "ac_status": QolsysPanel.panel.AC_STATUS,
+        "battery_status": QolsysPanel.panel.BATTERY_STATUS,
+        "fail_to_communicate": QolsysPanel.panel.FAIL_TO_COMMUNICATE,
+        "language": QolsysPanel.panel.LANGUAGE,
+        "temp_format": QolsysPanel.panel.TEMPFORMAT,
+        "zwave_firmware_version": QolsysPanel.panel.ZWAVE_FIRM_WARE_VERSION,
+        "zwave_card_present": QolsysPanel.panel.ZWAVE_CARD,
+        "zwave_controller_enabled": QolsysPanel.panel.ZWAVE_CONTROLLER,
+        "partitions_enabled": QolsysPanel.panel.PARTITIONS,
+        "control4_enabled": QolsysPanel.panel.CONTROL_4,
+        "six_digit_user_code_enabled": QolsysPanel.panel.SIX_DIGIT_USER_CODE,
+        "secure_arming": QolsysPanel.panel.SECURE_ARMING,
+        "auto_stay": QolsysPanel.panel.AUTO_STAY,
+        "auto_bypass": QolsysPanel.panel.AUTO_BYPASS,
+        "auto_arm_stay": QolsysPanel.panel.AUTO_ARM_STAY,
+        "auto_exit_extension": QolsysPanel.panel.AUTO_EXIT_EXTENSION,
+        "final_exit_door_arming": QolsysPanel.panel.FINAL_EXIT_DOOR_ARMING,
+        "no_arm_low_battery": QolsysPanel.panel.NO_ARM_LOW_BATTERY,
+        "normal_entry_delay": QolsysPanel.panel.TIMER_NORMAL_ENTRY_DELAY,
+        "normal_exit_delay": QolsysPanel.panel.TIMER_NORMAL_EXIT_DELAY,
+        "long_entry_delay": QolsysPanel.panel.TIMER_LONG_ENTRY_DELAY,
+        "long_exit_delay": QolsysPanel.panel.TIMER_LONG_EXIT_DELAY,
+        "auxiliary_panic_enabled": QolsysPanel.panel.AUXILIARY_PANIC_ENABLED,
+        "fire_panic_enabled": QolsysPanel.panel.FIRE_PANIC_ENABLED,
+        "police_panic_enabled": QolsysPanel.panel.POLICE_PANIC_ENABLED,
+        "night_mode_settings": QolsysPanel.panel.NIGHTMODE_SETTINGS,
+        "night_mode_settings_stage2": QolsysPanel.panel.NIGHT_SETTINGS_STATE,
+        "show_security_sensors": QolsysPanel.panel.SHOW_SECURITY_SENSORS,
+    }
+
+
+def _redact_journal(entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Redact the payload of journal entries."""
+    return [
+        {**entry, "data": redact_diagnostics.redact_record(data)}
+        if isinstance(data := entry.get("data"), Mapping)
+        else entry
+        for entry in entries
+    ]
+
+
+async def _async_journal(hass: HomeAssistant, journal: EventJournal) -> dict[str, Any]:
+    """Return the event journal entries of the last JOURNAL_PERIOD."""
+    end = dt_util.utcnow()
+    start = end - JOURNAL_PERIOD
+    try:
+        entries = await journal.async_read(start, end)
+    except OSError as err:
+        return {"error": str(err)}
+    return {
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "entries": await hass.async_add_executor_job(_redact_journal, entries),
+    }
+
+
+def _partition_snapshot(partition: QolsysPartition) -> dict[str, Any]:
+    """Return the state of a partition."""
+    return {
+        "id": partition.id,
+        "name": partition.name,
+        "system_status": partition.system_status,
+        "alarm_state": partition.alarm_state,
+        "alarm_type": partition.alarm_type_array,
+    }
+
 
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: QolsysPanelConfigEntry
@@ -27,58 +170,69 @@ async def async_get_config_entry_diagnostics(
     QolsysPanel = entry.runtime_data
 
     if QolsysPanel is None:
-        return {"entry_data": async_redact_data(entry.data, TO_REDACT)}
+        return {"entry_data": redact_diagnostics(entry.data)}
 
-    return {
-        "entry_data": async_redact_data(entry.data, TO_REDACT),
-        "data": async_redact_data(
-            {
-                "hardware_version": QolsysPanel.panel.HARDWARE_VERSION,
-                "panel_tamper_state": QolsysPanel.panel.PANEL_TAMPER_STATE,
-                "ac_status": QolsysPanel.panel.AC_STATUS,
-                "battery_status": QolsysPanel.panel.BATTERY_STATUS,
-                "fail_to_communicate": QolsysPanel.panel.FAIL_TO_COMMUNICATE,
-                "language": QolsysPanel.panel.LANGUAGE,
-                "temp_format": QolsysPanel.panel.TEMPFORMAT,
-                "zwave_firmware_version": QolsysPanel.panel.ZWAVE_FIRM_WARE_VERSION,
-                "zwave_card_present": QolsysPanel.panel.ZWAVE_CARD,
-                "zwave_controller_enabled": QolsysPanel.panel.ZWAVE_CONTROLLER,
-                "partitions_enabled": QolsysPanel.panel.PARTITIONS,
-                "control4_enabled": QolsysPanel.panel.CONTROL_4,
-                "six_digit_user_code_enabled": QolsysPanel.panel.SIX_DIGIT_USER_CODE,
-                "secure_arming": QolsysPanel.panel.SECURE_ARMING,
-                "auto_stay": QolsysPanel.panel.AUTO_STAY,
-                "auto_bypass": QolsysPanel.panel.AUTO_BYPASS,
-                "auto_arm_stay": QolsysPanel.panel.AUTO_ARM_STAY,
-                "auto_exit_extension": QolsysPanel.panel.AUTO_EXIT_EXTENSION,
-                "final_exit_door_arming": QolsysPanel.panel.FINAL_EXIT_DOOR_ARMING,
-                "no_arm_low_battery": QolsysPanel.panel.NO_ARM_LOW_BATTERY,
-                "normal_entry_delay": QolsysPanel.panel.TIMER_NORMAL_ENTRY_DELAY,
-                "normal_exit_delay": QolsysPanel.panel.TIMER_NORMAL_EXIT_DELAY,
-                "long_entry_delay": QolsysPanel.panel.TIMER_LONG_ENTRY_DELAY,
-                "long_exit_delay": QolsysPanel.panel.TIMER_LONG_EXIT_DELAY,
-                "auxiliary_panic_enabled": QolsysPanel.panel.AUXILIARY_PANIC_ENABLED,
-                "fire_panic_enabled": QolsysPanel.panel.FIRE_PANIC_ENABLED,
-                "police_panic_enabled": QolsysPanel.panel.POLICE_PANIC_ENABLED,
-                "night_mode_settings": QolsysPanel.panel.NIGHTMODE_SETTINGS,
-                "night_mode_settings_stage2": QolsysPanel.panel.NIGHT_SETTINGS_STATE,
-                "show_security_sensors": QolsysPanel.panel.SHOW_SECURITY_SENSORS,
-                "partitions": [
-                    {
-                        "id": partition.id,
-                        "name": partition.name,
-                        "system_status": partition.system_status,
-                        "alarm_state": partition.alarm_state,
-                        "alarm_type": partition.alarm_type_array,
-                    }
-                    for partition in QolsysPanel.state.partitions
-                ],
-                "zones": [zone.to_dict() for zone in QolsysPanel.state.zones],
-                "automation_devices": [
-                    device.to_dict() for device in QolsysPanel.state.automation_devices
-                ],
-                "adc_devices": list(QolsysPanel.panel.db.get_adc_devices()),
-            },
-            TO_REDACT,
+    # The snapshot is taken on the loop: the controller state is only safe to
+    # read there, and its SQLite database is bound to the loop thread. The
+    # redaction runs in the executor.
+    data: dict[str, Any] = {
+        **_panel_snapshot(QolsysPanel),
+        "partitions": [
+            _partition_snapshot(partition) for partition in QolsysPanel.state.partitions
+        ],
+        "zones": await _async_snapshot(QolsysPanel.state.zones),
+        "automation_devices": await _async_snapshot(
+            QolsysPanel.state.automation_devices
         ),
+        "adc_devices": list(QolsysPanel.panel.db.get_adc_devices()),
+    }
+
+    diagnostics: dict[str, Any] = {
+        "entry_data": redact_diagnostics(entry.data),
+        "data": await hass.async_add_executor_job(redact_diagnostics, data),
     }
+
+    if (runtime := async_get_runtime(hass, entry.entry_id)) is not None:
+        diagnostics["performance"] = runtime.as_dict()
+        if runtime.journal is not None:
+            diagnostics["journal"] = await _async_journal(hass, runtime.journal)
+
+    return diagnostics
+
+
+async def async_get_device_diagnostics(
+    hass: HomeAssistant, entry: QolsysPanelConfigEntry, device: DeviceEntry
+) -> dict[str, Any]:
+    """Return diagnostics for the panel, a partition, a zone or an automation device."""
+    QolsysPanel = entry.runtime_data
+    identifier = next(
+        (value for domain, value in device.identifiers if domain == DOMAIN), None
+    )
+    if QolsysPanel is None or identifier is None:
+        return {}
+
+    data: dict[str, Any] = {}
+    prefix = entry.unique_id
+    lookup = panel_lookup(QolsysPanel)
+    if identifier == prefix:
+        data.update(_panel_snapshot(QolsysPanel))
+    elif identifier.startswith(zone_prefix := f"{prefix}_zone"):
+        if zone := lookup.zone(identifier.removeprefix(zone_prefix)):
+            data["zones"] = [zone.to_dict()]
+    elif identifier.startswith(partition_prefix := f"{prefix}_partition"):
+        if partition := lookup.partition(identifier.removeprefix(partition_prefix)):
+            data["partitions"] = [_partition_snapshot(partition)]
+    elif identifier.startswith(autdev_prefix := f"{prefix}_autdev_"):
+        if autdev := lookup.automation_device(identifier.removeprefix(autdev_prefix)):
+            data["automation_devices"] = [autdev.to_dict()]
+
+    if (runtime := async_get_runtime(hass, entry.entry_id)) is not None:
+        uptime = runtime.uptime
+        data["events"] = runtime.events.as_list(identifier)
+        data["entities"] = {
+            entity.entity_id: stats.as_dict(uptime)
+            for entity in er.async_entries_for_device(er.async_get(hass), device.id)
+            if (stats := runtime.entity_stats.get(entity.unique_id)) is not None
+        }
+
+    return redact_diagnostics(data)
@@ -2,20 +2,34 @@
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
+from datetime import datetime
 import logging
-from typing import cast
+import time
+from typing import Any, cast
 
 from qolsys_controller import qolsys_controller
 from qolsys_controller.automation.device import QolsysAutomationDevice
 from qolsys_controller.automation.protocol_status import StatusProtocol
 from qolsys_controller.enum_qolsys import ControllerState, QolsysNotification
+from qolsys_controller.errors import QolsysOperationTimeoutError
+from qolsys_controller.observable import Callback, QolsysObservable
 from qolsys_controller.partition import QolsysPartition
 from qolsys_controller.zone import QolsysZone
 
 from homeassistant.components.sensor import Entity
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.event import async_call_later
 
-from .const import DOMAIN
+from .command import COMMAND_PRIORITY, CommandCoalescer, CommandPriority
+from .const import DEFAULT_OPTIMISTIC_TIMEOUT, DOMAIN
+from .flapping import THROTTLE_SECONDS, flapping_signal
+from .registry import panel_lookup
+from .runtime import QolsysPanelRuntime, UpdateStats, async_get_runtime
 
 
 class QolsysPanelEntity(Entity):
@@ -23,9 +37,14 @@ class QolsysPanelEntity(Entity):
 
     _attr_has_entity_name = True
 
+    # Statistics of the entity's platform and of the entity itself, set
+    # while added to a loaded entry.
+    _update_stats: tuple[UpdateStats, ...] = ()
+
     def __init__(self, QolsysPanel: qolsys_controller, unique_id: str) -> None:
         """Set up a entity for a Qolsys Panel."""
         self.QolsysPanel = QolsysPanel
+        self._device_identifier = unique_id
         self._attr_should_poll = False
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, unique_id)},
@@ -37,17 +56,115 @@ class QolsysPanelEntity(Entity):
         """Return True if entity is available."""
         return self.QolsysPanel.controller_state == ControllerState.CONNECTED
 
+    @property
+    def _runtime(self) -> QolsysPanelRuntime | None:
+        """Return the runtime state of the entity's config entry, if attached."""
+        if self.platform is None or self.platform.config_entry is None:
+            return None
+        return async_get_runtime(self.hass, self.platform.config_entry.entry_id)
+
+    async def _async_run_command(
+        self,
+        command_type: str,
+        command: Callable[[], Awaitable[Any]],
+        priority: CommandPriority | None = None,
+    ) -> None:
+        """Run a panel command through the entry's scheduler and deadlines.
+
+        Without a priority, the priority of the calling task is used.
+        """
+        if priority is None:
+            priority = COMMAND_PRIORITY.get()
+        if (runtime := self._runtime) is None:
+            await command()
+            return
+        await runtime.async_run_command(command_type, priority, command)
+
+    def _subscribe(
+        self,
+        observable: QolsysObservable,
+        notification: QolsysNotification,
+        observer: Callback,
+    ) -> None:
+        """Register an observer with a controller observable."""
+        observable.register(notification, observer)
+        for stats in self._update_stats:
+            stats.subscriptions += 1
+
+    def _unsubscribe(
+        self,
+        observable: QolsysObservable,
+        notification: QolsysNotification,
+        observer: Callback,
+    ) -> None:
+        """Unregister an observer from a controller observable."""
+        observable.unregister(notification, observer)
+        for stats in self._update_stats:
+            stats.subscriptions -= 1
+
+    def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
+        """Schedule a state write after a controller notification.
+
+        Observers are called with the controller Event, which must not be taken
+        for force_refresh: the entity is pushed, so a refresh would only add a
+        task per notification. Only an explicit True forces one.
+        """
+        for stats in self._update_stats:
+            stats.notifications += 1
+        super().schedule_update_ha_state(force_refresh is True)
+
+    @callback
+    def _async_write_ha_state(self) -> None:
+        """Write the state, recording time spent and writes without changes.
+
+        Both async_write_ha_state and the writes scheduled from a notification
+        end here.
+        """
+        if not self._update_stats:
+            super()._async_write_ha_state()
+            return
+        previous = self.hass.states.get(self.entity_id)
+        start = time.perf_counter()
+        super()._async_write_ha_state()
+        elapsed = time.perf_counter() - start
+        # The state machine keeps the same State object when nothing changed.
+        suppressed = (
+            previous is not None and self.hass.states.get(self.entity_id) is previous
+        )
+        for stats in self._update_stats:
+            stats.write_time.add(elapsed)
+            stats.writes += 1
+            stats.suppressed_writes += suppressed
+
     async def async_added_to_hass(self) -> None:
         """Observe connection_status changes."""
-        self.QolsysPanel.state.register(
-            QolsysNotification.PANEL_STATUS_UPDATE, self.schedule_update_ha_state
+        if self.platform is not None and (runtime := self._runtime) is not None:
+            entity_stats = UpdateStats()
+            if self.unique_id is not None:
+                runtime.entity_stats[self.unique_id] = entity_stats
+            self._update_stats = (
+                runtime.platform_stats(self.platform.domain),
+                entity_stats,
+            )
+            for stats in self._update_stats:
+                stats.entities += 1
+        self._subscribe(
+            self.QolsysPanel.state,
+            QolsysNotification.PANEL_STATUS_UPDATE,
+            self.schedule_update_ha_state,
         )
 
     async def async_will_remove_from_hass(self) -> None:
         """Stop observing connection_status changes."""
-        self.QolsysPanel.state.unregister(
-            QolsysNotification.PANEL_STATUS_UPDATE, self.schedule_update_ha_state
+        self._unsubscribe(
+            self.QolsysPanel.state,
+            QolsysNotification.PANEL_STATUS_UPDATE,
+            self.schedule_update_ha_state,
         )
+        for stats in self._update_stats:
+            stats.entities -= 1
+        if (runtime := self._runtime) is not None and self.unique_id is not None:
+            runtime.entity_stats.pop(self.unique_id, None)
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -66,7 +183,8 @@ class QolsysPartitionEntity(QolsysPanelEntity):
         super().__init__(QolsysPanel, unique_id)
         self._partition_id = partition_id
         self._partition_unique_id = f"{unique_id}_partition{partition_id}"
-        partition = QolsysPanel.state.partition(self._partition_id)
+        self._device_identifier = self._partition_unique_id
+        partition = panel_lookup(QolsysPanel).partition(self._partition_id)
         if partition is None:
             _LOGGER.error("Invalid partition_id:%s", self._partition_id)
             raise ValueError(f"Unknown partition id: {self._partition_id}")
@@ -82,21 +200,28 @@ class QolsysPartitionEntity(QolsysPanelEntity):
     async def async_added_to_hass(self) -> None:
         """Observe changes."""
         await super().async_added_to_hass()
-        self._partition.register(
-            QolsysNotification.PARTITION_UPDATE, self.schedule_update_ha_state
+        self._subscribe(
+            self._partition,
+            QolsysNotification.PARTITION_UPDATE,
+            self.schedule_update_ha_state,
         )
 
     async def async_will_remove_from_hass(self) -> None:
         """Stop observing changes."""
         await super().async_will_remove_from_hass()
-        self._partition.unregister(
-            QolsysNotification.PARTITION_UPDATE, self.schedule_update_ha_state
+        self._unsubscribe(
+            self._partition,
+            QolsysNotification.PARTITION_UPDATE,
+            self.schedule_update_ha_state,
         )
 
 
 class QolsysZoneEntity(QolsysPanelEntity):
     """Qolsys Zone Entity."""
 
+    # Pending state write of a throttled entity, see schedule_update_ha_state.
+    _cancel_throttled_write: CALLBACK_TYPE | None = None
+
     def __init__(
         self, QolsysPanel: qolsys_controller, zone_id: str, unique_id: str
     ) -> None:
@@ -104,7 +229,8 @@ class QolsysZoneEntity(QolsysPanelEntity):
         super().__init__(QolsysPanel, unique_id)
         self._zone_id = zone_id
         self._zone_unique_id = f"{unique_id}_zone{zone_id}"
-        zone = QolsysPanel.state.zone(self._zone_id)
+        self._device_identifier = self._zone_unique_id
+        zone = panel_lookup(QolsysPanel).zone(self._zone_id)
         if zone is None:
             _LOGGER.error("Invalid zone_id:%s", self._zone_id)
             raise ValueError(f"Unknown zone id: {self._zone_id}")
@@ -118,23 +244,74 @@ class QolsysZoneEntity(QolsysPanelEntity):
         )
 
     async def async_added_to_hass(self) -> None:
-        """Observe changes."""
+        """Observe changes, and the zone starting or stopping to flap."""
         await super().async_added_to_hass()
-        self._zone.register(
-            QolsysNotification.ZONE_UPDATE, self.schedule_update_ha_state
+        self._subscribe(
+            self._zone, QolsysNotification.ZONE_UPDATE, self.schedule_update_ha_state
         )
+        if self.platform is not None and self.platform.config_entry is not None:
+            # Flapping attributes and throttling change without a zone update.
+            self.async_on_remove(
+                async_dispatcher_connect(
+                    self.hass,
+                    flapping_signal(self.platform.config_entry.entry_id, self._zone_id),
+                    self.async_write_ha_state,
+                )
+            )
 
     async def async_will_remove_from_hass(self) -> None:
         """Stop observing changes."""
         await super().async_will_remove_from_hass()
-        self._zone.unregister(
-            QolsysNotification.ZONE_UPDATE, self.schedule_update_ha_state
+        self._unsubscribe(
+            self._zone, QolsysNotification.ZONE_UPDATE, self.schedule_update_ha_state
         )
+        if self._cancel_throttled_write is not None:
+            self._cancel_throttled_write()
+            self._cancel_throttled_write = None
+
+    def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
+        """Schedule a state write, throttled while a diagnostic zone flaps.
+
+        With the throttle option set, the diagnostic entities of a flapping
+        zone write their state at most once every THROTTLE_SECONDS, with the
+        last notification of the period.
+        """
+        if self.entity_category is not EntityCategory.DIAGNOSTIC or not (
+            (runtime := self._runtime) is not None
+            and runtime.flapping is not None
+            and runtime.flapping.is_throttled(self._zone_id)
+        ):
+            super().schedule_update_ha_state(force_refresh)
+            return
+        for stats in self._update_stats:
+            stats.notifications += 1
+        self.hass.loop.call_soon_threadsafe(self._async_schedule_throttled_write)
+
+    @callback
+    def _async_schedule_throttled_write(self) -> None:
+        """Write the state at the end of the throttle period."""
+        if self._cancel_throttled_write is None:
+            self._cancel_throttled_write = async_call_later(
+                self.hass, THROTTLE_SECONDS, self._async_throttled_write
+            )
+
+    @callback
+    def _async_throttled_write(self, _now: datetime) -> None:
+        """Write the state held back during the throttle period."""
+        self._cancel_throttled_write = None
+        # Skipped by Home Assistant once the entity is removed.
+        self._async_write_ha_state_from_call_soon_threadsafe()
 
 
 class QolsysAutomationDeviceEntity(QolsysPanelEntity):
     """Qolsys Automation Device Entity."""
 
+    # Optimistic state shown until the panel confirms a command, see
+    # _async_send_optimistic.
+    _optimistic_state: bool | None = None
+    _optimistic_since: float = 0.0
+    _cancel_optimistic_deadline: CALLBACK_TYPE | None = None
+
     def __init__(
         self, QolsysPanel: qolsys_controller, virtual_node_id: str, unique_id: str
     ) -> None:
@@ -142,7 +319,8 @@ class QolsysAutomationDeviceEntity(QolsysPanelEntity):
         super().__init__(QolsysPanel, unique_id)
         self._virtual_node_id = virtual_node_id
         self._autdev_unique_id = f"{unique_id}_autdev_{virtual_node_id}"
-        autdev = QolsysPanel.state.automation_device(virtual_node_id)
+        self._device_identifier = self._autdev_unique_id
+        autdev = panel_lookup(QolsysPanel).automation_device(virtual_node_id)
 
         if autdev is None:
             _LOGGER.error("Invalid AutDev virtual_node_id:%s", virtual_node_id)
@@ -172,18 +350,149 @@ class QolsysAutomationDeviceEntity(QolsysPanelEntity):
 
         return self.QolsysPanel.controller_state == ControllerState.CONNECTED
 
+    async def _async_send_command(
+        self,
+        command_type: str,
+        command: Callable[[], Awaitable[Any]],
+        *,
+        expected_state: bool | None = None,
+        coalescer: CommandCoalescer | None = None,
+    ) -> None:
+        """Send a command to the automation device.
+
+        Args:
+            command_type: Command name used for round-trip statistics.
+            command: Sends the command through the device service.
+            expected_state: State shown optimistically until the panel confirms it.
+            coalescer: Coalescer for continuous controls, see CommandCoalescer.
+
+        Raises:
+            HomeAssistantError: The panel did not answer before the deadline.
+        """
+
+        async def _send() -> None:
+            if coalescer is None:
+                await self._async_run_command(command_type, command)
+            else:
+                await self._async_send_coalesced(
+                    coalescer, lambda: self._async_run_command(command_type, command)
+                )
+
+        try:
+            if expected_state is None:
+                await _send()
+            else:
+                await self._async_send_optimistic(expected_state, _send)
+        except QolsysOperationTimeoutError as err:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="command_timeout",
+                translation_placeholders={"command": command_type},
+            ) from err
+
+    async def _async_send_coalesced(
+        self, coalescer: CommandCoalescer, command: Callable[[], Awaitable[Any]]
+    ) -> None:
+        """Send a continuous-control command, dropping superseded targets."""
+        if (
+            not await coalescer.async_send(command)
+            and (runtime := self._runtime) is not None
+        ):
+            runtime.coalesced_commands += 1
+
+    def _confirmed_state(self) -> bool | None:
+        """Return the state last reported by the panel for optimistic commands."""
+        return None
+
+    async def _async_send_optimistic(
+        self, expected: bool, command: Callable[[], Awaitable[Any]]
+    ) -> None:
+        """Send a command, showing the expected state until the panel confirms it.
+
+        Without the optimistic option the command is simply awaited. Otherwise
+        the expected state is written at once and reconciled with the next
+        AUTOMATION_UPDATE, or rolled back if none confirms it before the deadline.
+        """
+        runtime = self._runtime
+        if (
+            runtime is None
+            or not runtime.optimistic
+            or self._confirmed_state() == expected
+        ):
+            await command()
+            return
+
+        self._async_end_optimistic()
+        self._optimistic_state = expected
+        self._optimistic_since = time.monotonic()
+        self._cancel_optimistic_deadline = async_call_later(
+            self.hass, DEFAULT_OPTIMISTIC_TIMEOUT, self._async_optimistic_timeout
+        )
+        self.async_write_ha_state()
+
+        try:
+            await command()
+        except BaseException:
+            self._async_end_optimistic()
+            self.async_write_ha_state()
+            raise
+
+    @callback
+    def _async_end_optimistic(self) -> None:
+        """Drop any pending optimistic state."""
+        if self._cancel_optimistic_deadline is not None:
+            self._cancel_optimistic_deadline()
+            self._cancel_optimistic_deadline = None
+        self._optimistic_state = None
+
+    @callback
+    def _async_optimistic_timeout(self, _now: datetime) -> None:
+        """Roll back an optimistic state the panel never confirmed."""
+        self._cancel_optimistic_deadline = None
+        _LOGGER.debug("%s: command not confirmed, rolling back", self.entity_id)
+        if (runtime := self._runtime) is not None:
+            runtime.optimistic_rollbacks += 1
+        self._async_end_optimistic()
+        self.async_write_ha_state()
+
+    def _reconcile_optimistic(self) -> None:
+        """Confirm a pending optimistic state once the panel reports it."""
+        if (
+            self._optimistic_state is None
+            or self._confirmed_state() != self._optimistic_state
+        ):
+            return
+        if (runtime := self._runtime) is not None:
+            runtime.confirmation_latency.add(time.monotonic() - self._optimistic_since)
+        self._async_end_optimistic()
+
     async def async_added_to_hass(self) -> None:
         """Observe changes."""
         await super().async_added_to_hass()
-        self._autdev.register(
-            QolsysNotification.AUTOMATION_UPDATE, self.schedule_update_ha_state
+        self._subscribe(
+            self._autdev,
+            QolsysNotification.AUTOMATION_UPDATE,
+            self._reconcile_optimistic,
+        )
+        self._subscribe(
+            self._autdev,
+            QolsysNotification.AUTOMATION_UPDATE,
+            self.schedule_update_ha_state,
         )
 
     async def async_will_remove_from_hass(self) -> None:
         """Stop observing changes."""
         await super().async_will_remove_from_hass()
-        self._autdev.unregister(
-            QolsysNotification.AUTOMATION_UPDATE, self.schedule_update_ha_state
+        self._async_end_optimistic()
+        self._unsubscribe(
+            self._autdev,
+            QolsysNotification.AUTOMATION_UPDATE,
+            self._reconcile_optimistic,
+        )
+        self._unsubscribe(
+            self._autdev,
+            QolsysNotification.AUTOMATION_UPDATE,
+            self.schedule_update_ha_state,
         )
 
 
@@ -205,15 +514,19 @@ class QolsysPanelSensorEntity(QolsysPanelEntity):
     async def async_added_to_hass(self) -> None:
         """Observe changes."""
         await super().async_added_to_hass()
-        self.QolsysPanel.state.register(
-            QolsysNotification.PANEL_SETTINGS_UPDATE, self.schedule_update_ha_state
+        self._subscribe(
+            self.QolsysPanel.state,
+            QolsysNotification.PANEL_SETTINGS_UPDATE,
+            self.schedule_update_ha_state,
         )
 
     async def async_will_remove_from_hass(self) -> None:
         """Stop observing changes."""
         await super().async_will_remove_from_hass()
-        self.QolsysPanel.state.unregister(
-            QolsysNotification.PANEL_SETTINGS_UPDATE, self.schedule_update_ha_state
+        self._unsubscribe(
+            self.QolsysPanel.state,
+            QolsysNotification.PANEL_SETTINGS_UPDATE,
+            self.schedule_update_ha_state,
         )
 
 
@@ -234,13 +547,17 @@ class QolsysWeatherEntity(QolsysPanelEntity):
     async def async_added_to_hass(self) -> None:
         """Observe changes."""
         await super().async_added_to_hass()
-        self.QolsysPanel.state.weather.register(
-            QolsysNotification.WEATHER_UPDATE, self.schedule_update_ha_state
+        self._subscribe(
+            self.QolsysPanel.state.weather,
+            QolsysNotification.WEATHER_UPDATE,
+            self.schedule_update_ha_state,
         )
 
     async def async_will_remove_from_hass(self) -> None:
         """Stop observing changes."""
         await super().async_will_remove_from_hass()
-        self.QolsysPanel.state.weather.unregister(
-            QolsysNotification.WEATHER_UPDATE, self.schedule_update_ha_state
+        self._unsubscribe(
+            self.QolsysPanel.state.weather,
+            QolsysNotification.WEATHER_UPDATE,
+            self.schedule_update_ha_state,
         )
@@ -0,0 +1,198 @@
+"""Compact panel snapshot and the stream of its changes."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from qolsys_controller import qolsys_controller
+from qolsys_controller.enum_qolsys import ControllerState, QolsysNotification
+from qolsys_controller.observable import Event, QolsysObservable
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from .registry import panel_lookup
+
+# Snapshot section of the objects each notification is about.
+UPDATE_SECTIONS: dict[QolsysNotification, str] = {
+    QolsysNotification.PARTITION_UPDATE: "partitions",
+    QolsysNotification.ZONE_UPDATE: "zones",
+    QolsysNotification.AUTOMATION_UPDATE: "devices",
+}
+ADD_SECTIONS: dict[QolsysNotification, str] = {
+    QolsysNotification.PARTITION_ADD: "partitions",
+    QolsysNotification.ZONE_ADD: "zones",
+    QolsysNotification.AUTOMATION_ADD: "devices",
+}
+DELETE_SECTIONS: dict[QolsysNotification, str] = {
+    QolsysNotification.PARTITION_DELETE: "partitions",
+    QolsysNotification.ZONE_DELETE: "zones",
+    QolsysNotification.AUTOMATION_DELETE: "devices",
+}
+
+# Update notification of the objects of each snapshot section.
+SECTION_NOTIFICATIONS: dict[str, QolsysNotification] = {
+    section: notification for notification, section in UPDATE_SECTIONS.items()
+}
+
+type Snapshot = dict[str, dict[str, Any]]
+
+
+def compact_record(data: dict[str, Any]) -> dict[str, Any]:
+    """Return the compact record of an object from its event payload.
+
+    The attributes and state of the payload are flattened into one record;
+    the timestamp and capabilities are left out so that a notification that
+    changes nothing yields the same record.
+    """
+    return {**data.get("attributes", {}), **data.get("state", {})}
+
+
+def panel_snapshot(QolsysPanel: qolsys_controller) -> Snapshot:
+    """Return the compact record of every partition, zone and device."""
+    state = QolsysPanel.state
+    snapshot: Snapshot = {
+        "panel": {
+            "connected": QolsysPanel.controller_state == ControllerState.CONNECTED
+        },
+        "partitions": {},
+        "zones": {},
+        "devices": {},
+    }
+    for section, records in (
+        ("partitions", state.partitions),
+        ("zones", state.zones),
+        ("devices", state.automation_devices),
+    ):
+        for record in records:
+            data = record.to_dict_event()
+            snapshot[section][str(data["id"])] = compact_record(data)
+    return snapshot
+
+
+class PanelFeed:
+    """Stream the changes of the panel snapshot to subscribers.
+
+    The feed observes the same controller notifications as the entities, but
+    only while it has subscribers. Each notification is reduced to the fields
+    of its record that changed since the last one sent; a notification that
+    changes nothing is dropped. Deltas have the shape of the snapshot, with a
+    removed object set to None.
+    """
+
+    def __init__(self, QolsysPanel: qolsys_controller) -> None:
+        """Set up an idle feed for the controller."""
+        self._panel = QolsysPanel
+        self._records: Snapshot = {}
+        self._subscribers: list[Callable[[Snapshot], None]] = []
+        # Observed partitions, zones and devices by (section, id).
+        self._followed: dict[tuple[str, str], QolsysObservable] = {}
+
+    def snapshot(self) -> Snapshot:
+        """Return the current snapshot of the panel."""
+        if not self._subscribers:
+            return panel_snapshot(self._panel)
+        return {section: dict(records) for section, records in self._records.items()}
+
+    @callback
+    def async_subscribe(self, subscriber: Callable[[Snapshot], None]) -> CALLBACK_TYPE:
+        """Send every delta to the subscriber until the returned callback runs."""
+        if not self._subscribers:
+            self._records = panel_snapshot(self._panel)
+            self._observe()
+        self._subscribers.append(subscriber)
+
+        @callback
+        def _unsubscribe() -> None:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+                if not self._subscribers:
+                    self._unobserve()
+
+        return _unsubscribe
+
+    @callback
+    def async_close(self) -> None:
+        """Stop observing the controller and drop every subscriber."""
+        if self._subscribers:
+            self._subscribers.clear()
+            self._unobserve()
+
+    def _observe(self) -> None:
+        """Observe the panel state and every partition, zone and device."""
+        state = self._panel.state
+        state.register(QolsysNotification.PANEL_STATUS_UPDATE, self._on_status)
+        for notification in (*ADD_SECTIONS, *DELETE_SECTIONS):
+            state.register(notification, self._on_membership)
+        for section in SECTION_NOTIFICATIONS:
+            for key in self._records[section]:
+                self._follow(section, key)
+
+    def _unobserve(self) -> None:
+        """Stop observing the panel state and its objects."""
+        state = self._panel.state
+        state.unregister(QolsysNotification.PANEL_STATUS_UPDATE, self._on_status)
+        for notification in (*ADD_SECTIONS, *DELETE_SECTIONS):
+            state.unregister(notification, self._on_membership)
+        for section, key in list(self._followed):
+            self._unfollow(section, key)
+
+    def _follow(self, section: str, key: str) -> None:
+        """Observe updates of a partition, zone or device."""
+        state = panel_lookup(self._panel)
+        observable: QolsysObservable | None
+        if section == "partitions":
+            observable = state.partition(key)
+        elif section == "zones":
+            observable = state.zone(key)
+        else:
+            observable = state.automation_device(key)
+        if observable is not None:
+            observable.register(SECTION_NOTIFICATIONS[section], self._on_update)
+            self._followed[section, key] = observable
+
+    def _unfollow(self, section: str, key: str) -> None:
+        """Stop observing updates of a partition, zone or device."""
+        if (observable := self._followed.pop((section, key), None)) is not None:
+            observable.unregister(SECTION_NOTIFICATIONS[section], self._on_update)
+
+    def _on_status(self, event: Event) -> None:
+        """Publish a change of the connection to the panel."""
+        connected = self._panel.controller_state == ControllerState.CONNECTED
+        if self._records["panel"]["connected"] != connected:
+            self._records["panel"] = {"connected": connected}
+            self._publish({"panel": {"connected": connected}})
+
+    def _on_update(self, event: Event) -> None:
+        """Publish the fields of a partition, zone or device that changed."""
+        section = UPDATE_SECTIONS[event.type]
+        key = str(event.data["id"])
+        record = compact_record(event.data)
+        previous = self._records[section].get(key, {})
+        if changes := {
+            field: value
+            for field, value in record.items()
+            if field not in previous or previous[field] != value
+        }:
+            self._records[section][key] = record
+            self._publish({section: {key: changes}})
+
+    def _on_membership(self, event: Event) -> None:
+        """Publish an added or deleted partition, zone or device."""
+        key = str(event.data["id"])
+        if (section := ADD_SECTIONS.get(event.type)) is not None:
+            record = compact_record(event.data)
+            self._records[section][key] = record
+            self._unfollow(section, key)
+            self._follow(section, key)
+            self._publish({section: {key: record}})
+            return
+        section = DELETE_SECTIONS[event.type]
+        self._unfollow(section, key)
+        if self._records[section].pop(key, None) is not None:
+            self._publish({section: {key: None}})
+
+    def _publish(self, delta: Snapshot) -> None:
+        """Send a delta to every subscriber."""
+        for subscriber in list(self._subscribers):
+            subscriber(delta)
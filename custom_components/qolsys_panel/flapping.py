@@ -0,0 +1,223 @@
+"""Detection of zones flooding the integration with updates."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+import time
+from typing import Any
+
+from qolsys_controller import qolsys_controller
+from qolsys_controller.enum_qolsys import QolsysNotification
+from qolsys_controller.observable import Event
+from qolsys_controller.zone import QolsysZone
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import DOMAIN
+from .registry import panel_lookup
+
+_LOGGER = logging.getLogger(__name__)
+
+# A zone flaps from FLAPPING_THRESHOLD updates within FLAPPING_WINDOW seconds,
+# and recovers below half of it.
+FLAPPING_WINDOW = 60.0
+FLAPPING_THRESHOLD = 60
+FLAPPING_CHECK_INTERVAL = timedelta(seconds=30)
+
+# Minimum seconds between state writes of a throttled entity.
+THROTTLE_SECONDS = 30.0
+
+
+def flapping_signal(entry_id: str, zone_id: str) -> str:
+    """Return the signal sent when a zone of an entry starts or stops flapping."""
+    return f"{DOMAIN}_flapping_{entry_id}_{zone_id}"
+
+
+class SlidingWindowCounter:
+    """Count events over a sliding window, in a fixed number of buckets."""
+
+    def __init__(self, window: float = FLAPPING_WINDOW, buckets: int = 12) -> None:
+        """Set up an empty counter."""
+        self._width = window / buckets
+        self._counts = [0] * buckets
+        # Absolute bucket number each slot counts for.
+        self._slots = [-buckets] * buckets
+
+    def add(self, now: float) -> None:
+        """Count an event at the given monotonic time."""
+        bucket = int(now // self._width)
+        slot = bucket % len(self._slots)
+        if self._slots[slot] != bucket:
+            self._slots[slot] = bucket
+            self._counts[slot] = 0
+        self._counts[slot] += 1
+
+    def count(self, now: float) -> int:
+        """Return the events counted within the window ending now."""
+        bucket = int(now // self._width)
+        size = len(self._slots)
+        return sum(
+            count
+            for slot, count in zip(self._slots, self._counts, strict=True)
+            if bucket - slot < size
+        )
+
+
+class FlappingDetector:
+    """Track the update rate of each zone and flag the zones that flap.
+
+    A repair issue names every flapping zone until it recovers, and the
+    entities of the zone are signaled on both changes, see flapping_signal.
+    When throttling is enabled, the diagnostic entities of a flapping zone
+    write their state at most once every THROTTLE_SECONDS.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        QolsysPanel: qolsys_controller,
+        *,
+        throttle: bool = False,
+    ) -> None:
+        """Set up the detector for the zones of a config entry."""
+        self._hass = hass
+        self._entry_id = entry_id
+        self._panel = QolsysPanel
+        self.throttle = throttle
+        self._zones: dict[str, QolsysZone] = {}
+        self._counters: dict[str, SlidingWindowCounter] = {}
+        self._flapping: set[str] = set()
+        self._cancel_check: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Follow the updates of every zone of the panel."""
+        state = self._panel.state
+        state.register(QolsysNotification.ZONE_ADD, self._on_zone_add)
+        state.register(QolsysNotification.ZONE_DELETE, self._on_zone_delete)
+        for zone in state.zones:
+            self._follow(zone)
+        self._cancel_check = async_track_time_interval(
+            self._hass, self._async_check, FLAPPING_CHECK_INTERVAL
+        )
+
+    @callback
+    def async_close(self) -> None:
+        """Stop following the zones and remove their repair issues."""
+        state = self._panel.state
+        state.unregister(QolsysNotification.ZONE_ADD, self._on_zone_add)
+        state.unregister(QolsysNotification.ZONE_DELETE, self._on_zone_delete)
+        if self._cancel_check is not None:
+            self._cancel_check()
+            self._cancel_check = None
+        for zone_id in list(self._zones):
+            self._unfollow(zone_id)
+
+    def _follow(self, zone: QolsysZone) -> None:
+        """Count the updates of a zone."""
+        self._unfollow(zone.zone_id)
+        self._zones[zone.zone_id] = zone
+        self._counters[zone.zone_id] = SlidingWindowCounter()
+        zone.register(QolsysNotification.ZONE_UPDATE, self._on_zone_update)
+
+    def _unfollow(self, zone_id: str) -> None:
+        """Stop counting the updates of a zone."""
+        if (zone := self._zones.pop(zone_id, None)) is None:
+            return
+        zone.unregister(QolsysNotification.ZONE_UPDATE, self._on_zone_update)
+        del self._counters[zone_id]
+        self._recovered(zone_id)
+
+    def _on_zone_add(self, event: Event) -> None:
+        """Count the updates of a zone added to the panel."""
+        if (zone := panel_lookup(self._panel).zone(str(event.data["id"]))) is not None:
+            self._follow(zone)
+
+    def _on_zone_delete(self, event: Event) -> None:
+        """Stop counting the updates of a zone deleted from the panel."""
+        self._unfollow(str(event.data["id"]))
+
+    def _on_zone_update(self, event: Event) -> None:
+        """Count an update and flag the zone when it reaches the threshold."""
+        zone = event.source
+        if not isinstance(zone, QolsysZone):
+            return
+        if (counter := self._counters.get(zone.zone_id)) is None:
+            return
+        now = time.monotonic()
+        counter.add(now)
+        if zone.zone_id not in self._flapping:
+            if (rate := counter.count(now)) >= FLAPPING_THRESHOLD:
+                self._flapped(zone, rate)
+
+    def _flapped(self, zone: QolsysZone, rate: int) -> None:
+        """Flag a zone as flapping and raise its repair issue."""
+        self._flapping.add(zone.zone_id)
+        _LOGGER.warning(
+            "Zone%s (%s) is flapping: %s updates in %ss",
+            zone.zone_id,
+            zone.sensorname,
+            rate,
+            int(FLAPPING_WINDOW),
+        )
+        ir.async_create_issue(
+            self._hass,
+            DOMAIN,
+            self._issue_id(zone.zone_id),
+            is_fixable=False,
+            severity=ir.IssueSeverity.WARNING,
+            translation_key="flapping_zone",
+            translation_placeholders={
+                "zone": zone.sensorname,
+                "zone_id": zone.zone_id,
+                "rate": str(rate),
+            },
+        )
+        async_dispatcher_send(self._hass, flapping_signal(self._entry_id, zone.zone_id))
+
+    def _recovered(self, zone_id: str) -> None:
+        """Clear the flapping flag and repair issue of a zone."""
+        if zone_id in self._flapping:
+            self._flapping.discard(zone_id)
+            ir.async_delete_issue(self._hass, DOMAIN, self._issue_id(zone_id))
+            async_dispatcher_send(self._hass, flapping_signal(self._entry_id, zone_id))
+
+    @callback
+    def _async_check(self, _now: datetime) -> None:
+        """Clear the zones whose update rate fell below half the threshold."""
+        now = time.monotonic()
+        for zone_id in list(self._flapping):
+            if self._counters[zone_id].count(now) < FLAPPING_THRESHOLD / 2:
+                _LOGGER.info("Zone%s is no longer flapping", zone_id)
+                self._recovered(zone_id)
+
+    def _issue_id(self, zone_id: str) -> str:
+        return f"flapping_zone_{self._entry_id}_{zone_id}"
+
+    def event_rate(self, zone_id: str) -> int:
+        """Return the updates of a zone within the last FLAPPING_WINDOW seconds."""
+        if (counter := self._counters.get(zone_id)) is None:
+            return 0
+        return counter.count(time.monotonic())
+
+    def is_flapping(self, zone_id: str) -> bool:
+        """Return whether a zone is flapping."""
+        return zone_id in self._flapping
+
+    def is_throttled(self, zone_id: str) -> bool:
+        """Return whether the diagnostic entities of a zone are throttled."""
+        return self.throttle and zone_id in self._flapping
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the flapping zones and their update rate for diagnostics."""
+        return {
+            "throttle": self.throttle,
+            "flapping_zones": {
+                zone_id: self.event_rate(zone_id) for zone_id in sorted(self._flapping)
+            },
+        }
@@ -0,0 +1,137 @@
+"""Signal and battery report over the zones of a panel."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable, Iterable
+from statistics import fmean, quantiles
+from typing import Any
+
+from qolsys_controller.zone import QolsysZone
+
+# Zone values in the report, by the translation key of their zone sensor.
+FLEET_METRICS: dict[str, Callable[[QolsysZone], float | None]] = {
+    "latest_dbm": lambda zone: zone.latestdBm,
+    "average_dbm": lambda zone: zone.averagedBm,
+    "powerg_battery_level": lambda zone: zone.powerg_battery_level,
+    "powerg_battery_voltage": lambda zone: zone.powerg_battery_voltage,
+}
+
+# Percentiles reported for each metric.
+FLEET_PERCENTILES = (5, 25, 50, 75, 95)
+
+# Values further than this many interquartile ranges outside the quartiles
+# are outliers (Tukey's fences).
+OUTLIER_IQR_FACTOR = 1.5
+
+
+class FleetColumns:
+    """Zone values as column arrays, one entry per zone in every column.
+
+    A missing value is None, so that the same index refers to the same zone
+    in each column.
+    """
+
+    def __init__(self, zones: Iterable[QolsysZone]) -> None:
+        """Read the zones into columns in a single pass."""
+        self.zone_ids: list[str] = []
+        self.names: list[str] = []
+        self.partition_ids: list[str] = []
+        self.values: dict[str, list[float | None]] = {
+            metric: [] for metric in FLEET_METRICS
+        }
+        getters = [(self.values[metric], get) for metric, get in FLEET_METRICS.items()]
+        for zone in zones:
+            self.zone_ids.append(zone.zone_id)
+            self.names.append(zone.sensorname)
+            self.partition_ids.append(zone.partition_id)
+            for column, get in getters:
+                column.append(get(zone))
+
+    def __len__(self) -> int:
+        """Return the number of zones."""
+        return len(self.zone_ids)
+
+
+def _round(value: float) -> float:
+    return round(value, 2)
+
+
+def metric_summary(columns: FleetColumns, metric: str) -> dict[str, Any]:
+    """Return the percentiles and outliers of a metric over every zone.
+
+    The present values are sorted once; every percentile and both fences are
+    read from that order.
+    """
+    column = columns.values[metric]
+    ordered = sorted(value for value in column if value is not None)
+    if not ordered:
+        return {"count": 0}
+
+    summary: dict[str, Any] = {
+        "count": len(ordered),
+        "min": ordered[0],
+        "max": ordered[-1],
+        "mean": _round(fmean(ordered)),
+    }
+    cuts = quantiles(ordered, n=100, method="inclusive") if len(ordered) > 1 else []
+    for pct in FLEET_PERCENTILES:
+        summary[f"p{pct}"] = _round(cuts[pct - 1]) if cuts else ordered[0]
+
+    low: float = summary["p25"]
+    high: float = summary["p75"]
+    spread = (high - low) * OUTLIER_IQR_FACTOR
+    summary["outliers"] = sorted(
+        (
+            {
+                "zone_id": columns.zone_ids[i],
+                "name": columns.names[i],
+                "value": value,
+            }
+            for i, value in enumerate(column)
+            if value is not None and not low - spread <= value <= high + spread
+        ),
+        key=lambda outlier: outlier["value"],
+    )
+    return summary
+
+
+def partition_summary(columns: FleetColumns) -> dict[str, dict[str, Any]]:
+    """Return the zone count and the mean and minimum of each metric by partition."""
+    counts = Counter(columns.partition_ids)
+    grouped: dict[str, dict[str, list[float]]] = {
+        partition_id: {metric: [] for metric in FLEET_METRICS}
+        for partition_id in counts
+    }
+    for metric, column in columns.values.items():
+        for partition_id, value in zip(columns.partition_ids, column, strict=True):
+            if value is not None:
+                grouped[partition_id][metric].append(value)
+
+    return {
+        partition_id: {
+            "zones": counts[partition_id],
+            **{
+                metric: {
+                    "count": len(values),
+                    "mean": _round(fmean(values)),
+                    "min": min(values),
+                }
+                for metric, values in metrics.items()
+                if values
+            },
+        }
+        for partition_id, metrics in sorted(grouped.items())
+    }
+
+
+def fleet_report(zones: Iterable[QolsysZone]) -> dict[str, Any]:
+    """Return the signal and battery report of the zones."""
+    columns = FleetColumns(zones)
+    return {
+        "zones": len(columns),
+        "metrics": {
+            metric: metric_summary(columns, metric) for metric in FLEET_METRICS
+        },
+        "partitions": partition_summary(columns),
+    }
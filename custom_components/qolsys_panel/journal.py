@@ -0,0 +1,313 @@
+"""Append-only journal of the panel events, kept on disk."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+import contextlib
+from datetime import datetime
+import logging
+from pathlib import Path
+import time
+from typing import Any
+
+from qolsys_controller import qolsys_controller
+from qolsys_controller.enum_qolsys import QolsysNotification
+from qolsys_controller.observable import Event
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util.json import json_loads_object
+
+from .feed import DELETE_SECTIONS, SECTION_NOTIFICATIONS, PanelFeed, Snapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+# A segment is closed once it reaches SEGMENT_BYTES; the oldest segments are
+# deleted beyond MAX_SEGMENTS, which bounds the journal to about 2 MiB.
+SEGMENT_BYTES = 64 * 1024
+MAX_SEGMENTS = 32
+INDEX_FILE = "index.json"
+
+# Seconds the writer waits after an entry for more, to write them together.
+FLUSH_DELAY = 1.0
+
+# Entries waiting for the writer; the oldest are dropped beyond it.
+MAX_QUEUED = 1000
+
+# Delete notification of the objects of each snapshot section.
+SECTION_DELETES: dict[str, QolsysNotification] = {
+    section: notification for notification, section in DELETE_SECTIONS.items()
+}
+
+# Panel notifications journaled with their payload.
+PANEL_EVENTS = (QolsysNotification.PANEL_DOORBELL, QolsysNotification.PANEL_CHIME)
+
+
+def journal_directory(hass: HomeAssistant, unique_id: str) -> Path:
+    """Return the journal directory of the panel of an entry."""
+    return Path(hass.config.path("qolsys_panel", "journal", unique_id))
+
+
+def _segment_name(sequence: int) -> str:
+    """Return the file name of the segment with the given sequence number."""
+    return f"{sequence:08d}.jsonl"
+
+
+class JournalWriter:
+    """Segment files of a journal directory and their index.
+
+    The writer runs in the executor only, one batch at a time. Each line of a
+    segment is one entry; the index keeps, per segment, the timestamps of its
+    first and last entries and their count, so that a read only opens the
+    segments of its period.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """Set up the writer of a journal directory."""
+        self.directory = directory
+        self.segments: list[dict[str, Any]] = []
+
+    def load(self) -> None:
+        """Load the index, rebuilding it from the segments when unreadable."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        try:
+            index = json_loads_object((self.directory / INDEX_FILE).read_bytes())
+            segments = index["segments"]
+            assert isinstance(segments, list)
+            self.segments = [
+                segment
+                for segment in segments
+                if isinstance(segment, dict)
+                and (self.directory / str(segment["name"])).exists()
+            ]
+        except (OSError, ValueError, KeyError, TypeError, AssertionError):
+            _LOGGER.debug("Rebuilding the journal index of %s", self.directory)
+            self.segments = [
+                self._scan(path.name) for path in sorted(self.directory.glob("*.jsonl"))
+            ]
+
+    def _scan(self, name: str) -> dict[str, Any]:
+        """Return the index record of a segment from its entries."""
+        segment: dict[str, Any] = {"name": name, "first": None, "last": None}
+        count = 0
+        with (self.directory / name).open("rb") as file:
+            for line in file:
+                try:
+                    timestamp = json_loads_object(line)["t"]
+                except (ValueError, KeyError):
+                    continue
+                if segment["first"] is None:
+                    segment["first"] = timestamp
+                segment["last"] = timestamp
+                count += 1
+        segment["entries"] = count
+        return segment
+
+    def write(self, entries: list[dict[str, Any]]) -> None:
+        """Append entries to the current segment, rotating when it is full."""
+        if not self.segments or self._size(self.segments[-1]) >= SEGMENT_BYTES:
+            self._rotate()
+        segment = self.segments[-1]
+        lines = "".join(f"{json_dumps(entry)}\n" for entry in entries)
+        with (self.directory / segment["name"]).open("a", encoding="utf-8") as file:
+            file.write(lines)
+        if segment["first"] is None:
+            segment["first"] = entries[0]["t"]
+        segment["last"] = entries[-1]["t"]
+        segment["entries"] += len(entries)
+        self._save_index()
+
+    def _size(self, segment: dict[str, Any]) -> int:
+        """Return the size in bytes of a segment file."""
+        try:
+            return (self.directory / str(segment["name"])).stat().st_size
+        except OSError:
+            return 0
+
+    def _rotate(self) -> None:
+        """Open a new segment, deleting the oldest ones beyond MAX_SEGMENTS."""
+        sequence = (
+            int(self.segments[-1]["name"].split(".")[0]) + 1 if self.segments else 1
+        )
+        self.segments.append(
+            {"name": _segment_name(sequence), "first": None, "last": None, "entries": 0}
+        )
+        while len(self.segments) > MAX_SEGMENTS:
+            oldest = self.segments.pop(0)
+            with contextlib.suppress(FileNotFoundError):
+                (self.directory / oldest["name"]).unlink()
+
+    def _save_index(self) -> None:
+        """Replace the index file with the current index."""
+        path = self.directory / INDEX_FILE
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json_dumps({"segments": self.segments}), encoding="utf-8")
+        temporary.replace(path)
+
+    def read(self, start: float, end: float) -> list[dict[str, Any]]:
+        """Return the entries from start to end, oldest first."""
+        entries: list[dict[str, Any]] = []
+        for segment in self.segments:
+            if segment["first"] is None or segment["last"] < start:
+                continue
+            if segment["first"] > end:
+                break
+            with (self.directory / segment["name"]).open("rb") as file:
+                for line in file:
+                    try:
+                        entry = json_loads_object(line)
+                        timestamp = float(entry["t"])  # type: ignore[arg-type]
+                    except (ValueError, KeyError, TypeError):
+                        continue
+                    if start <= timestamp <= end:
+                        entries.append(entry)
+        return entries
+
+
+class EventJournal:
+    """Journal the panel events to segment files, off the event loop.
+
+    The changes of partitions, zones and devices come from the panel feed,
+    already reduced to the fields that changed, and the doorbell and chime
+    presses from the panel state. An entry has the timestamp, the
+    notification, the identifier of the object and the payload. Entries are
+    queued on the event loop and a background task hands them in batches to
+    the executor, which appends them to the current segment. The executor
+    jobs of the journal hold a lock until they return, so that a read never
+    runs alongside a write and a closing flush waits for the last batch.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, QolsysPanel: qolsys_controller, directory: Path
+    ) -> None:
+        """Set up a journal of the controller, stored in the directory."""
+        self._hass = hass
+        self._panel = QolsysPanel
+        self._writer = JournalWriter(directory)
+        self._queue: deque[dict[str, Any]] = deque(maxlen=MAX_QUEUED)
+        self._queued = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._unsubscribe: CALLBACK_TYPE | None = None
+        self.written = 0
+        self.dropped = 0
+
+    async def async_start(self, feed: PanelFeed) -> None:
+        """Load the index and journal the events of the panel.
+
+        Raises OSError when the journal directory cannot be read.
+        """
+        await self._async_add_job(self._writer.load)
+        self._unsubscribe = feed.async_subscribe(self._on_delta)
+        for notification in PANEL_EVENTS:
+            self._panel.state.register(notification, self._on_panel_event)
+        self._task = self._hass.async_create_background_task(
+            self._async_run(), "qolsys-journal"
+        )
+
+    async def async_close(self) -> None:
+        """Stop journaling and write the queued entries."""
+        for notification in PANEL_EVENTS:
+            self._panel.state.unregister(notification, self._on_panel_event)
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self._async_flush()
+
+    @callback
+    def async_append(
+        self,
+        notification: str,
+        object_id: str | None,
+        data: dict[str, Any] | None,
+        now: float | None = None,
+    ) -> None:
+        """Queue an entry for the writer."""
+        if len(self._queue) == MAX_QUEUED:
+            self.dropped += 1
+        self._queue.append(
+            {
+                "t": round(time.time() if now is None else now, 3),
+                "type": notification,
+                "id": object_id,
+                "data": data,
+            }
+        )
+        self._queued.set()
+
+    def _on_delta(self, delta: Snapshot) -> None:
+        """Journal the changes of a panel feed delta."""
+        for section, records in delta.items():
+            if section == "panel":
+                self.async_append(
+                    QolsysNotification.PANEL_STATUS_UPDATE.name, None, records
+                )
+                continue
+            for key, changes in records.items():
+                notification = (
+                    SECTION_DELETES[section]
+                    if changes is None
+                    else SECTION_NOTIFICATIONS[section]
+                )
+                self.async_append(notification.name, key, changes)
+
+    def _on_panel_event(self, event: Event) -> None:
+        """Journal a doorbell or chime press."""
+        self.async_append(event.type.name, None, event.data)
+
+    async def _async_run(self) -> None:
+        """Hand the queued entries to the executor, in batches."""
+        while True:
+            await self._queued.wait()
+            await asyncio.sleep(FLUSH_DELAY)
+            await self._async_flush()
+
+    async def _async_add_job[T](self, target: Callable[..., T], *args: Any) -> T:
+        """Run a writer job in the executor, one at a time."""
+        async with self._lock:
+            future = self._hass.async_add_executor_job(target, *args)
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # The job runs on in the executor: hold the lock until it ends.
+                with contextlib.suppress(Exception):
+                    await future
+                raise
+
+    async def _async_flush(self) -> None:
+        """Write the queued entries."""
+        self._queued.clear()
+        if not self._queue:
+            return
+        entries = list(self._queue)
+        self._queue.clear()
+        try:
+            await self._async_add_job(self._writer.write, entries)
+        except OSError as err:
+            self.dropped += len(entries)
+            _LOGGER.warning("Failed to write the panel event journal: %s", err)
+            return
+        self.written += len(entries)
+
+    async def async_read(self, start: datetime, end: datetime) -> list[dict[str, Any]]:
+        """Return the journaled entries from start to end, oldest first."""
+        return await self._async_add_job(
+            self._writer.read, start.timestamp(), end.timestamp()
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the journal statistics for diagnostics."""
+        return {
+            "segments": len(self._writer.segments),
+            "entries": sum(segment["entries"] for segment in self._writer.segments),
+            "queued": len(self._queue),
+            "written": self.written,
+            "dropped": self.dropped,
+        }
@@ -11,6 +11,7 @@ from homeassistant.components.light import ATTR_BRIGHTNESS, ColorMode, LightEnti
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
+from .command import CommandCoalescer
 from .entity import QolsysAutomationDeviceEntity
 from .types import QolsysPanelConfigEntry
 
@@ -68,6 +69,7 @@ class AutomationDevice_Light(QolsysAutomationDeviceEntity, LightEntity):
         assert service is not None
         self._service: LightService = service
         self._attr_name = f"Light{'' if endpoint == 0 else endpoint} - {self._service.automation_device.device_name}"
+        self._level_coalescer = CommandCoalescer()
 
         if self._service.supports_level():
             self._attr_color_mode = ColorMode.BRIGHTNESS
@@ -79,16 +81,30 @@ class AutomationDevice_Light(QolsysAutomationDeviceEntity, LightEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         if ATTR_BRIGHTNESS in kwargs:
             brightness = to_qolsys_level(kwargs[ATTR_BRIGHTNESS])
-            await self._service.set_level(brightness)
+            await self._async_send_command(
+                "light.set_level",
+                lambda: self._service.set_level(brightness),
+                expected_state=True,
+                coalescer=self._level_coalescer,
+            )
             return
 
-        await self._service.turn_on()
+        await self._async_send_command(
+            "light.turn_on", self._service.turn_on, expected_state=True
+        )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        await self._service.turn_off()
+        await self._async_send_command(
+            "light.turn_off", self._service.turn_off, expected_state=False
+        )
+
+    def _confirmed_state(self) -> bool | None:
+        return self._service.is_on
 
     @property
     def is_on(self) -> bool:
+        if self._optimistic_state is not None:
+            return self._optimistic_state
         return self._service.is_on
 
     @property
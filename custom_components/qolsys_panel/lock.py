@@ -63,16 +63,25 @@ class AutomationDeviceLock(QolsysAutomationDeviceEntity, LockEntity):
         if self._service.supports_open():
             self._attr_supported_features |= LockEntityFeature.OPEN
 
+    def _confirmed_state(self) -> bool | None:
+        return self._service.is_locked
+
     @property
     def is_locked(self) -> bool:
+        if self._optimistic_state is not None:
+            return self._optimistic_state
         return self._service.is_locked
 
     @property
     def is_locking(self) -> bool:
+        if self._optimistic_state is not None:
+            return False
         return self._service.is_locking
 
     @property
     def is_unlocking(self) -> bool:
+        if self._optimistic_state is not None:
+            return False
         return self._service.is_unlocking
 
     @property
@@ -88,10 +97,14 @@ class AutomationDeviceLock(QolsysAutomationDeviceEntity, LockEntity):
         return self._service.is_open
 
     async def async_lock(self, **kwargs: Any) -> None:
-        await self._service.lock()
+        await self._async_send_command(
+            "lock.lock", self._service.lock, expected_state=True
+        )
 
     async def async_unlock(self, **kwargs: Any) -> None:
-        await self._service.unlock()
+        await self._async_send_command(
+            "lock.unlock", self._service.unlock, expected_state=False
+        )
 
     async def async_open(self, **kwargs: Any) -> None:
-        await self._service.open()
+        await self._async_send_command("lock.open", self._service.open)
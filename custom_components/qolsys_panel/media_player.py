@@ -64,4 +64,6 @@ class Qolsys_MediaPlayer(QolsysPanelEntity, MediaPlayerEntity):
             _LOGGER.warning("Rejected media_id because it is not a string")
             return
 
-        await self.QolsysPanel.commands.panel.speak(media_id)
+        await self._async_run_command(
+            "speak", lambda: self.QolsysPanel.commands.panel.speak(media_id)
+        )
@@ -0,0 +1,262 @@
+"""Ring buffer of the recent panel events."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+import time
+from typing import Any
+
+from qolsys_controller import qolsys_controller
+from qolsys_controller.enum_qolsys import (
+    PartitionAlarmState,
+    PartitionAlarmType,
+    PartitionError,
+    PartitionSystemStatus,
+    QolsysNotification,
+    ZoneStatus,
+)
+from qolsys_controller.observable import Event
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from .feed import PanelFeed, Snapshot
+from .registry import panel_lookup
+
+# Events kept per panel, 16 bytes each.
+DEFAULT_CAPACITY = 4096
+
+# Object and partition identifier of an event without one.
+NO_ID = -1
+
+# Event types, with the values their code stands for. Code 0 is no value,
+# such as a cleared alarm; a value missing from the table is UNKNOWN_CODE.
+EVENT_CODES: dict[str, tuple[str, ...]] = {
+    "zone_status": ("", *(status.name.lower() for status in ZoneStatus)),
+    "partition_status": (
+        "",
+        *(status.name.lower() for status in PartitionSystemStatus),
+    ),
+    "alarm_state": ("", *(state.name.lower() for state in PartitionAlarmState)),
+    "alarm_type": ("", *(alarm.name.lower() for alarm in PartitionAlarmType)),
+    "last_error": ("", *(error.value for error in PartitionError)),
+    "connection": ("", "disconnected", "connected"),
+    "doorbell": ("",),
+    "chime": ("",),
+}
+EVENT_TYPES = tuple(EVENT_CODES)
+UNKNOWN_CODE = 255
+
+# Event type of the snapshot record fields kept, by section.
+SECTION_FIELDS: dict[str, dict[str, str]] = {
+    "zones": {"status": "zone_status"},
+    "partitions": {
+        "status": "partition_status",
+        "alarm_state": "alarm_state",
+        "alarm_array": "alarm_type",
+        "last_error": "last_error",
+    },
+}
+
+# Event type of the panel notifications kept.
+PANEL_EVENTS = {
+    QolsysNotification.PANEL_DOORBELL: "doorbell",
+    QolsysNotification.PANEL_CHIME: "chime",
+}
+
+_TYPE_CODES = {event_type: code for code, event_type in enumerate(EVENT_TYPES)}
+_VALUE_CODES = {
+    event_type: {value: code for code, value in enumerate(values)}
+    for event_type, values in EVENT_CODES.items()
+}
+
+
+def _int_id(value: Any) -> int:
+    """Return a numeric panel identifier, NO_ID if not numeric."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return NO_ID
+
+
+@dataclass(slots=True)
+class RecentEvent:
+    """A decoded event of the ring buffer."""
+
+    timestamp: float
+    event_type: str
+    object_id: int
+    partition_id: int
+    value: str | None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the event for a service response."""
+        return {
+            "time": datetime.fromtimestamp(self.timestamp, UTC).isoformat(),
+            "type": self.event_type,
+            "id": None if self.object_id == NO_ID else str(self.object_id),
+            "partition": None if self.partition_id == NO_ID else str(self.partition_id),
+            "value": self.value,
+        }
+
+
+class RecentEvents:
+    """Fixed capacity ring buffer of the recent events of a panel.
+
+    Each event is a timestamp, an event type, the identifier of its zone or
+    partition, the partition of the zone and a small code of the new value,
+    kept in arrays allocated up front. Once full, each event overwrites the
+    oldest one.
+
+    The changes of zone status and of partition status, alarm and error
+    come from the panel feed, and the doorbell and chime presses from the
+    panel state.
+    """
+
+    def __init__(
+        self, QolsysPanel: qolsys_controller, capacity: int = DEFAULT_CAPACITY
+    ) -> None:
+        """Set up an empty buffer for the controller."""
+        self._panel = QolsysPanel
+        self.capacity = capacity
+        self._timestamps = array("d", [0.0]) * capacity
+        self._types = array("B", [0]) * capacity
+        self._object_ids = array("i", [NO_ID]) * capacity
+        self._partition_ids = array("h", [NO_ID]) * capacity
+        self._codes = array("B", [0]) * capacity
+        # Index of the next event written and number of events kept.
+        self._head = 0
+        self._count = 0
+        self._unsubscribe: CALLBACK_TYPE | None = None
+
+    def __len__(self) -> int:
+        """Return the number of events kept."""
+        return self._count
+
+    @callback
+    def async_start(self, feed: PanelFeed) -> None:
+        """Keep the events of the panel."""
+        self._unsubscribe = feed.async_subscribe(self._on_delta)
+        for notification in PANEL_EVENTS:
+            self._panel.state.register(notification, self._on_panel_event)
+
+    @callback
+    def async_close(self) -> None:
+        """Stop keeping events."""
+        for notification in PANEL_EVENTS:
+            self._panel.state.unregister(notification, self._on_panel_event)
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    def add(
+        self,
+        event_type: str,
+        object_id: int = NO_ID,
+        partition_id: int = NO_ID,
+        value: str | None = None,
+        now: float | None = None,
+    ) -> None:
+        """Add an event, overwriting the oldest one when full."""
+        index = self._head
+        self._timestamps[index] = time.time() if now is None else now
+        self._types[index] = _TYPE_CODES[event_type]
+        self._object_ids[index] = object_id
+        self._partition_ids[index] = partition_id
+        self._codes[index] = (
+            0 if value is None else _VALUE_CODES[event_type].get(value, UNKNOWN_CODE)
+        )
+        self._head = (index + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def _on_delta(self, delta: Snapshot) -> None:
+        """Add the events of a panel feed delta."""
+        if (panel := delta.get("panel")) is not None:
+            self.add(
+                "connection",
+                value="connected" if panel["connected"] else "disconnected",
+            )
+        for section, fields in SECTION_FIELDS.items():
+            for key, changes in delta.get(section, {}).items():
+                if not changes:
+                    continue
+                object_id = _int_id(key)
+                partition_id = object_id
+                if section == "zones":
+                    zone = panel_lookup(self._panel).zone(key)
+                    partition_id = NO_ID if zone is None else _int_id(zone.partition_id)
+                for field, event_type in fields.items():
+                    if field not in changes:
+                        continue
+                    values = changes[field]
+                    if not isinstance(values, list):
+                        values = [values]
+                    for value in values or [None]:
+                        self.add(event_type, object_id, partition_id, value)
+
+    def _on_panel_event(self, event: Event) -> None:
+        """Add a doorbell or chime press."""
+        self.add(PANEL_EVENTS[event.type])
+
+    def _decode(self, index: int) -> RecentEvent:
+        """Return the event at an index of the arrays."""
+        event_type = EVENT_TYPES[self._types[index]]
+        code = self._codes[index]
+        value: str | None = None
+        if code == UNKNOWN_CODE:
+            value = "unknown"
+        elif code:
+            value = EVENT_CODES[event_type][code]
+        return RecentEvent(
+            timestamp=self._timestamps[index],
+            event_type=event_type,
+            object_id=self._object_ids[index],
+            partition_id=self._partition_ids[index],
+            value=value,
+        )
+
+    def _newest_first(self) -> Iterator[int]:
+        """Yield the indexes of the events kept, newest first."""
+        for offset in range(1, self._count + 1):
+            yield (self._head - offset) % self.capacity
+
+    def query(
+        self,
+        *,
+        partition_id: int | None = None,
+        zone_id: int | None = None,
+        event_types: set[str] | None = None,
+        limit: int = DEFAULT_CAPACITY,
+    ) -> list[RecentEvent]:
+        """Return the most recent events matching every criterion, oldest first.
+
+        A partition matches its own events and those of its zones; a zone
+        matches its own events only.
+        """
+        type_codes = (
+            None
+            if not event_types
+            else {_TYPE_CODES[event_type] for event_type in event_types}
+        )
+        zone_code = _TYPE_CODES["zone_status"]
+        events: list[RecentEvent] = []
+        for index in self._newest_first():
+            if len(events) >= limit:
+                break
+            if type_codes is not None and self._types[index] not in type_codes:
+                continue
+            if partition_id is not None and self._partition_ids[index] != partition_id:
+                continue
+            if zone_id is not None and (
+                self._types[index] != zone_code or self._object_ids[index] != zone_id
+            ):
+                continue
+            events.append(self._decode(index))
+        events.reverse()
+        return events
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the buffer usage for diagnostics."""
+        return {"capacity": self.capacity, "events": self._count}
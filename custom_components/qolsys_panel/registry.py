@@ -0,0 +1,182 @@
+"""Lookup tables for the partitions, zones, devices and scenes of a panel."""
+
+from __future__ import annotations
+
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from qolsys_controller import qolsys_controller
+from qolsys_controller.automation.device import QolsysAutomationDevice
+from qolsys_controller.enum_qolsys import QolsysNotification
+from qolsys_controller.observable import Event
+from qolsys_controller.partition import QolsysPartition
+from qolsys_controller.scene import QolsysScene
+from qolsys_controller.state import QolsysState
+from qolsys_controller.zone import QolsysZone
+
+from homeassistant.core import callback
+
+# Kind of the objects each membership notification is about.
+MEMBERSHIP_KINDS: dict[QolsysNotification, str] = {
+    QolsysNotification.PARTITION_ADD: "partition",
+    QolsysNotification.PARTITION_DELETE: "partition",
+    QolsysNotification.ZONE_ADD: "zone",
+    QolsysNotification.ZONE_DELETE: "zone",
+    QolsysNotification.AUTOMATION_ADD: "device",
+    QolsysNotification.AUTOMATION_DELETE: "device",
+    QolsysNotification.SCENE_ADD: "scene",
+    QolsysNotification.SCENE_DELETE: "scene",
+}
+
+# Membership notifications of an added object.
+ADD_NOTIFICATIONS = frozenset(
+    {
+        QolsysNotification.PARTITION_ADD,
+        QolsysNotification.ZONE_ADD,
+        QolsysNotification.AUTOMATION_ADD,
+        QolsysNotification.SCENE_ADD,
+    }
+)
+
+# Attribute of the id of the objects of each kind, and the suffix of their
+# unique_id after the unique_id of the entry.
+KIND_IDS: dict[str, tuple[str, str]] = {
+    "partition": ("id", "_partition"),
+    "zone": ("zone_id", "_zone"),
+    "device": ("virtual_node_id", "_autdev_"),
+    "scene": ("scene_id", "_scene_"),
+}
+
+# Started registries by controller, see panel_lookup.
+_REGISTRIES: WeakKeyDictionary[qolsys_controller, PanelRegistry] = WeakKeyDictionary()
+
+
+class PanelRegistry:
+    """Partitions, zones, devices and scenes of a panel by id and unique_id.
+
+    The controller state finds an object by scanning its list. The registry
+    keeps a dictionary per kind instead, filled from the controller lists on
+    start; an added or deleted object is then inserted or removed alone. The
+    unique_id of an object is the identifier of its device: the unique_id of
+    the entry followed by _partition<id>, _zone<id>, _autdev_<id> or
+    _scene_<id>.
+    """
+
+    def __init__(self, QolsysPanel: qolsys_controller, unique_id: str) -> None:
+        """Set up empty tables for the controller of an entry."""
+        self._panel = QolsysPanel
+        self._unique_id = unique_id
+        self._partitions: dict[str, QolsysPartition] = {}
+        self._zones: dict[str, QolsysZone] = {}
+        self._devices: dict[str, QolsysAutomationDevice] = {}
+        self._scenes: dict[str, QolsysScene] = {}
+        # unique_id -> (kind, id).
+        self._unique_ids: dict[str, tuple[str, str]] = {}
+
+    @callback
+    def async_start(self) -> None:
+        """Fill the tables and follow the objects added and deleted."""
+        state = self._panel.state
+        for notification in MEMBERSHIP_KINDS:
+            state.register(notification, self._on_membership)
+        for kind in KIND_IDS:
+            for item in self._objects(kind):
+                self._insert(kind, item)
+        _REGISTRIES[self._panel] = self
+
+    @callback
+    def async_close(self) -> None:
+        """Stop following the panel and empty the tables."""
+        state = self._panel.state
+        for notification in MEMBERSHIP_KINDS:
+            state.unregister(notification, self._on_membership)
+        if _REGISTRIES.get(self._panel) is self:
+            del _REGISTRIES[self._panel]
+        for table in (self._partitions, self._zones, self._devices, self._scenes):
+            table.clear()
+        self._unique_ids.clear()
+
+    def _table(self, kind: str) -> dict[str, Any]:
+        """Return the table of a kind."""
+        if kind == "partition":
+            return self._partitions
+        if kind == "zone":
+            return self._zones
+        if kind == "device":
+            return self._devices
+        return self._scenes
+
+    def _objects(self, kind: str) -> list[Any]:
+        """Return the controller list of a kind."""
+        state = self._panel.state
+        if kind == "partition":
+            return state.partitions
+        if kind == "zone":
+            return state.zones
+        if kind == "device":
+            return state.automation_devices
+        return state.scenes
+
+    def _insert(self, kind: str, item: Any) -> None:
+        """Add an object to the table of its kind and to the unique_ids."""
+        object_id = getattr(item, KIND_IDS[kind][0])
+        self._table(kind)[object_id] = item
+        self._unique_ids[self.unique_id(kind, object_id)] = (kind, object_id)
+
+    def _remove(self, kind: str, object_id: str) -> None:
+        """Remove an object from the table of its kind and from the unique_ids."""
+        self._table(kind).pop(object_id, None)
+        self._unique_ids.pop(self.unique_id(kind, object_id), None)
+
+    def _on_membership(self, event: Event) -> None:
+        """Insert an added object, or remove a deleted one."""
+        kind = MEMBERSHIP_KINDS[event.type]
+        object_id = str(event.data["id"])
+        self._remove(kind, object_id)
+        if event.type in ADD_NOTIFICATIONS:
+            # The payload is a dictionary: find the object in the controller
+            # list, sorted by id. Objects are mostly added in id order, so the
+            # search starts from its end.
+            attribute = KIND_IDS[kind][0]
+            for item in reversed(self._objects(kind)):
+                if getattr(item, attribute) == object_id:
+                    self._insert(kind, item)
+                    break
+
+    def partition(self, partition_id: str) -> QolsysPartition | None:
+        """Return a partition by id."""
+        return self._partitions.get(partition_id)
+
+    def zone(self, zone_id: str) -> QolsysZone | None:
+        """Return a zone by id."""
+        return self._zones.get(zone_id)
+
+    def automation_device(self, virtual_node_id: str) -> QolsysAutomationDevice | None:
+        """Return an automation device by virtual node id."""
+        return self._devices.get(virtual_node_id)
+
+    def scene(self, scene_id: str) -> QolsysScene | None:
+        """Return a scene by id."""
+        return self._scenes.get(scene_id)
+
+    def unique_id(self, kind: str, object_id: str) -> str:
+        """Return the unique_id of the object of a kind with the given id."""
+        return f"{self._unique_id}{KIND_IDS[kind][1]}{object_id}"
+
+    def resolve(self, unique_id: str) -> tuple[str, str] | None:
+        """Return the kind and id of the object with the given unique_id.
+
+        The kind is partition, zone, device or scene.
+        """
+        return self._unique_ids.get(unique_id)
+
+
+def panel_lookup(QolsysPanel: qolsys_controller) -> PanelRegistry | QolsysState:
+    """Return the registry of a controller, or its state until one is started.
+
+    Both find partitions, zones, automation devices and scenes by id with the
+    same methods.
+    """
+    if (registry := _REGISTRIES.get(QolsysPanel)) is not None:
+        return registry
+    return QolsysPanel.state
@@ -0,0 +1,340 @@
+"""Runtime state kept alongside the Qolsys controller for a config entry."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+import time
+from typing import Any
+
+from qolsys_controller import qolsys_controller
+from qolsys_controller.enum_qolsys import PartitionArmingType
+from qolsys_controller.errors import QolsysError
+from qolsys_controller.observable import Event, QolsysObservable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.hass_dict import HassKey
+
+from .aggregator import StatisticsAggregator
+from .command import CommandDeadlines, CommandPriority, CommandScheduler
+from .const import DOMAIN
+from .feed import (
+    ADD_SECTIONS,
+    DELETE_SECTIONS,
+    SECTION_NOTIFICATIONS,
+    UPDATE_SECTIONS,
+    PanelFeed,
+)
+from .flapping import FlappingDetector
+from .journal import EventJournal
+from .recent_events import RecentEvents
+from .registry import PanelRegistry, panel_lookup
+from .utils import RollingStats
+from .zone_index import ZoneIndex, zone_sort_key
+
+DATA_RUNTIME: HassKey[dict[str, QolsysPanelRuntime]] = HassKey(DOMAIN)
+
+
+class UpdateStats:
+    """Notification and state write statistics of the entities of a platform."""
+
+    def __init__(self) -> None:
+        """Set up empty statistics."""
+        self.entities = 0
+        self.subscriptions = 0
+        self.notifications = 0
+        self.writes = 0
+        self.suppressed_writes = 0
+        self.deadband_skips = 0
+        self.write_time = RollingStats()
+
+    def as_dict(self, uptime: float) -> dict[str, Any]:
+        """Return the statistics for diagnostics."""
+        return {
+            "entities": self.entities,
+            "subscriptions": self.subscriptions,
+            "notifications": self.notifications,
+            "notifications_per_minute": round(
+                self.notifications * 60 / max(uptime, 1.0), 2
+            ),
+            "writes": self.writes,
+            "suppressed_writes": self.suppressed_writes,
+            "deadband_skips": self.deadband_skips,
+            "write_time": self.write_time.as_dict(),
+        }
+
+
+class ConnectionStats:
+    """Connection losses to the panel and how long they lasted."""
+
+    def __init__(self) -> None:
+        """Set up statistics for a connected panel."""
+        self.reconnects = 0
+        self.outages = RollingStats()
+        self._lost_at: float | None = None
+
+    def lost(self) -> None:
+        """Record that the connection to the panel was lost."""
+        if self._lost_at is None:
+            self.reconnects += 1
+            self._lost_at = time.monotonic()
+
+    def restored(self) -> None:
+        """Record that the connection to the panel was restored."""
+        if self._lost_at is not None:
+            self.outages.add(time.monotonic() - self._lost_at)
+            self._lost_at = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for diagnostics."""
+        return {
+            "connected": self._lost_at is None,
+            "reconnects": self.reconnects,
+            "current_outage_s": None
+            if self._lost_at is None
+            else round(time.monotonic() - self._lost_at, 1),
+            "outage_duration": self.outages.as_dict(),
+        }
+
+
+# Device identifier of the objects of each snapshot section, after the
+# unique_id of the entry.
+DEVICE_PREFIXES = {"partitions": "_partition", "zones": "_zone", "devices": "_autdev_"}
+
+
+class EventHistory:
+    """Recent controller events per device, for device diagnostics.
+
+    Once started, the history observes each partition, zone and automation
+    device once, whatever the number of entities of its device.
+    """
+
+    def __init__(self, size: int = 20) -> None:
+        """Set up an empty history keeping the last `size` events per device."""
+        self._size = size
+        self._events: dict[str, deque[tuple[datetime, Event]]] = {}
+        self._panel: qolsys_controller | None = None
+        self._unique_id = ""
+        # Observed partitions, zones and devices by (section, id).
+        self._followed: dict[tuple[str, str], QolsysObservable] = {}
+
+    @callback
+    def async_start(self, QolsysPanel: qolsys_controller, unique_id: str) -> None:
+        """Record the events of every object of the panel of an entry."""
+        self._panel = QolsysPanel
+        self._unique_id = unique_id
+        state = QolsysPanel.state
+        for notification in (*ADD_SECTIONS, *DELETE_SECTIONS):
+            state.register(notification, self._on_membership)
+        for section, records in (
+            ("partitions", state.partitions),
+            ("zones", state.zones),
+            ("devices", state.automation_devices),
+        ):
+            for record in records:
+                self._follow(section, str(record.to_dict_event()["id"]))
+
+    @callback
+    def async_close(self) -> None:
+        """Stop recording events."""
+        if self._panel is None:
+            return
+        state = self._panel.state
+        for notification in (*ADD_SECTIONS, *DELETE_SECTIONS):
+            state.unregister(notification, self._on_membership)
+        for section, key in list(self._followed):
+            self._unfollow(section, key)
+        self._panel = None
+
+    def _follow(self, section: str, key: str) -> None:
+        """Observe updates of a partition, zone or device."""
+        assert self._panel is not None
+        state = panel_lookup(self._panel)
+        observable: QolsysObservable | None
+        if section == "partitions":
+            observable = state.partition(key)
+        elif section == "zones":
+            observable = state.zone(key)
+        else:
+            observable = state.automation_device(key)
+        if observable is not None:
+            observable.register(SECTION_NOTIFICATIONS[section], self._on_update)
+            self._followed[section, key] = observable
+
+    def _unfollow(self, section: str, key: str) -> None:
+        """Stop observing updates of a partition, zone or device."""
+        if (observable := self._followed.pop((section, key), None)) is not None:
+            observable.unregister(SECTION_NOTIFICATIONS[section], self._on_update)
+
+    def _on_membership(self, event: Event) -> None:
+        """Follow an added object, forget a deleted one."""
+        key = str(event.data["id"])
+        if (section := ADD_SECTIONS.get(event.type)) is not None:
+            self._unfollow(section, key)
+            self._follow(section, key)
+            return
+        section = DELETE_SECTIONS[event.type]
+        self._unfollow(section, key)
+        self._events.pop(f"{self._unique_id}{DEVICE_PREFIXES[section]}{key}", None)
+
+    def _on_update(self, event: Event) -> None:
+        """Record an update for the device of its object."""
+        prefix = DEVICE_PREFIXES[UPDATE_SECTIONS[event.type]]
+        self.record(f"{self._unique_id}{prefix}{event.data['id']}", event)
+
+    def record(self, device: str, event: Event) -> None:
+        """Record an event for the device with the given identifier."""
+        if (events := self._events.get(device)) is None:
+            events = self._events[device] = deque(maxlen=self._size)
+        events.append((datetime.now(UTC), event))
+
+    def as_list(self, device: str) -> list[dict[str, Any]]:
+        """Return the recent events of a device for diagnostics, oldest first."""
+        return [
+            {
+                "time": timestamp.isoformat(),
+                "notification": event.type.name,
+                "state": event.data.get("state"),
+            }
+            for timestamp, event in self._events.get(device, ())
+        ]
+
+
+class QolsysPanelRuntime:
+    """State the integration keeps next to the controller for one config entry."""
+
+    def __init__(
+        self, optimistic: bool = False, deadband_max_interval: float | None = None
+    ) -> None:
+        """Set up the runtime state.
+
+        Without deadband_max_interval, the sensor deadbands are disabled.
+        """
+        self.started = time.monotonic()
+        self.optimistic = optimistic
+        self.deadband_max_interval = deadband_max_interval
+        self.confirmation_latency = RollingStats()
+        self.optimistic_rollbacks = 0
+        self.coalesced_commands = 0
+        self.scheduler = CommandScheduler()
+        self.deadlines = CommandDeadlines()
+        self.connection = ConnectionStats()
+        self.platforms: dict[str, UpdateStats] = {}
+        # Update statistics of each entity, by unique_id.
+        self.entity_stats: dict[str, UpdateStats] = {}
+        self.events = EventHistory()
+        # Lookup tables of the panel objects, set once the panel is up.
+        self.registry: PanelRegistry | None = None
+        # Snapshot deltas for WebSocket subscribers, set once the panel is up.
+        self.feed: PanelFeed | None = None
+        # Zone indexes for query_zones, set once the panel is up.
+        self.zones: ZoneIndex | None = None
+        # Update rates of the zones, set once the panel is up.
+        self.flapping: FlappingDetector | None = None
+        # Hourly external statistics, set once the panel is up when enabled.
+        self.statistics: StatisticsAggregator | None = None
+        # Journal of the panel events, set once the panel is up when enabled.
+        self.journal: EventJournal | None = None
+        # Ring buffer of the recent panel events, set once the panel is up.
+        self.recent_events: RecentEvents | None = None
+
+    @property
+    def uptime(self) -> float:
+        """Return the seconds since the entry was set up."""
+        return time.monotonic() - self.started
+
+    def platform_stats(self, platform: str) -> UpdateStats:
+        """Return the update statistics of an entity platform."""
+        if (stats := self.platforms.get(platform)) is None:
+            stats = self.platforms[platform] = UpdateStats()
+        return stats
+
+    async def async_run_command[T](
+        self,
+        command_type: str,
+        priority: CommandPriority,
+        command: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Run a panel command by priority, within its adaptive deadline."""
+        return await self.scheduler.async_run(
+            priority, lambda: self.deadlines.async_run(command_type, command)
+        )
+
+    async def async_arm(
+        self,
+        partition_id: str,
+        arm_mode: PartitionArmingType,
+        send: Callable[[], Awaitable[Any]],
+    ) -> None:
+        """Send an arming command of the alarm entity or of a service.
+
+        Arming fails at once, without a round trip to the panel, when the
+        controller would refuse it: open zones that need a bypass while auto
+        bypass is disabled. Failures are journaled when the journal is enabled.
+
+        Raises:
+            HomeAssistantError: A zone needs a bypass, or send raised it.
+        """
+        try:
+            self._check_bypass(partition_id, arm_mode)
+            await send()
+        except (HomeAssistantError, QolsysError) as err:
+            if self.journal is not None:
+                self.journal.async_append(
+                    "ARM_FAILURE",
+                    partition_id,
+                    {"arm_mode": arm_mode.name, "error": str(err)},
+                )
+            raise
+
+    def _check_bypass(self, partition_id: str, arm_mode: PartitionArmingType) -> None:
+        """Refuse to arm a partition with zones that need a bypass.
+
+        Raises:
+            HomeAssistantError: A zone needs a bypass, with auto bypass disabled.
+        """
+        if self.zones is not None and (
+            bypass := self.zones.bypass_required_zones(partition_id)
+        ):
+            raise HomeAssistantError(
+                f"{arm_mode.name}: Zone bypass required:"
+                f"{sorted(bypass, key=zone_sort_key)}"
+            )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return runtime metrics for diagnostics."""
+        uptime = self.uptime
+        return {
+            "uptime_s": round(uptime),
+            "connection": self.connection.as_dict(),
+            "platforms": {
+                platform: stats.as_dict(uptime)
+                for platform, stats in sorted(self.platforms.items())
+            },
+            "optimistic": {
+                "enabled": self.optimistic,
+                "confirmation_latency": self.confirmation_latency.as_dict(),
+                "rollbacks": self.optimistic_rollbacks,
+            },
+            "commands": {
+                "coalesced": self.coalesced_commands,
+                "scheduler": self.scheduler.as_dict(),
+                "round_trip_times": self.deadlines.as_dict(),
+            },
+            "flapping": None if self.flapping is None else self.flapping.as_dict(),
+            "statistics": None
+            if self.statistics is None
+            else self.statistics.as_dict(),
+            "journal": None if self.journal is None else self.journal.as_dict(),
+            "recent_events": None
+            if self.recent_events is None
+            else self.recent_events.as_dict(),
+        }
+
+
+@callback
+def async_get_runtime(hass: HomeAssistant, entry_id: str) -> QolsysPanelRuntime | None:
+    """Return the runtime state of a loaded config entry."""
+    return hass.data.get(DATA_RUNTIME, {}).get(entry_id)
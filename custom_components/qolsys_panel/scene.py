@@ -11,6 +11,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .entity import QolsysPanelEntity
+from .registry import panel_lookup
 from .types import QolsysPanelConfigEntry
 
 PARALLEL_UPDATES = 0
@@ -45,10 +46,13 @@ class QolsysPanelScene(Scene, QolsysPanelEntity):
         super().__init__(QolsysPanel, unique_id)
         self._attr_unique_id = f"{unique_id}_scene_{scene_id}"
         self._scene_id = scene_id
-        scene = QolsysPanel.state.scene(scene_id)
+        scene = panel_lookup(QolsysPanel).scene(scene_id)
         assert scene is not None
         self._attr_name = f"Qolsys Panel - {scene.name}"
 
     async def async_activate(self, **kwargs: Any) -> None:
         """Activate scene. Try to get entities into requested state."""
-        await self.QolsysPanel.commands.panel.execute_scene(self._scene_id)
+        await self._async_run_command(
+            "execute_scene",
+            lambda: self.QolsysPanel.commands.panel.execute_scene(self._scene_id),
+        )
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 import logging
-from typing import cast
+import time
+from typing import Any, cast
 
 from qolsys_controller import qolsys_controller
 from qolsys_controller.automation.service_battery import BatteryService
@@ -17,21 +19,33 @@ from qolsys_controller.enum_qolsys import (
 )
 from qolsys_controller.observable import Event
 
+from homeassistant.components.recorder.models import (
+    StatisticMeanType,
+    StatisticMetaData,
+)
 from homeassistant.components.sensor import (
+    UNIT_CONVERTERS,
     SensorDeviceClass,
     SensorEntity,
     SensorStateClass,
 )
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util, slugify
 
 from . import QolsysPanelConfigEntry
+from .aggregator import StatisticsAggregator
+from .const import DOMAIN, SENSOR_DEADBANDS
 from .entity import (
     QolsysAutomationDeviceEntity,
+    QolsysPanelEntity,
     QolsysPartitionEntity,
     QolsysZoneEntity,
 )
+from .runtime import async_get_runtime
+from .zone_index import SUMMARY_KINDS, ZoneIndex, zone_sort_key
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,12 +63,22 @@ async def async_setup_entry(
     assert unique_id is not None
 
     entities: list[SensorEntity] = []
+    runtime = async_get_runtime(hass, config_entry.entry_id)
 
     # Add Partition Sensors
     for partition in QolsysPanel.state.partitions:
         # Partition Last Error Sensor
         entities.append(Partition_LastError(QolsysPanel, partition.id, unique_id))
 
+        # Partition Zone Summary Sensors
+        if runtime is not None and runtime.zones is not None:
+            entities.extend(
+                Partition_ZoneSummary(
+                    QolsysPanel, partition.id, unique_id, runtime.zones, kind
+                )
+                for kind in SUMMARY_KINDS
+            )
+
     # Add Zone Sensors
     for zone in QolsysPanel.state.zones:
         if zone.is_latest_dbm_enabled():
@@ -169,10 +193,177 @@ async def async_setup_entry(
     )
 
 
-class ZoneSensor_LatestDBM(QolsysZoneEntity, SensorEntity):
+class QolsysDeadbandSensor(QolsysPanelEntity, SensorEntity):
+    """A numeric sensor skipping the state writes of small value changes.
+
+    A notification is written once the value moved from the last written one
+    by the deadband of the sensor kind, see SENSOR_DEADBANDS, or when the
+    availability changed. A skipped value is written at the latest
+    deadband_max_interval seconds after the last write. The deadbands apply
+    while enabled in the options.
+    """
+
+    # Kind of the sensor in SENSOR_DEADBANDS, None for none.
+    _deadband_kind: str | None = None
+    # Availability and value of the last state write, and its monotonic time.
+    _written: tuple[bool, float | None] | None = None
+    _written_at: float = 0.0
+    _cancel_deadband_write: CALLBACK_TYPE | None = None
+
+    def _deadband_value(self) -> float | None:
+        """Return the value of the sensor as a number."""
+        value = self.native_value
+        return float(value) if isinstance(value, int | float) else None
+
+    def _within_deadband(self, max_interval: float) -> bool:
+        """Return whether the current value is close to the last written one."""
+        if self._written is None or self._deadband_kind is None:
+            return False
+        available, written = self._written
+        value = self._deadband_value()
+        if self.available != available or value is None or written is None:
+            return available == self.available and value == written
+        if time.monotonic() - self._written_at >= max_interval:
+            return False
+        absolute, relative = SENSOR_DEADBANDS[self._deadband_kind]
+        delta = abs(value - written)
+        return not (
+            (absolute and delta >= absolute)
+            or (relative and delta >= relative * abs(written))
+        )
+
+    def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
+        """Schedule a state write, unless the value stays within the deadband."""
+        if (
+            self._deadband_kind is None
+            or (runtime := self._runtime) is None
+            or (max_interval := runtime.deadband_max_interval) is None
+            or not self._within_deadband(max_interval)
+        ):
+            super().schedule_update_ha_state(force_refresh)
+            return
+        for stats in self._update_stats:
+            stats.notifications += 1
+            stats.deadband_skips += 1
+        self.hass.loop.call_soon_threadsafe(
+            self._async_schedule_deadband_write, max_interval
+        )
+
+    @callback
+    def _async_schedule_deadband_write(self, max_interval: float) -> None:
+        """Write a skipped value once the maximum interval has passed."""
+        if self._cancel_deadband_write is None:
+            self._cancel_deadband_write = async_call_later(
+                self.hass,
+                max(self._written_at + max_interval - time.monotonic(), 0),
+                self._async_deadband_write,
+            )
+
+    @callback
+    def _async_deadband_write(self, _now: datetime) -> None:
+        """Write the value skipped within the deadband."""
+        self._cancel_deadband_write = None
+        # Skipped by Home Assistant once the entity is removed.
+        self._async_write_ha_state_from_call_soon_threadsafe()
+
+    @callback
+    def _async_write_ha_state(self) -> None:
+        """Write the state and remember it as the deadband reference."""
+        if self._cancel_deadband_write is not None:
+            self._cancel_deadband_write()
+            self._cancel_deadband_write = None
+        super()._async_write_ha_state()
+        self._written = (self.available, self._deadband_value())
+        self._written_at = time.monotonic()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop observing changes and drop a pending skipped write."""
+        await super().async_will_remove_from_hass()
+        if self._cancel_deadband_write is not None:
+            self._cancel_deadband_write()
+            self._cancel_deadband_write = None
+
+
+class QolsysStatisticsSensor(QolsysPanelEntity, SensorEntity):
+    """A sensor whose values are aggregated into hourly external statistics.
+
+    While enabled in the options, every notified value is added to the
+    series qolsys_panel:<unique_id> of the entry aggregator, and the sensor
+    has no state class, so that the recorder does not compile statistics of
+    its own for it.
+    """
+
+    @property
+    def _aggregator(self) -> StatisticsAggregator | None:
+        """Return the aggregator of the entry, if enabled."""
+        if (runtime := self._runtime) is None:
+            return None
+        return runtime.statistics
+
+    @property
+    def _statistic_state_class(self) -> SensorStateClass | str | None:
+        """Return the state class of the values."""
+        return getattr(self, "_attr_state_class", None)
+
+    @property
+    def state_class(self) -> SensorStateClass | str | None:
+        """Return no state class while the values go to external statistics."""
+        if self._aggregator is not None:
+            return None
+        return self._statistic_state_class
+
+    def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
+        """Add the notified value to the statistics and schedule a state write."""
+        if (aggregator := self._aggregator) is not None and isinstance(
+            value := self.native_value, int | float
+        ):
+            self.hass.loop.call_soon_threadsafe(
+                self._async_record, aggregator, dt_util.utcnow(), float(value)
+            )
+        super().schedule_update_ha_state(force_refresh)
+
+    @callback
+    def _async_record(
+        self, aggregator: StatisticsAggregator, now: datetime, value: float
+    ) -> None:
+        """Add a value to the series of the sensor, set up on first use."""
+        statistic_id = f"{DOMAIN}:{slugify(self.unique_id)}"
+        if not aggregator.has_series(statistic_id):
+            aggregator.async_add_series(self._statistic_metadata(statistic_id))
+        aggregator.async_record(statistic_id, now, value)
+
+    def _statistic_metadata(self, statistic_id: str) -> StatisticMetaData:
+        """Return the metadata of the statistic of the sensor."""
+        has_sum = self._statistic_state_class in (
+            SensorStateClass.TOTAL,
+            SensorStateClass.TOTAL_INCREASING,
+        )
+        unit = self.native_unit_of_measurement
+        unit_class: str | None = None
+        if (converter := UNIT_CONVERTERS.get(self.device_class)) is not None:
+            if unit in converter.VALID_UNITS:
+                unit_class = converter.UNIT_CLASS
+        state = self.hass.states.get(self.entity_id)
+        return StatisticMetaData(
+            mean_type=StatisticMeanType.NONE
+            if has_sum
+            else StatisticMeanType.ARITHMETIC,
+            has_sum=has_sum,
+            name=None if state is None else state.name,
+            source=DOMAIN,
+            statistic_id=statistic_id,
+            unit_class=unit_class,
+            unit_of_measurement=unit,
+        )
+
+
+class ZoneSensor_LatestDBM(
+    QolsysStatisticsSensor, QolsysDeadbandSensor, QolsysZoneEntity, SensorEntity
+):
     """A sensor entity for a zone latest DBM."""
 
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _deadband_kind = "signal_strength"
 
     def __init__(
         self, QolsysPanel: qolsys_controller, zone_id: str, unique_id: str
@@ -215,9 +406,13 @@ class ZoneSensor_AverageDBM(QolsysZoneEntity, SensorEntity):
         return self._zone.averagedBm
 
 
-class ZoneSensor_PowerG_Temperature(QolsysZoneEntity, SensorEntity):
+class ZoneSensor_PowerG_Temperature(
+    QolsysDeadbandSensor, QolsysZoneEntity, SensorEntity
+):
     """A sensor entity for PowerG Temperature."""
 
+    _deadband_kind = "temperature"
+
     def __init__(
         self, QolsysPanel: qolsys_controller, zone_id: str, unique_id: str
     ) -> None:
@@ -280,10 +475,11 @@ class ZoneSensor_BatteryLevel(QolsysZoneEntity, SensorEntity):
         return self._zone.powerg_battery_level
 
 
-class ZoneSensor_BatteryVoltage(QolsysZoneEntity, SensorEntity):
+class ZoneSensor_BatteryVoltage(QolsysDeadbandSensor, QolsysZoneEntity, SensorEntity):
     """A sensor entity for a zone battery voltage value."""
 
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _deadband_kind = "battery_voltage"
 
     def __init__(
         self, QolsysPanel: qolsys_controller, zone_id: str, unique_id: str
@@ -332,7 +528,9 @@ class AutomationDevice_BatteryValue(QolsysAutomationDeviceEntity, SensorEntity):
         return self._service.battery_level
 
 
-class AutomationDevice_Sensor(QolsysAutomationDeviceEntity, SensorEntity):
+class AutomationDevice_Sensor(
+    QolsysDeadbandSensor, QolsysAutomationDeviceEntity, SensorEntity
+):
     """An Automation Device sensor entity."""
 
     def __init__(
@@ -355,6 +553,14 @@ class AutomationDevice_Sensor(QolsysAutomationDeviceEntity, SensorEntity):
         sensor = self._service.sensor(unit)
         assert sensor is not None
         self._sensor: QolsysSensor = sensor
+        match unit:
+            case (
+                QolsysSensorScale.TEMPERATURE_FAHRENHEIT
+                | QolsysSensorScale.TEMPERATURE_CELSIUS
+            ):
+                self._deadband_kind = "temperature"
+            case QolsysSensorScale.RELATIVE_HUMIDITY:
+                self._deadband_kind = "humidity"
 
     @property
     def native_unit_of_measurement(self) -> str | None:
@@ -387,7 +593,12 @@ class AutomationDevice_Sensor(QolsysAutomationDeviceEntity, SensorEntity):
         return self._sensor.value
 
 
-class AutomationDevice_Meter(QolsysAutomationDeviceEntity, SensorEntity):
+class AutomationDevice_Meter(
+    QolsysStatisticsSensor,
+    QolsysDeadbandSensor,
+    QolsysAutomationDeviceEntity,
+    SensorEntity,
+):
     """An Automation Device Meter entity."""
 
     def __init__(
@@ -409,6 +620,14 @@ class AutomationDevice_Meter(QolsysAutomationDeviceEntity, SensorEntity):
         meter = self._service.meter(unit)
         assert meter is not None
         self._meter: QolsysMeter = meter
+        # Totals are written as they come, for the energy dashboard.
+        match unit:
+            case QolsysMeterScale.WATTS:
+                self._deadband_kind = "power"
+            case QolsysMeterScale.VOLTS:
+                self._deadband_kind = "voltage"
+            case QolsysMeterScale.AMPS:
+                self._deadband_kind = "current"
 
     @property
     def native_unit_of_measurement(self) -> str:
@@ -445,8 +664,8 @@ class AutomationDevice_Meter(QolsysAutomationDeviceEntity, SensorEntity):
         return None
 
     @property
-    def state_class(self) -> SensorStateClass:
-        """Return the state class of this entity."""
+    def _statistic_state_class(self) -> SensorStateClass:
+        """Return the state class of the meter unit."""
         match self._unit:
             case QolsysMeterScale.KWH:
                 return SensorStateClass.TOTAL_INCREASING
@@ -500,3 +719,45 @@ class Partition_LastError(QolsysPartitionEntity, SensorEntity):
     @property
     def native_value(self) -> str | None:
         return self._partition.last_error.name
+
+
+class Partition_ZoneSummary(QolsysPartitionEntity, SensorEntity):
+    """A sensor entity counting the open, tampered or low battery zones."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _unrecorded_attributes = frozenset({"zones"})
+
+    def __init__(
+        self,
+        QolsysPanel: qolsys_controller,
+        partition_id: str,
+        unique_id: str,
+        zones: ZoneIndex,
+        kind: str,
+    ) -> None:
+        """Set up a sensor entity for a zone summary of a partition."""
+        super().__init__(QolsysPanel, partition_id, unique_id)
+        self._zones = zones
+        self._kind = kind
+        self._attr_unique_id = f"{self._partition_unique_id}_{kind}_zones"
+        self._attr_translation_key = f"{kind}_zones"
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the zone summary of the partition."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._zones.async_listen_summary(
+                self._partition_id, self.async_write_ha_state
+            )
+        )
+
+    @property
+    def native_value(self) -> int:
+        return len(self._zones.summary(self._partition_id, self._kind))
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        zones = self._zones.summary(self._partition_id, self._kind)
+        return {
+            "zones": [zones[zone_id] for zone_id in sorted(zones, key=zone_sort_key)]
+        }
@@ -2,21 +2,56 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine, Iterable
+from datetime import timedelta
 import logging
+import time
+from typing import Any
 
-from qolsys_controller.errors import CommandExecutionError
+from qolsys_controller import qolsys_controller
+from qolsys_controller.enum_qolsys import (
+    PartitionArmingType,
+    ZoneSensorType,
+    ZoneStatus,
+)
+from qolsys_controller.errors import (
+    CommandExecutionError,
+    QolsysError,
+    QolsysOperationTimeoutError,
+)
+from qolsys_controller.partition import QolsysPartition
 import voluptuous as vol
 
 from custom_components.qolsys_panel import entity
 from homeassistant.components.alarm_control_panel import (
     DOMAIN as ALARM_CONTROL_PANEL_DOMAIN,
 )
-from homeassistant.config_entries import ConfigEntryState
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
+from homeassistant.config_entries import (
+    SIGNAL_CONFIG_ENTRY_CHANGED,
+    ConfigEntry,
+    ConfigEntryChange,
+    ConfigEntryState,
+)
+from homeassistant.const import ATTR_ENTITY_ID, ENTITY_MATCH_ALL
+from homeassistant.core import (
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import config_validation as cv, entity_registry, service
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import DATA_DOMAIN_PLATFORM_ENTITIES
+from homeassistant.util.hass_dict import HassKey
 
+from .command import COMMAND_PRIORITY, CommandPriority
 from .const import (
+    DEFAULT_BULK_MAX_CONCURRENCY,
     DEFAULT_QUICK_EXIT_DURATION,
     DEFAULT_TRIGGER_AUXILLIARY,
     DEFAULT_TRIGGER_FIRE,
@@ -25,64 +60,262 @@ from .const import (
     OPTION_TRIGGER_AUXILLIARY,
     OPTION_TRIGGER_FIRE,
     OPTION_TRIGGER_POLICE,
+    SERVICE_ARM_PARTITIONS,
+    SERVICE_BULK_COMMAND,
+    SERVICE_BYPASS_ZONES,
+    SERVICE_DEBUG_WINDOW,
+    SERVICE_DISARM_PARTITIONS,
+    SERVICE_FLEET_REPORT,
+    SERVICE_QUERY_ZONES,
     SERVICE_QUICK_EXIT,
+    SERVICE_RECENT_EVENTS,
     SERVICE_TRIGGER_AUXILLIARY,
     SERVICE_TRIGGER_FIRE,
     SERVICE_TRIGGER_POLICE,
 )
+from .debug import async_open_debug_window
+from .fleet import fleet_report
+from .recent_events import DEFAULT_CAPACITY, EVENT_TYPES
+from .registry import panel_lookup
+from .runtime import async_get_runtime
 from .types import QolsysPanelConfigEntry
+from .zone_index import ZoneIndex, zone_sort_key
 
 _LOGGER = logging.getLogger(__name__)
 
+# Bulk command -> {entity domain: entity method} for automation devices.
+BULK_COMMANDS: dict[str, dict[str, str]] = {
+    "turn_on": {"light": "async_turn_on", "switch": "async_turn_on"},
+    "turn_off": {"light": "async_turn_off", "switch": "async_turn_off"},
+    "lock": {"lock": "async_lock"},
+    "unlock": {"lock": "async_unlock"},
+    "open": {"valve": "async_open_valve", "cover": "async_open_cover"},
+    "close": {"valve": "async_close_valve", "cover": "async_close_cover"},
+}
 
-async def async_trigger_police(
-    ent: entity.QolsysPartitionEntity, call: ServiceCall
-) -> None:
-    """Trigger Police Alarm on Qolsys Panel."""
-    entity_id: str = ent.entity_id
+BULK_COMMAND_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
+        vol.Required("command"): vol.In(list(BULK_COMMANDS)),
+        vol.Optional("max_concurrency", default=DEFAULT_BULK_MAX_CONCURRENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=16)
+        ),
+    }
+)
 
-    # Get the entity registry entry
-    er = entity_registry.async_get(call.hass)
-    entry = er.async_get(entity_id)
 
-    if entry is None:
-        raise HomeAssistantError(
-            translation_domain=DOMAIN,
-            translation_key="entity_not_found",
-            translation_placeholders={"entity_id": entity_id},
-        )
+# Cached entity_id -> loaded config entry for the partition services.
+DATA_ENTRY_RESOLVER: HassKey[ConfigEntryResolver] = HassKey(f"{DOMAIN}_entry_resolver")
 
-    # Get the config entry associated with the entity
-    config_entry: QolsysPanelConfigEntry | None = None
-    if entry.config_entry_id is not None:
-        config_entry = call.hass.config_entries.async_get_entry(entry.config_entry_id)
-    if config_entry is None:
-        raise ServiceValidationError(
-            translation_domain=DOMAIN,
-            translation_key="integration_not_found",
-            translation_placeholders={"target": entity_id},
-        )
+# Handler of a partition service: (entity_id, partition_id, call).
+type PartitionServiceHandler = Callable[[str, str, ServiceCall], Awaitable[None]]
 
-    if config_entry.state is not ConfigEntryState.LOADED:
-        raise HomeAssistantError(
-            translation_domain=DOMAIN,
-            translation_key="not_loaded",
-            translation_placeholders={"target": config_entry.title},
-        )
 
-    # Prevent service from running if option is disabled in inegratin options
-    if not config_entry.options.get(OPTION_TRIGGER_POLICE, DEFAULT_TRIGGER_POLICE):
-        raise HomeAssistantError(
-            translation_domain=DOMAIN,
-            translation_key="trigger_police_disabled",
+class ConfigEntryResolver:
+    """Resolve service target entities to their loaded config entry.
+
+    Resolutions are cached until the entity registry entry or a Qolsys Panel
+    config entry changes.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Set up the resolver and its invalidation listeners."""
+        self._hass = hass
+        self._cache: dict[str, QolsysPanelConfigEntry] = {}
+        hass.bus.async_listen(
+            entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+            self._async_entity_registry_updated,
+        )
+        async_dispatcher_connect(
+            hass, SIGNAL_CONFIG_ENTRY_CHANGED, self._async_config_entry_changed
         )
 
-    QolsysPanel = config_entry.runtime_data
-    partition_id: str = ent._partition_id
-    silent: bool = call.data["silent"]
+    @callback
+    def _async_entity_registry_updated(
+        self, event: Event[entity_registry.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Forget an entity whose registry entry changed."""
+        self._cache.pop(event.data["entity_id"], None)
+        if event.data["action"] == "update" and "old_entity_id" in event.data:
+            self._cache.pop(event.data["old_entity_id"], None)
+
+    @callback
+    def _async_config_entry_changed(
+        self, change: ConfigEntryChange, config_entry: ConfigEntry
+    ) -> None:
+        """Forget every resolution when a Qolsys Panel entry changes state."""
+        if config_entry.domain == DOMAIN:
+            self._cache.clear()
+
+    @callback
+    def async_resolve(self, entity_id: str) -> QolsysPanelConfigEntry:
+        """Return the loaded config entry of an entity.
+
+        Raises:
+            HomeAssistantError: The entity is unknown or its entry is not loaded.
+            ServiceValidationError: The entity has no Qolsys Panel config entry.
+        """
+        if (config_entry := self._cache.get(entity_id)) is not None:
+            return config_entry
+
+        entry = entity_registry.async_get(self._hass).async_get(entity_id)
+        if entry is None:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="entity_not_found",
+                translation_placeholders={"entity_id": entity_id},
+            )
+
+        if entry.config_entry_id is not None:
+            config_entry = self._hass.config_entries.async_get_entry(
+                entry.config_entry_id
+            )
+        if config_entry is None:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="integration_not_found",
+                translation_placeholders={"target": entity_id},
+            )
+
+        if config_entry.state is not ConfigEntryState.LOADED:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="not_loaded",
+                translation_placeholders={"target": config_entry.title},
+            )
+
+        self._cache[entity_id] = config_entry
+        return config_entry
+
+
+@callback
+def _async_resolve_config_entry(
+    hass: HomeAssistant, entity_id: str
+) -> QolsysPanelConfigEntry:
+    """Return the loaded config entry of an entity, see ConfigEntryResolver."""
+    if (resolver := hass.data.get(DATA_ENTRY_RESOLVER)) is None:
+        resolver = hass.data[DATA_ENTRY_RESOLVER] = ConfigEntryResolver(hass)
+    return resolver.async_resolve(entity_id)
+
+
+@callback
+def _async_resolve_object(
+    hass: HomeAssistant, entity_id: str, kind: str
+) -> tuple[QolsysPanelConfigEntry, str]:
+    """Return the config entry and id of the partition or zone of an entity.
+
+    Raises:
+        ServiceValidationError: The entity is not one of a loaded Qolsys
+            partition or zone.
+    """
+    if (
+        entity_entry := entity_registry.async_get(hass).async_get(entity_id)
+    ) is not None:
+        config_entry = _async_resolve_config_entry(hass, entity_id)
+        runtime = async_get_runtime(hass, config_entry.entry_id)
+        if (
+            runtime is not None
+            and runtime.registry is not None
+            and (found := runtime.registry.resolve(entity_entry.unique_id))
+            and found[0] == kind
+        ):
+            return config_entry, found[1]
+    raise ServiceValidationError(
+        translation_domain=DOMAIN,
+        translation_key="entity_not_found",
+        translation_placeholders={"entity_id": entity_id},
+    )
+
+
+# Service arm_mode -> arming type sent to the partition.
+ARM_MODES: dict[str, PartitionArmingType] = {
+    "arm_away": PartitionArmingType.ARM_AWAY,
+    "arm_home": PartitionArmingType.ARM_STAY,
+    "arm_night": PartitionArmingType.ARM_NIGHT,
+}
+
+BYPASS_ZONES_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
+            vol.Optional("zones"): cv.entity_ids,
+            vol.Optional("arm_mode"): vol.In(list(ARM_MODES)),
+            vol.Optional("code"): cv.string,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_ENTITY_ID, "zones"),
+)
+
+ARM_PARTITIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
+        vol.Required("arm_mode"): vol.In(list(ARM_MODES)),
+        vol.Optional("code"): cv.string,
+    }
+)
+
+DISARM_PARTITIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
+        vol.Optional("code"): cv.string,
+    }
+)
+
+QUERY_ZONES_SCHEMA = vol.Schema(
+    {
+        vol.Optional("partition"): cv.entity_id,
+        vol.Optional("sensor_type"): vol.All(
+            cv.ensure_list, [vol.In([t.name.lower() for t in ZoneSensorType])]
+        ),
+        vol.Optional("status"): vol.All(
+            cv.ensure_list, [vol.In([s.name.lower() for s in ZoneStatus])]
+        ),
+        vol.Optional("battery"): vol.In(["normal", "low"]),
+        vol.Optional("name_prefix"): cv.string,
+    }
+)
+
+FLEET_REPORT_SCHEMA = vol.Schema({vol.Optional("partition"): cv.entity_id})
+
+RECENT_EVENTS_SCHEMA = vol.Schema(
+    {
+        vol.Optional("partition"): cv.entity_id,
+        vol.Optional("zone"): cv.entity_id,
+        vol.Optional("type"): vol.All(cv.ensure_list, [vol.In(EVENT_TYPES)]),
+        vol.Optional("limit", default=100): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=DEFAULT_CAPACITY)
+        ),
+    }
+)
+
+DEBUG_WINDOW_SCHEMA = vol.Schema(
+    {
+        vol.Optional("minutes", default=10): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=120)
+        ),
+    }
+)
+
+
+async def _async_run_security_command(
+    hass: HomeAssistant,
+    config_entry: QolsysPanelConfigEntry,
+    command_type: str,
+    command: Callable[[], Awaitable[Any]],
+) -> None:
+    """Run a partition command ahead of automation traffic.
+
+    Raises:
+        HomeAssistantError: The panel rejected the command or did not answer.
+    """
     try:
-        await QolsysPanel.commands.panel.trigger_police(partition_id, silent)
-    except CommandExecutionError as e:
+        if (runtime := async_get_runtime(hass, config_entry.entry_id)) is None:
+            await command()
+        else:
+            await runtime.async_run_command(
+                command_type, CommandPriority.SECURITY, command
+            )
+    except (CommandExecutionError, QolsysOperationTimeoutError) as e:
         raise HomeAssistantError(
             translation_domain=DOMAIN,
             translation_key="command_failed",
@@ -90,39 +323,34 @@ async def async_trigger_police(
         ) from e
 
 
-async def async_trigger_auxilliary(
-    ent: entity.QolsysPartitionEntity, call: ServiceCall
+async def async_trigger_police(
+    entity_id: str, partition_id: str, call: ServiceCall
 ) -> None:
-    """Trigger Auxilliary Alarm on Qolsys Panel."""
-    entity_id: str = ent.entity_id
+    """Trigger Police Alarm on Qolsys Panel."""
+    config_entry = _async_resolve_config_entry(call.hass, entity_id)
 
-    # Get the entity registry entry
-    er = entity_registry.async_get(call.hass)
-    entry = er.async_get(entity_id)
-    if entry is None:
+    # Prevent service from running if option is disabled in inegratin options
+    if not config_entry.options.get(OPTION_TRIGGER_POLICE, DEFAULT_TRIGGER_POLICE):
         raise HomeAssistantError(
             translation_domain=DOMAIN,
-            translation_key="entity_not_found",
-            translation_placeholders={"entity_id": entity_id},
+            translation_key="trigger_police_disabled",
         )
 
-    # Get the config entry associated with the entity
-    config_entry: QolsysPanelConfigEntry | None = None
-    if entry.config_entry_id is not None:
-        config_entry = call.hass.config_entries.async_get_entry(entry.config_entry_id)
-    if config_entry is None:
-        raise ServiceValidationError(
-            translation_domain=DOMAIN,
-            translation_key="integration_not_found",
-            translation_placeholders={"target": entity_id},
-        )
+    QolsysPanel = config_entry.runtime_data
+    silent: bool = call.data["silent"]
+    await _async_run_security_command(
+        call.hass,
+        config_entry,
+        SERVICE_TRIGGER_POLICE,
+        lambda: QolsysPanel.commands.panel.trigger_police(partition_id, silent),
+    )
 
-    if config_entry.state is not ConfigEntryState.LOADED:
-        raise HomeAssistantError(
-            translation_domain=DOMAIN,
-            translation_key="not_loaded",
-            translation_placeholders={"target": config_entry.title},
-        )
+
+async def async_trigger_auxilliary(
+    entity_id: str, partition_id: str, call: ServiceCall
+) -> None:
+    """Trigger Auxilliary Alarm on Qolsys Panel."""
+    config_entry = _async_resolve_config_entry(call.hass, entity_id)
 
     # Prevent service from running if option is disabled in inegratin options
     if not config_entry.options.get(
@@ -134,52 +362,20 @@ async def async_trigger_auxilliary(
         )
 
     QolsysPanel = config_entry.runtime_data
-    partition_id: str = ent._partition_id
     silent: bool = call.data["silent"]
-    try:
-        await QolsysPanel.commands.panel.trigger_auxilliary(partition_id, silent)
-    except CommandExecutionError as e:
-        raise HomeAssistantError(
-            translation_domain=DOMAIN,
-            translation_key="command_failed",
-            translation_placeholders={"error": str(e)},
-        ) from e
+    await _async_run_security_command(
+        call.hass,
+        config_entry,
+        SERVICE_TRIGGER_AUXILLIARY,
+        lambda: QolsysPanel.commands.panel.trigger_auxilliary(partition_id, silent),
+    )
 
 
 async def async_trigger_fire(
-    ent: entity.QolsysPartitionEntity, call: ServiceCall
+    entity_id: str, partition_id: str, call: ServiceCall
 ) -> None:
     """Trigger Fire Alarm on Qolsys Panel."""
-    entity_id: str = ent.entity_id
-
-    # Get the entity registry entry
-    er = entity_registry.async_get(call.hass)
-    entry = er.async_get(entity_id)
-
-    if entry is None:
-        raise HomeAssistantError(
-            translation_domain=DOMAIN,
-            translation_key="entity_not_found",
-            translation_placeholders={"entity_id": entity_id},
-        )
-
-    # Get the config entry associated with the entity
-    config_entry: QolsysPanelConfigEntry | None = None
-    if entry.config_entry_id is not None:
-        config_entry = call.hass.config_entries.async_get_entry(entry.config_entry_id)
-    if config_entry is None:
-        raise ServiceValidationError(
-            translation_domain=DOMAIN,
-            translation_key="integration_not_found",
-            translation_placeholders={"target": entity_id},
-        )
-
-    if config_entry.state is not ConfigEntryState.LOADED:
-        raise HomeAssistantError(
-            translation_domain=DOMAIN,
-            translation_key="not_loaded",
-            translation_placeholders={"target": config_entry.title},
-        )
+    config_entry = _async_resolve_config_entry(call.hass, entity_id)
 
     # Prevent service from running if option is disabled in inegratin options
     if not config_entry.options.get(OPTION_TRIGGER_FIRE, DEFAULT_TRIGGER_FIRE):
@@ -189,63 +385,548 @@ async def async_trigger_fire(
         )
 
     QolsysPanel = config_entry.runtime_data
-    partition_id: str = ent._partition_id
-    try:
-        await QolsysPanel.commands.panel.trigger_fire(partition_id)
-    except CommandExecutionError as e:
-        raise HomeAssistantError(
-            translation_domain=DOMAIN,
-            translation_key="command_failed",
-            translation_placeholders={"error": str(e)},
-        ) from e
+    await _async_run_security_command(
+        call.hass,
+        config_entry,
+        SERVICE_TRIGGER_FIRE,
+        lambda: QolsysPanel.commands.panel.trigger_fire(partition_id),
+    )
 
 
 async def async_quick_exit(
-    ent: entity.QolsysPartitionEntity, call: ServiceCall
+    entity_id: str, partition_id: str, call: ServiceCall
 ) -> None:
     """Start Quick Exit on a Qolsys Panel partition (open a door while Armed-Stay without alarming)."""
-    entity_id: str = ent.entity_id
+    config_entry = _async_resolve_config_entry(call.hass, entity_id)
 
-    # Get the entity registry entry
-    er = entity_registry.async_get(call.hass)
-    entry = er.async_get(entity_id)
+    QolsysPanel = config_entry.runtime_data
+    duration: int = call.data.get("duration", DEFAULT_QUICK_EXIT_DURATION)
+    await _async_run_security_command(
+        call.hass,
+        config_entry,
+        SERVICE_QUICK_EXIT,
+        lambda: QolsysPanel.commands.panel.quick_exit(partition_id, duration),
+    )
 
-    if entry is None:
-        raise HomeAssistantError(
-            translation_domain=DOMAIN,
-            translation_key="entity_not_found",
-            translation_placeholders={"entity_id": entity_id},
+
+def _partition_service(
+    handler: PartitionServiceHandler,
+) -> Callable[[ServiceCall], Coroutine[Any, Any, None]]:
+    """Return a service running the handler for every targeted partition.
+
+    Partitions are found through the entity registry, see
+    _async_resolve_object, and handled concurrently. A single failure is
+    raised as is; several are aggregated into one error naming each partition.
+    """
+
+    async def _async_handle(call: ServiceCall) -> None:
+        hass = call.hass
+        registry = entity_registry.async_get(hass)
+        required: set[str] = set()
+        if call.data.get(ATTR_ENTITY_ID) == ENTITY_MATCH_ALL:
+            entity_ids = {
+                entity_entry.entity_id
+                for config_entry in hass.config_entries.async_loaded_entries(DOMAIN)
+                for entity_entry in entity_registry.async_entries_for_config_entry(
+                    registry, config_entry.entry_id
+                )
+                if entity_entry.domain == ALARM_CONTROL_PANEL_DOMAIN
+            }
+        else:
+            selected = service.async_extract_referenced_entity_ids(hass, call)
+            required = selected.referenced
+            entity_ids = required | {
+                entity_id
+                for entity_id in selected.indirectly_referenced
+                if (entity_entry := registry.async_get(entity_id)) is not None
+                and entity_entry.platform == DOMAIN
+                and entity_entry.domain == ALARM_CONTROL_PANEL_DOMAIN
+            }
+
+        # Resolve every target before handling any. Entities matched through
+        # a device or area that are not loaded partitions are skipped.
+        targets: list[tuple[str, str]] = []
+        for entity_id in sorted(entity_ids):
+            try:
+                _, partition_id = _async_resolve_object(hass, entity_id, "partition")
+            except HomeAssistantError:
+                if entity_id in required:
+                    raise
+                continue
+            targets.append((entity_id, partition_id))
+
+        results = await asyncio.gather(
+            *(
+                handler(entity_id, partition_id, call)
+                for entity_id, partition_id in targets
+            ),
+            return_exceptions=True,
         )
+        errors: list[tuple[str, Exception]] = []
+        for (entity_id, _), result in zip(targets, results, strict=True):
+            if isinstance(result, Exception):
+                errors.append((entity_id, result))
+            elif isinstance(result, BaseException):
+                raise result
+        if len(errors) == 1:
+            raise errors[0][1]
+        if errors:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="partition_commands_failed",
+                translation_placeholders={
+                    "errors": "; ".join(
+                        f"{entity_id}: {error}" for entity_id, error in errors
+                    )
+                },
+            )
+
+    return _async_handle
+
+
+@callback
+def _async_get_automation_entity(
+    hass: HomeAssistant, entity_id: str
+) -> entity.QolsysAutomationDeviceEntity | None:
+    """Return the loaded Qolsys automation device entity with the entity_id.
+
+    The entity is looked up in the entities Home Assistant keeps by domain
+    and platform, rather than by walking every platform of the integration.
+    """
+    ent = (
+        hass.data.get(DATA_DOMAIN_PLATFORM_ENTITIES, {})
+        .get((entity_id.split(".", 1)[0], DOMAIN), {})
+        .get(entity_id)
+    )
+    return ent if isinstance(ent, entity.QolsysAutomationDeviceEntity) else None
+
+
+async def async_bulk_command(call: ServiceCall) -> ServiceResponse:
+    """Send one command to many automation devices with bounded concurrency."""
+    command: str = call.data["command"]
+    methods = BULK_COMMANDS[command]
+
+    # Validate every target before sending anything to the panel.
+    targets: list[tuple[str, entity.QolsysAutomationDeviceEntity, str]] = []
+    for entity_id in call.data[ATTR_ENTITY_ID]:
+        if (ent := _async_get_automation_entity(call.hass, entity_id)) is None:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="entity_not_found",
+                translation_placeholders={"entity_id": entity_id},
+            )
+        method = methods.get(entity_id.split(".", 1)[0])
+        if method is None:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="bulk_command_unsupported",
+                translation_placeholders={"entity_id": entity_id, "command": command},
+            )
+        targets.append((entity_id, ent, method))
 
-    # Get the config entry associated with the entity
-    config_entry: QolsysPanelConfigEntry | None = None
-    if entry.config_entry_id is not None:
-        config_entry = call.hass.config_entries.async_get_entry(entry.config_entry_id)
-    if config_entry is None:
+    # Cap the commands in flight so the panel's Z-Wave controller is not flooded.
+    semaphore = asyncio.Semaphore(call.data["max_concurrency"])
+
+    async def _async_send(
+        ent: entity.QolsysAutomationDeviceEntity, method: str
+    ) -> dict[str, Any]:
+        async with semaphore:
+            start = time.monotonic()
+            result: dict[str, Any] = {"success": True}
+            try:
+                await getattr(ent, method)()
+            except (HomeAssistantError, QolsysError) as e:
+                _LOGGER.debug("Bulk %s failed for %s: %s", command, ent.entity_id, e)
+                result = {"success": False, "error": str(e)}
+            except Exception as e:
+                # Reported like the others, so one device cannot abort the batch.
+                _LOGGER.exception(
+                    "Unexpected error in bulk %s for %s", command, ent.entity_id
+                )
+                result = {"success": False, "error": str(e) or type(e).__name__}
+            result["elapsed_ms"] = round((time.monotonic() - start) * 1000, 1)
+            return result
+
+    # Bulk traffic yields to security and user-interactive commands.
+    token = COMMAND_PRIORITY.set(CommandPriority.BACKGROUND)
+    start = time.monotonic()
+    try:
+        results = await asyncio.gather(
+            *(_async_send(ent, method) for _, ent, method in targets)
+        )
+    finally:
+        COMMAND_PRIORITY.reset(token)
+    elapsed_ms = round((time.monotonic() - start) * 1000, 1)
+
+    if not call.return_response:
+        return None
+
+    return {
+        "command": command,
+        "elapsed_ms": elapsed_ms,
+        "results": {
+            entity_id: result
+            for (entity_id, _, _), result in zip(targets, results, strict=True)
+        },
+    }
+
+
+def _bypass_zone_ids(
+    QolsysPanel: qolsys_controller,
+    zones: ZoneIndex,
+    partition_id: str,
+    selected: set[str] | None,
+) -> list[str]:
+    """Return the open zones of a partition the panel bypasses when arming.
+
+    The panel has no per-zone bypass command: arming bypasses every open zone
+    that can be bypassed, kept by the zone index. The selection is checked
+    against that list.
+
+    Raises:
+        ServiceValidationError: A selected zone cannot be bypassed, an open
+            zone is not selected, or the panel has auto bypass disabled.
+    """
+    lookup = panel_lookup(QolsysPanel)
+    for zone_id in sorted(selected or (), key=zone_sort_key):
+        if (zone := lookup.zone(zone_id)) is not None and not zone.is_bypassable():
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="zone_not_bypassable",
+                translation_placeholders={"zone": zone_id},
+            )
+
+    bypass = sorted(zones.bypassable_zones(partition_id), key=zone_sort_key)
+    for zone_id in bypass:
+        if selected is not None and zone_id not in selected:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="zone_not_selected",
+                translation_placeholders={"zone": zone_id},
+            )
+
+    if bypass and QolsysPanel.panel.AUTO_BYPASS == "false":
         raise ServiceValidationError(
             translation_domain=DOMAIN,
-            translation_key="integration_not_found",
-            translation_placeholders={"target": entity_id},
+            translation_key="auto_bypass_disabled",
+            translation_placeholders={"zones": ", ".join(bypass)},
         )
+    return bypass
 
-    if config_entry.state is not ConfigEntryState.LOADED:
-        raise HomeAssistantError(
-            translation_domain=DOMAIN,
-            translation_key="not_loaded",
-            translation_placeholders={"target": config_entry.title},
+
+async def async_bypass_zones(call: ServiceCall) -> ServiceResponse:
+    """Bypass open zones, optionally arming their partitions in the same command."""
+    hass = call.hass
+
+    # (entry_id, partition_id) -> (config entry, partition, selected zone ids).
+    # A partition targeted directly bypasses all of its open zones.
+    targets: dict[
+        tuple[str, str],
+        tuple[QolsysPanelConfigEntry, QolsysPartition, set[str] | None],
+    ] = {}
+    for config_entry, partition in _async_get_partition_targets(
+        hass, call.data.get(ATTR_ENTITY_ID, [])
+    ):
+        targets[(config_entry.entry_id, partition.id)] = (config_entry, partition, None)
+
+    for entity_id in call.data.get("zones", []):
+        config_entry, zone_id = _async_resolve_object(hass, entity_id, "zone")
+        lookup = panel_lookup(config_entry.runtime_data)
+        zone = lookup.zone(zone_id)
+        zone_partition = None if zone is None else lookup.partition(zone.partition_id)
+        if zone_partition is None:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="entity_not_found",
+                translation_placeholders={"entity_id": entity_id},
+            )
+        key = (config_entry.entry_id, zone_partition.id)
+        targets.setdefault(key, (config_entry, zone_partition, set()))
+        if (selected := targets[key][2]) is not None:
+            selected.add(zone_id)
+
+    # Validate every partition before arming any of them.
+    bypass: dict[tuple[str, str], list[str]] = {}
+    for key, (config_entry, partition, selected) in targets.items():
+        runtime = async_get_runtime(hass, config_entry.entry_id)
+        assert runtime is not None and runtime.zones is not None
+        bypass[key] = _bypass_zone_ids(
+            config_entry.runtime_data, runtime.zones, partition.id, selected
         )
 
-    QolsysPanel = config_entry.runtime_data
-    partition_id: str = ent._partition_id
-    duration: int = call.data.get("duration", DEFAULT_QUICK_EXIT_DURATION)
-    try:
-        await QolsysPanel.commands.panel.quick_exit(partition_id, duration)
-    except CommandExecutionError as e:
+    start = time.monotonic()
+    armed: list[dict[str, Any]] = [{} for _ in targets]
+    if (arm_mode := call.data.get("arm_mode")) is not None:
+        arming_type = ARM_MODES[arm_mode]
+        code: str = call.data.get("code", "")
+        armed = await _async_run_partition_commands(
+            hass,
+            [
+                (config_entry, partition)
+                for config_entry, partition, _ in targets.values()
+            ],
+            "arm",
+            lambda partition: partition.arm(arming_type, user_code=code),
+            arming_type,
+        )
+    elapsed_ms = round((time.monotonic() - start) * 1000, 1)
+
+    results: dict[str, Any] = {}
+    for (_, partition_id), zone_ids, outcome in zip(
+        targets, bypass.values(), armed, strict=True
+    ):
+        results[partition_id] = {
+            "bypass": zone_ids,
+            "armed": outcome.get("success", False),
+        }
+        if "error" in outcome:
+            results[partition_id]["error"] = outcome["error"]
+
+    if not call.return_response:
+        _raise_partition_failures(
+            (f"partition {partition_id}", result)
+            for partition_id, result in results.items()
+        )
+        return None
+
+    return {"elapsed_ms": elapsed_ms, "partitions": results}
+
+
+def _async_get_partition_targets(
+    hass: HomeAssistant, entity_ids: list[str]
+) -> list[tuple[QolsysPanelConfigEntry, QolsysPartition]]:
+    """Return the config entry and partition of each partition entity.
+
+    Partitions are found by the unique_id of their alarm entity in the
+    registry of their panel, see _async_resolve_object.
+
+    Raises:
+        ServiceValidationError: An entity is not a loaded Qolsys partition.
+    """
+    targets: list[tuple[QolsysPanelConfigEntry, QolsysPartition]] = []
+    for entity_id in entity_ids:
+        config_entry, partition_id = _async_resolve_object(hass, entity_id, "partition")
+        if (
+            partition := panel_lookup(config_entry.runtime_data).partition(partition_id)
+        ) is None:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="entity_not_found",
+                translation_placeholders={"entity_id": entity_id},
+            )
+        targets.append((config_entry, partition))
+    return targets
+
+
+async def _async_run_partition_commands(
+    hass: HomeAssistant,
+    targets: list[tuple[QolsysPanelConfigEntry, QolsysPartition]],
+    command_type: str,
+    command: Callable[[QolsysPartition], Awaitable[Any]],
+    arm_mode: PartitionArmingType | None = None,
+) -> list[dict[str, Any]]:
+    """Send a command to every partition concurrently.
+
+    An arming command, with its arm_mode, goes through the same checks and
+    journal as the alarm entities, see QolsysPanelRuntime.async_arm.
+
+    Returns the outcome of each target, in order: whether it succeeded, the
+    error if it did not, and the round-trip time of its command.
+    """
+
+    async def _async_run(
+        config_entry: QolsysPanelConfigEntry, partition: QolsysPartition
+    ) -> dict[str, Any]:
+        start = time.monotonic()
+        result: dict[str, Any] = {"success": True}
+
+        def _send() -> Awaitable[None]:
+            return _async_run_security_command(
+                hass, config_entry, command_type, lambda: command(partition)
+            )
+
+        try:
+            runtime = async_get_runtime(hass, config_entry.entry_id)
+            if arm_mode is None or runtime is None:
+                await _send()
+            else:
+                await runtime.async_arm(partition.id, arm_mode, _send)
+        except (HomeAssistantError, QolsysError) as err:
+            result = {"success": False, "error": str(err)}
+        result["elapsed_ms"] = round((time.monotonic() - start) * 1000, 1)
+        return result
+
+    # The security class of the command scheduler bounds the concurrency.
+    return await asyncio.gather(
+        *(_async_run(config_entry, partition) for config_entry, partition in targets)
+    )
+
+
+def _raise_partition_failures(results: Iterable[tuple[str, dict[str, Any]]]) -> None:
+    """Raise one error naming every partition whose command failed.
+
+    Raises:
+        HomeAssistantError: At least one partition reported an error.
+    """
+    if failed := [
+        f"{target}: {result['error']}"
+        for target, result in results
+        if "error" in result
+    ]:
         raise HomeAssistantError(
             translation_domain=DOMAIN,
-            translation_key="command_failed",
-            translation_placeholders={"error": str(e)},
-        ) from e
+            translation_key="partition_commands_failed",
+            translation_placeholders={"errors": "; ".join(failed)},
+        )
+
+
+async def _async_partition_command_response(
+    call: ServiceCall,
+    command_type: str,
+    command: Callable[[QolsysPartition], Awaitable[Any]],
+    arm_mode: PartitionArmingType | None = None,
+) -> ServiceResponse:
+    """Send a command to the targeted partitions and report each outcome."""
+    entity_ids = list(dict.fromkeys(call.data[ATTR_ENTITY_ID]))
+    targets = _async_get_partition_targets(call.hass, entity_ids)
+    start = time.monotonic()
+    outcomes = await _async_run_partition_commands(
+        call.hass, targets, command_type, command, arm_mode
+    )
+    elapsed_ms = round((time.monotonic() - start) * 1000, 1)
+    results = dict(zip(entity_ids, outcomes, strict=True))
+
+    if not call.return_response:
+        _raise_partition_failures(results.items())
+        return None
+
+    return {"elapsed_ms": elapsed_ms, "partitions": results}
+
+
+async def async_arm_partitions(call: ServiceCall) -> ServiceResponse:
+    """Arm several partitions at once with one user code."""
+    arming_type = ARM_MODES[call.data["arm_mode"]]
+    code: str = call.data.get("code", "")
+    return await _async_partition_command_response(
+        call,
+        "arm",
+        lambda partition: partition.arm(arming_type, user_code=code),
+        arming_type,
+    )
+
+
+async def async_disarm_partitions(call: ServiceCall) -> ServiceResponse:
+    """Disarm several partitions at once with one user code."""
+    code: str = call.data.get("code", "")
+    return await _async_partition_command_response(
+        call, "disarm", lambda partition: partition.disarm(user_code=code)
+    )
+
+
+async def async_query_zones(call: ServiceCall) -> ServiceResponse:
+    """Return the zones matching the given criteria, from the zone indexes."""
+    hass = call.hass
+    partition_id: str | None = None
+    if (entity_id := call.data.get("partition")) is not None:
+        config_entry, partition_id = _async_resolve_object(hass, entity_id, "partition")
+        config_entries = [config_entry]
+    else:
+        config_entries = hass.config_entries.async_loaded_entries(DOMAIN)
+
+    registry = entity_registry.async_get(hass)
+    zones: list[Any] = []
+    for config_entry in config_entries:
+        runtime = async_get_runtime(hass, config_entry.entry_id)
+        if runtime is None or runtime.zones is None or runtime.registry is None:
+            continue
+        for zone in runtime.zones.query(
+            partition_id=partition_id,
+            sensor_types=call.data.get("sensor_type", ()),
+            statuses=call.data.get("status", ()),
+            battery=call.data.get("battery"),
+            name_prefix=call.data.get("name_prefix"),
+        ):
+            zone["entity_id"] = registry.async_get_entity_id(
+                BINARY_SENSOR_DOMAIN,
+                DOMAIN,
+                runtime.registry.unique_id("zone", zone["zone_id"]),
+            )
+            zones.append(zone)
+
+    return {"count": len(zones), "zones": zones}
+
+
+async def async_fleet_report(call: ServiceCall) -> ServiceResponse:
+    """Return the signal and battery report of the zones of each panel."""
+    hass = call.hass
+    if (entity_id := call.data.get("partition")) is not None:
+        [(config_entry, partition)] = _async_get_partition_targets(hass, [entity_id])
+        panels = [
+            (
+                config_entry,
+                [
+                    zone
+                    for zone in config_entry.runtime_data.state.zones
+                    if zone.partition_id == partition.id
+                ],
+            )
+        ]
+    else:
+        panels = [
+            (config_entry, config_entry.runtime_data.state.zones)
+            for config_entry in hass.config_entries.async_loaded_entries(DOMAIN)
+        ]
+
+    reports: dict[str, Any] = {
+        config_entry.entry_id: {"title": config_entry.title, **fleet_report(zones)}
+        for config_entry, zones in panels
+    }
+    return {"panels": reports}
+
+
+async def async_recent_events(call: ServiceCall) -> ServiceResponse:
+    """Return the recent events of each panel, from their ring buffers."""
+    hass = call.hass
+    partition_id: int | None = None
+    zone_id: int | None = None
+    config_entries: list[QolsysPanelConfigEntry] = []
+    for field, kind in (("partition", "partition"), ("zone", "zone")):
+        if (entity_id := call.data.get(field)) is None:
+            continue
+        config_entry, object_id = _async_resolve_object(hass, entity_id, kind)
+        if config_entries and config_entries[0] is not config_entry:
+            # A partition and a zone of different panels match nothing.
+            return {"panels": {}}
+        config_entries = [config_entry]
+        if kind == "partition":
+            partition_id = int(object_id)
+        else:
+            zone_id = int(object_id)
+    if not config_entries:
+        config_entries = hass.config_entries.async_loaded_entries(DOMAIN)
+
+    panels: dict[str, Any] = {}
+    for config_entry in config_entries:
+        runtime = async_get_runtime(hass, config_entry.entry_id)
+        if runtime is None or runtime.recent_events is None:
+            continue
+        events = runtime.recent_events.query(
+            partition_id=partition_id,
+            zone_id=zone_id,
+            event_types=set(call.data.get("type", ())),
+            limit=call.data["limit"],
+        )
+        panels[config_entry.entry_id] = {
+            "title": config_entry.title,
+            "events": [event.as_dict() for event in events],
+        }
+    return {"panels": panels}
+
+
+async def async_debug_window(call: ServiceCall) -> ServiceResponse:
+    """Log the controller debug records for some minutes."""
+    until = async_open_debug_window(call.hass, timedelta(minutes=call.data["minutes"]))
+    return {"until": until.isoformat()}
 
 
 @callback
@@ -253,49 +934,119 @@ def async_setup_services(hass: HomeAssistant) -> None:
     """Set up the services for the Qolsys Panel integration."""
 
     # Trigger Police Service
-    service.async_register_platform_entity_service(
-        hass,
+    hass.services.async_register(
         DOMAIN,
         SERVICE_TRIGGER_POLICE,
-        entity_domain=ALARM_CONTROL_PANEL_DOMAIN,
-        schema={
-            vol.Required("silent"): cv.boolean,
-        },
-        func=async_trigger_police,
+        _partition_service(async_trigger_police),
+        schema=cv.make_entity_service_schema(
+            {
+                vol.Required("silent"): cv.boolean,
+            }
+        ),
     )
 
     # Trigger Auxilliary Service
-    service.async_register_platform_entity_service(
-        hass,
+    hass.services.async_register(
         DOMAIN,
         SERVICE_TRIGGER_AUXILLIARY,
-        entity_domain=ALARM_CONTROL_PANEL_DOMAIN,
-        schema={
-            vol.Required("silent"): cv.boolean,
-        },
-        func=async_trigger_auxilliary,
+        _partition_service(async_trigger_auxilliary),
+        schema=cv.make_entity_service_schema(
+            {
+                vol.Required("silent"): cv.boolean,
+            }
+        ),
     )
 
     # Trigger Fire Service
-    service.async_register_platform_entity_service(
-        hass,
+    hass.services.async_register(
         DOMAIN,
         SERVICE_TRIGGER_FIRE,
-        entity_domain=ALARM_CONTROL_PANEL_DOMAIN,
-        schema={},
-        func=async_trigger_fire,
+        _partition_service(async_trigger_fire),
+        schema=cv.make_entity_service_schema({}),
     )
 
     # Quick Exit Service
-    service.async_register_platform_entity_service(
-        hass,
+    hass.services.async_register(
         DOMAIN,
         SERVICE_QUICK_EXIT,
-        entity_domain=ALARM_CONTROL_PANEL_DOMAIN,
-        schema={
-            vol.Optional(
-                "duration", default=DEFAULT_QUICK_EXIT_DURATION
-            ): cv.positive_int,
-        },
-        func=async_quick_exit,
+        _partition_service(async_quick_exit),
+        schema=cv.make_entity_service_schema(
+            {
+                vol.Optional(
+                    "duration", default=DEFAULT_QUICK_EXIT_DURATION
+                ): cv.positive_int,
+            }
+        ),
+    )
+
+    # Bulk Command Service
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BULK_COMMAND,
+        async_bulk_command,
+        schema=BULK_COMMAND_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    # Bypass Zones Service
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BYPASS_ZONES,
+        async_bypass_zones,
+        schema=BYPASS_ZONES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    # Arm Partitions Service
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_ARM_PARTITIONS,
+        async_arm_partitions,
+        schema=ARM_PARTITIONS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    # Disarm Partitions Service
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DISARM_PARTITIONS,
+        async_disarm_partitions,
+        schema=DISARM_PARTITIONS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    # Query Zones Service
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_QUERY_ZONES,
+        async_query_zones,
+        schema=QUERY_ZONES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    # Fleet Report Service
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_FLEET_REPORT,
+        async_fleet_report,
+        schema=FLEET_REPORT_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    # Recent Events Service
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RECENT_EVENTS,
+        async_recent_events,
+        schema=RECENT_EVENTS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    # Debug Window Service
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DEBUG_WINDOW,
+        async_debug_window,
+        schema=DEBUG_WINDOW_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
     )
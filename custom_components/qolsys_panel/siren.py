@@ -65,10 +65,10 @@ class AutomationDevice_Siren(QolsysAutomationDeviceEntity, SirenEntity):
         self._attr_name = f"Siren{'' if endpoint == 0 else endpoint} - {self._service.automation_device.device_name}"
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        await self._service.turn_on()
+        await self._async_send_command("siren.turn_on", self._service.turn_on)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        await self._service.turn_off()
+        await self._async_send_command("siren.turn_off", self._service.turn_off)
 
     @property
     def is_on(self) -> bool | None:
@@ -81,15 +81,24 @@ class AutomationDevice_Outlet(QolsysAutomationDeviceEntity, SwitchEntity):
         self._attr_name = f"Outlet{'' if endpoint == 0 else endpoint} - {self._service.automation_device.device_name}"
         self._attr_device_class = SwitchDeviceClass.OUTLET
 
+    def _confirmed_state(self) -> bool | None:
+        return self._service.is_on
+
     @property
     def is_on(self) -> bool | None:
+        if self._optimistic_state is not None:
+            return self._optimistic_state
         return self._service.is_on
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        await self._service.turn_on()
+        await self._async_send_command(
+            "outlet.turn_on", self._service.turn_on, expected_state=True
+        )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        await self._service.turn_off()
+        await self._async_send_command(
+            "outlet.turn_off", self._service.turn_off, expected_state=False
+        )
 
 
 class PartitionSwitch_ExitSounds(QolsysPartitionEntity, SwitchEntity, RestoreEntity):
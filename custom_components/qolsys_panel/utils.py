@@ -1,5 +1,9 @@
 """Utility functions for Qolsys Panel Integration."""
 
+from collections import deque
+import math
+from typing import Any
+
 from homeassistant.components import network
 from homeassistant.core import HomeAssistant
 
@@ -14,3 +18,38 @@ async def get_local_ip(hass: HomeAssistant) -> str:
                 local_ip = ip_info["address"]
 
     return local_ip
+
+
+class RollingStats:
+    """Rolling window of duration samples (seconds) with percentile helpers."""
+
+    def __init__(self, size: int = 100) -> None:
+        """Set up an empty window keeping the last `size` samples."""
+        self._samples: deque[float] = deque(maxlen=size)
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        """Record a sample."""
+        self._samples.append(value)
+        self.count += 1
+
+    def percentile(self, pct: float) -> float | None:
+        """Return the nearest-rank percentile of the window, or None if empty."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = math.ceil(pct / 100 * len(ordered))
+        return ordered[min(max(rank, 1), len(ordered)) - 1]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary in milliseconds for diagnostics."""
+
+        def _ms(value: float | None) -> float | None:
+            return None if value is None else round(value * 1000, 1)
+
+        return {
+            "count": self.count,
+            "p50_ms": _ms(self.percentile(50)),
+            "p95_ms": _ms(self.percentile(95)),
+            "max_ms": _ms(max(self._samples, default=None)),
+        }
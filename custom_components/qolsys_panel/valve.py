@@ -85,16 +85,18 @@ class AutomationDevice_Valve(QolsysAutomationDeviceEntity, ValveEntity):
                 self._attr_reports_position = True
 
     async def async_open_valve(self) -> None:
-        await self._service.open()
+        await self._async_send_command("valve.open", self._service.open)
 
     async def async_close_valve(self) -> None:
-        await self._service.close()
+        await self._async_send_command("valve.close", self._service.close)
 
     async def async_stop_valve(self) -> None:
-        await self._service.stop()
+        await self._async_send_command("valve.stop", self._service.stop)
 
     async def async_set_valve_position(self, position: int) -> None:
-        await self._service.set_position(position)
+        await self._async_send_command(
+            "valve.set_position", lambda: self._service.set_position(position)
+        )
 
     @property
     def is_closed(self) -> bool | None:
@@ -0,0 +1,80 @@
+"""WebSocket API for the Qolsys Panel integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+from .feed import PanelFeed, Snapshot
+from .runtime import async_get_runtime
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Register the WebSocket commands of the Qolsys Panel integration."""
+    websocket_api.async_register_command(hass, websocket_snapshot)
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+@callback
+def _async_get_feed(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> PanelFeed | None:
+    """Return the feed of the requested entry, or send an error if not loaded."""
+    entry = hass.config_entries.async_get_entry(msg["entry_id"])
+    if (
+        entry is None
+        or entry.domain != DOMAIN
+        or entry.state is not ConfigEntryState.LOADED
+        or (runtime := async_get_runtime(hass, entry.entry_id)) is None
+        or runtime.feed is None
+    ):
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Config entry not loaded"
+        )
+        return None
+    return runtime.feed
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/snapshot",
+        vol.Required("entry_id"): str,
+    }
+)
+@callback
+def websocket_snapshot(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return every partition, zone and device of a panel in one message."""
+    if (feed := _async_get_feed(hass, connection, msg)) is not None:
+        connection.send_result(msg["id"], feed.snapshot())
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe",
+        vol.Required("entry_id"): str,
+    }
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Send the snapshot of a panel, then only the fields that change."""
+    if (feed := _async_get_feed(hass, connection, msg)) is None:
+        return
+
+    @callback
+    def _forward(delta: Snapshot) -> None:
+        connection.send_message(websocket_api.event_message(msg["id"], delta))
+
+    connection.subscriptions[msg["id"]] = feed.async_subscribe(_forward)
+    connection.send_result(msg["id"])
+    _forward(feed.snapshot())
@@ -0,0 +1,361 @@
+"""Zone indexes for the Qolsys Panel integration."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections.abc import Callable, Iterable, Set as AbstractSet
+from typing import Any
+
+from qolsys_controller import qolsys_controller
+from qolsys_controller.enum_qolsys import (
+    QolsysNotification,
+    TroubleZoneStatus,
+    ZoneStatus,
+)
+from qolsys_controller.observable import Event
+from qolsys_controller.zone import QolsysZone
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from .registry import panel_lookup
+
+# Fields a zone is indexed by, see zone_keys.
+INDEXED_FIELDS = ("partition_id", "sensor_type", "status", "battery")
+
+# Zone statuses reported as on by the zone binary sensor.
+OPEN_ZONE_STATUSES = frozenset(
+    {
+        ZoneStatus.OPEN,
+        ZoneStatus.ALARMED,
+        ZoneStatus.ACTIVATED,
+        ZoneStatus.DISCONNECTED,
+        ZoneStatus.INACTIVE,
+    }
+)
+
+# Zone statuses that keep a partition from arming unless the zone is bypassed:
+# the open and faulted statuses checked by the controller, and unreachable.
+NOT_READY_ZONE_STATUSES = frozenset({*TroubleZoneStatus, ZoneStatus.UNREACHABLE})
+
+# Kinds of zones counted by the partition zone summaries.
+SUMMARY_KINDS = ("open", "tampered", "low_battery")
+
+# Kinds of zones kept per partition: the summaries and the readiness to arm.
+TRACKED_KINDS = (*SUMMARY_KINDS, "not_ready")
+
+_OPEN_STATUS_NAMES = frozenset(status.name.lower() for status in OPEN_ZONE_STATUSES)
+_NOT_READY_STATUS_NAMES = frozenset(
+    status.name.lower() for status in NOT_READY_ZONE_STATUSES
+)
+_TROUBLE_STATUS_NAMES = frozenset(status.name.lower() for status in TroubleZoneStatus)
+
+
+def zone_keys(zone: QolsysZone) -> dict[str, str | None]:
+    """Return the indexed fields and the name of a zone.
+
+    Enum values are given by their lower case name, as in the controller event
+    payloads. The battery is None for zones without one.
+    """
+    battery: str | None = None
+    if zone.is_battery_enabled():
+        battery = "normal" if zone.battery_status == "Normal" else "low"
+    return {
+        "name": zone.sensorname,
+        "partition_id": zone.partition_id,
+        "sensor_type": zone.sensortype.name.lower(),
+        "status": zone.sensorstatus.name.lower(),
+        "battery": battery,
+    }
+
+
+def summary_kinds(keys: dict[str, str | None]) -> frozenset[str]:
+    """Return the tracked kinds a zone counts in, from its zone_keys.
+
+    The rules are those of the zone binary sensors: open as the zone sensor,
+    tampered as the tamper sensor and low battery as the battery sensor. A
+    zone is not ready in any of NOT_READY_ZONE_STATUSES.
+    """
+    kinds: set[str] = set()
+    if keys["status"] in _OPEN_STATUS_NAMES:
+        kinds.add("open")
+    elif keys["status"] == "tampered":
+        kinds.add("tampered")
+    if keys["battery"] == "low":
+        kinds.add("low_battery")
+    if keys["status"] in _NOT_READY_STATUS_NAMES:
+        kinds.add("not_ready")
+    return frozenset(kinds)
+
+
+class ZoneIndex:
+    """Zones of a panel indexed by partition, type, status, battery and name.
+
+    The indexes are updated from the zone notifications, one zone at a time,
+    so a query only touches the zones matching its most selective criterion.
+    The open, tampered, low battery and not ready zones of each partition are
+    kept the same way, from the old and new fields of the zone that changed.
+    """
+
+    def __init__(self, QolsysPanel: qolsys_controller) -> None:
+        """Set up empty indexes for the zones of the controller."""
+        self._panel = QolsysPanel
+        self._zones: dict[str, QolsysZone] = {}
+        self._keys: dict[str, dict[str, str | None]] = {}
+        self._indexes: dict[str, dict[str, set[str]]] = {
+            field: {} for field in INDEXED_FIELDS
+        }
+        # (case folded name, zone id), sorted for prefix searches.
+        self._names: list[tuple[str, str]] = []
+        # partition id -> summary kind -> {zone id: zone name}.
+        self._summaries: dict[str, dict[str, dict[str, str]]] = {}
+        self._summary_listeners: dict[str, list[Callable[[], None]]] = {}
+
+    @callback
+    def async_start(self) -> None:
+        """Index the zones of the panel and follow their changes."""
+        state = self._panel.state
+        state.register(QolsysNotification.ZONE_ADD, self._on_zone_add)
+        state.register(QolsysNotification.ZONE_DELETE, self._on_zone_delete)
+        for zone in state.zones:
+            self._add(zone)
+
+    @callback
+    def async_close(self) -> None:
+        """Stop following the zones of the panel."""
+        state = self._panel.state
+        state.unregister(QolsysNotification.ZONE_ADD, self._on_zone_add)
+        state.unregister(QolsysNotification.ZONE_DELETE, self._on_zone_delete)
+        for zone_id in list(self._zones):
+            self._remove(zone_id)
+
+    def _add(self, zone: QolsysZone) -> None:
+        """Index a zone and observe its updates."""
+        self._remove(zone.zone_id)
+        self._zones[zone.zone_id] = zone
+        zone.register(QolsysNotification.ZONE_UPDATE, self._on_zone_update)
+        self._reindex(zone)
+
+    def _remove(self, zone_id: str) -> None:
+        """Stop indexing a zone."""
+        if (zone := self._zones.pop(zone_id, None)) is None:
+            return
+        zone.unregister(QolsysNotification.ZONE_UPDATE, self._on_zone_update)
+        keys = self._keys.pop(zone_id)
+        self._unindex(zone_id, keys)
+        self._summarize(zone_id, keys, None)
+
+    def _reindex(self, zone: QolsysZone) -> None:
+        """Move a zone to the index entries of the fields that changed.
+
+        A status change, the most common update, only moves the zone between
+        two status entries; the sorted names are only touched on a rename.
+        """
+        zone_id = zone.zone_id
+        keys = zone_keys(zone)
+        if (previous := self._keys.get(zone_id)) == keys:
+            return
+        self._keys[zone_id] = keys
+        for field in INDEXED_FIELDS:
+            old = None if previous is None else previous[field]
+            if (new := keys[field]) == old:
+                continue
+            if old is not None:
+                self._discard(field, old, zone_id)
+            if new is not None:
+                self._indexes[field].setdefault(new, set()).add(zone_id)
+        if previous is None or previous["name"] != keys["name"]:
+            if previous is not None:
+                self._discard_name(previous["name"], zone_id)
+            insort(self._names, ((keys["name"] or "").casefold(), zone_id))
+        self._summarize(zone_id, previous, keys)
+
+    def _unindex(self, zone_id: str, keys: dict[str, str | None]) -> None:
+        """Remove a zone from the index entries of the given fields."""
+        for field in INDEXED_FIELDS:
+            if (value := keys[field]) is not None:
+                self._discard(field, value, zone_id)
+        self._discard_name(keys["name"], zone_id)
+
+    def _discard(self, field: str, value: str, zone_id: str) -> None:
+        """Remove a zone from the index entry of a field value."""
+        zone_ids = self._indexes[field][value]
+        zone_ids.discard(zone_id)
+        if not zone_ids:
+            del self._indexes[field][value]
+
+    def _discard_name(self, name: str | None, zone_id: str) -> None:
+        """Remove a zone from the sorted names."""
+        entry = ((name or "").casefold(), zone_id)
+        i = bisect_left(self._names, entry)
+        if i < len(self._names) and self._names[i] == entry:
+            del self._names[i]
+
+    def _summarize(
+        self,
+        zone_id: str,
+        previous: dict[str, str | None] | None,
+        keys: dict[str, str | None] | None,
+    ) -> None:
+        """Move a zone between partition summaries, from its old and new fields.
+
+        Either is None when the zone is not indexed. Only the listeners of the
+        partitions whose summary changed are called.
+        """
+        old, new = _summary_entries(previous), _summary_entries(keys)
+        if old == new:
+            return
+        for partition_id, kind, _ in old - new:
+            self._summaries[partition_id][kind].pop(zone_id, None)
+        for partition_id, kind, name in new - old:
+            summary = self._summaries.setdefault(
+                partition_id, {summary_kind: {} for summary_kind in TRACKED_KINDS}
+            )
+            summary[kind][zone_id] = name
+        for partition_id in {entry[0] for entry in old ^ new}:
+            for listener in list(self._summary_listeners.get(partition_id, ())):
+                listener()
+
+    def _on_zone_add(self, event: Event) -> None:
+        """Index a zone added to the panel."""
+        if (zone := panel_lookup(self._panel).zone(str(event.data["id"]))) is not None:
+            self._add(zone)
+
+    def _on_zone_delete(self, event: Event) -> None:
+        """Stop indexing a zone deleted from the panel."""
+        self._remove(str(event.data["id"]))
+
+    def _on_zone_update(self, event: Event) -> None:
+        """Reindex the zone that changed."""
+        zone = event.source
+        if isinstance(zone, QolsysZone) and self._zones.get(zone.zone_id) is zone:
+            self._reindex(zone)
+
+    def summary(self, partition_id: str, kind: str) -> dict[str, str]:
+        """Return the zones of a summary kind in a partition, {zone id: name}."""
+        if (summary := self._summaries.get(partition_id)) is None:
+            return {}
+        return summary[kind]
+
+    def blocking_zones(self, partition_id: str) -> dict[str, str]:
+        """Return the zones keeping a partition from arming, {zone id: name}.
+
+        These are the not ready zones the panel does not bypass when arming:
+        every one of them when auto bypass is disabled, else those that cannot
+        be bypassed. Only the not ready zones of the partition are checked.
+        """
+        not_ready = self.summary(partition_id, "not_ready")
+        if not not_ready:
+            return {}
+        auto_bypass = self._panel.panel.AUTO_BYPASS != "false"
+        return {
+            zone_id: name
+            for zone_id, name in not_ready.items()
+            if not (auto_bypass and self._zones[zone_id].is_bypassable())
+        }
+
+    def bypass_required_zones(self, partition_id: str) -> dict[str, str]:
+        """Return the zones the panel refuses to arm with, {zone id: name}.
+
+        This is the rule of the controller arm command: with auto bypass
+        disabled, the open or faulted zones that could be bypassed. Other not
+        ready zones, such as unreachable or safety zones, do not stop it.
+        """
+        if self._panel.panel.AUTO_BYPASS != "false":
+            return {}
+        return self.bypassable_zones(partition_id)
+
+    def bypassable_zones(self, partition_id: str) -> dict[str, str]:
+        """Return the open or faulted zones of a partition that can be bypassed.
+
+        These are the zones the panel bypasses when arming with auto bypass
+        enabled, {zone id: zone name}.
+        """
+        return {
+            zone_id: name
+            for zone_id, name in self.summary(partition_id, "not_ready").items()
+            if self._keys[zone_id]["status"] in _TROUBLE_STATUS_NAMES
+            and self._zones[zone_id].is_bypassable()
+        }
+
+    @callback
+    def async_listen_summary(
+        self, partition_id: str, listener: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """Call the listener whenever the summary of the partition changes."""
+        listeners = self._summary_listeners.setdefault(partition_id, [])
+        listeners.append(listener)
+
+        @callback
+        def _remove() -> None:
+            listeners.remove(listener)
+
+        return _remove
+
+    def _name_matches(self, prefix: str) -> set[str]:
+        """Return the zones whose name starts with the prefix, ignoring case."""
+        prefix = prefix.casefold()
+        matches: set[str] = set()
+        i = bisect_left(self._names, (prefix, ""))
+        while i < len(self._names) and self._names[i][0].startswith(prefix):
+            matches.add(self._names[i][1])
+            i += 1
+        return matches
+
+    def query(
+        self,
+        *,
+        partition_id: str | None = None,
+        sensor_types: Iterable[str] = (),
+        statuses: Iterable[str] = (),
+        battery: str | None = None,
+        name_prefix: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return the zones matching every given criterion, by zone id.
+
+        Each criterion selects the index sets of its values, used as they are:
+        a zone has one value per field, so the sets of a criterion are
+        disjoint. Only the zones of the smallest criterion are walked, each
+        looked up in the sets of the others.
+        """
+        criteria: list[list[AbstractSet[str]]] = []
+        for field, values in (
+            ("partition_id", () if partition_id is None else (partition_id,)),
+            ("sensor_type", sensor_types),
+            ("status", statuses),
+            ("battery", () if battery is None else (battery,)),
+        ):
+            if values := dict.fromkeys(values):
+                index = self._indexes[field]
+                criteria.append([index.get(value, frozenset()) for value in values])
+        if name_prefix is not None:
+            criteria.append([self._name_matches(name_prefix)])
+
+        zone_ids: Iterable[str] = self._keys
+        if criteria:
+            criteria.sort(key=lambda sets: sum(map(len, sets)))
+            smallest, *others = criteria
+            zone_ids = [
+                zone_id
+                for ids in smallest
+                for zone_id in ids
+                if all(any(zone_id in other for other in sets) for sets in others)
+            ]
+        return [
+            {"zone_id": zone_id, **self._keys[zone_id]}
+            for zone_id in sorted(zone_ids, key=zone_sort_key)
+        ]
+
+
+def _summary_entries(
+    keys: dict[str, str | None] | None,
+) -> frozenset[tuple[str, str, str]]:
+    """Return the (partition id, kind, name) summary entries of a zone."""
+    if keys is None or (partition_id := keys["partition_id"]) is None:
+        return frozenset()
+    name = keys["name"] or ""
+    return frozenset((partition_id, kind, name) for kind in summary_kinds(keys))
+
+
+def zone_sort_key(zone_id: str) -> tuple[int, str]:
+    """Sort zone ids numerically when they are numbers."""
+    return (int(zone_id), "") if zone_id.isdigit() else (0, zone_id)
@@ -0,0 +1,99 @@
+"""Tests for the Qolsys Panel external statistics aggregation."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.qolsys_panel.aggregator import (
+    StatisticsAggregator,
+    StatisticSeries,
+)
+from homeassistant.components.recorder.models import (
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.core import HomeAssistant
+
+HOUR = datetime(2026, 1, 1, 10, tzinfo=UTC)
+T0 = HOUR.timestamp()
+
+
+def _metadata(statistic_id: str, has_sum: bool) -> StatisticMetaData:
+    return StatisticMetaData(
+        mean_type=StatisticMeanType.NONE if has_sum else StatisticMeanType.ARITHMETIC,
+        has_sum=has_sum,
+        name=None,
+        source="qolsys_panel",
+        statistic_id=statistic_id,
+        unit_class=None,
+        unit_of_measurement="W",
+    )
+
+
+def test_series_mean() -> None:
+    """An hour gets the time weighted mean, minimum and maximum of its values."""
+    series = StatisticSeries(_metadata("qolsys_panel:power", False))
+    series.add(T0, 10.0)
+    series.add(T0 + 100, 40.0)
+    series.add(T0 + 200, 10.0)
+    series.add(T0 + 1800, 20.0)
+    series.advance(T0 + 3599)
+    assert not series.pending
+    assert len(series.recent) == 11
+    assert series.recent[0].mean == pytest.approx(20.0)
+
+    series.advance(T0 + 3600)
+    assert list(series.pending) == [
+        {"start": HOUR, "mean": pytest.approx(57000 / 3600), "min": 10.0, "max": 40.0}
+    ]
+    assert len(series.recent) == 12
+
+
+def test_series_sum() -> None:
+    """An hour gets the last value and the increase since the first sample."""
+    series = StatisticSeries(_metadata("qolsys_panel:energy", True))
+    series.add(T0, 100.0)
+    series.add(T0 + 600, 105.0)
+    # A lower value is a meter reset.
+    series.add(T0 + 1200, 2.0)
+    series.advance(T0 + 3600)
+    assert list(series.pending) == [{"start": HOUR, "state": 2.0, "sum": 7.0}]
+
+
+async def test_publish(hass: HomeAssistant) -> None:
+    """Closed hours are published, sums continuing from the recorder."""
+    aggregator = StatisticsAggregator(hass)
+    aggregator.async_add_series(_metadata("qolsys_panel:power", False))
+    aggregator.async_add_series(_metadata("qolsys_panel:energy", True))
+    aggregator.async_record("qolsys_panel:power", HOUR, 10.0)
+    aggregator.async_record("qolsys_panel:energy", HOUR, 100.0)
+    aggregator.async_record("qolsys_panel:energy", HOUR.replace(minute=30), 103.0)
+    recorder = MagicMock()
+    recorder.async_add_executor_job = AsyncMock(
+        return_value={"qolsys_panel:energy": [{"sum": 50.0}]}
+    )
+    hass.config.components.add("recorder")
+
+    with (
+        patch(
+            "custom_components.qolsys_panel.aggregator.get_instance",
+            return_value=recorder,
+        ),
+        patch(
+            "custom_components.qolsys_panel.aggregator.async_add_external_statistics"
+        ) as add_statistics,
+    ):
+        await aggregator._async_publish(HOUR.replace(hour=11, second=10))
+        await aggregator._async_publish(HOUR.replace(hour=11, minute=30))
+
+    assert add_statistics.call_count == 2
+    published = {
+        call.args[1]["statistic_id"]: call.args[2]
+        for call in add_statistics.call_args_list
+    }
+    assert published == {
+        "qolsys_panel:power": [{"start": HOUR, "mean": 10.0, "min": 10.0, "max": 10.0}],
+        "qolsys_panel:energy": [{"start": HOUR, "state": 103.0, "sum": 53.0}],
+    }
+    assert aggregator.as_dict()["qolsys_panel:power"]["pending_hours"] == 0
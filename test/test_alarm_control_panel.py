@@ -1,7 +1,7 @@
 """Tests for the Qolsys Panel alarm control panel."""
 
 from typing import cast
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 from conftest import PANEL_MAC
 import pytest
@@ -9,17 +9,22 @@ from qolsys_controller.enum_qolsys import (
     PartitionAlarmState,
     PartitionArmingType,
     PartitionSystemStatus,
+    ZoneSensorType,
+    ZoneStatus,
 )
 from qolsys_controller.errors import (
     QolsysOperationTimeoutError,
     QolsysUserCodeError,
     QolsysZoneBypassError,
 )
+from qolsys_controller.zone import QolsysZone
 
 from custom_components.qolsys_panel.alarm_control_panel import (
     PartitionAlarmControlPanel,
     async_setup_entry,
 )
+from custom_components.qolsys_panel.runtime import QolsysPanelRuntime
+from custom_components.qolsys_panel.zone_index import ZoneIndex
 from homeassistant.components.alarm_control_panel import (
     AlarmControlPanelState,
     CodeFormat,
@@ -196,3 +201,65 @@ async def test_arm_errors(controller: MagicMock, error: Exception) -> None:
     cast(AsyncMock, entity._partition.arm).side_effect = error
     with pytest.raises(HomeAssistantError):
         await entity.async_alarm_arm_away("1234")
+
+
+async def test_arm_fails_fast_when_bypass_required(controller: MagicMock) -> None:
+    """Arming fails without a panel command when the controller would refuse it."""
+    entity = _panel(controller)
+    runtime = QolsysPanelRuntime()
+    runtime.zones = MagicMock()
+    runtime.journal = MagicMock()
+    runtime.zones.bypass_required_zones.return_value = {
+        "10": "Back Door",
+        "2": "Door",
+    }
+    with (
+        patch.object(
+            PartitionAlarmControlPanel,
+            "_runtime",
+            new_callable=PropertyMock,
+            return_value=runtime,
+        ),
+        pytest.raises(HomeAssistantError, match=r"bypass required:\['2', '10'\]"),
+    ):
+        await entity.async_alarm_arm_away("1234")
+    cast(AsyncMock, entity._partition.arm).assert_not_awaited()
+    runtime.zones.bypass_required_zones.assert_called_once_with("1")
+    runtime.journal.async_append.assert_called_once_with(
+        "ARM_FAILURE",
+        "1",
+        {
+            "arm_mode": "ARM_AWAY",
+            "error": "ARM_AWAY: Zone bypass required:['2', '10']",
+        },
+    )
+
+
+async def test_arm_with_open_motion_zone(controller: MagicMock) -> None:
+    """An open zone the panel does not refuse is left to the panel."""
+    motion = MagicMock(spec=QolsysZone)
+    motion.zone_id = "3"
+    motion.sensorname = "Motion"
+    motion.sensortype = ZoneSensorType.MOTION
+    motion.sensorstatus = ZoneStatus.OPEN
+    motion.partition_id = "1"
+    motion.is_battery_enabled.return_value = False
+    motion.is_bypassable.return_value = False
+    controller.state.zones = [motion]
+    controller.panel.AUTO_BYPASS = "true"
+    runtime = QolsysPanelRuntime()
+    runtime.zones = ZoneIndex(controller)
+    runtime.zones.async_start()
+    assert runtime.zones.blocking_zones("1") == {"3": "Motion"}
+
+    entity = _panel(controller)
+    with patch.object(
+        PartitionAlarmControlPanel,
+        "_runtime",
+        new_callable=PropertyMock,
+        return_value=runtime,
+    ):
+        await entity.async_alarm_arm_away("1234")
+    cast(AsyncMock, entity._partition.arm).assert_awaited_once_with(
+        PartitionArmingType.ARM_AWAY, user_code="1234"
+    )
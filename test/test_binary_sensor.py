@@ -1,17 +1,26 @@
 """Tests for the Qolsys Panel binary sensors."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import cast
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 from conftest import PANEL_MAC
 import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    MockEntityPlatform,
+    async_fire_time_changed,
+)
 from qolsys_controller.enum_qolsys import (
+    ControllerState,
     PartitionAlarmType,
     PartitionQuickExitState,
+    QolsysNotification,
     ZoneSensorType,
     ZoneStatus,
 )
+from qolsys_controller.observable import Event
+from qolsys_controller.zone import QolsysZone
 
 from custom_components.qolsys_panel.binary_sensor import (
     PANEL_SENSOR,
@@ -21,6 +30,7 @@ from custom_components.qolsys_panel.binary_sensor import (
     PartitionEntryDelaySensor,
     PartitionExitSoundSensor,
     PartitionQuickExitSensor,
+    PartitionReadySensor,
     QolsysChimeSensor,
     QolsysDoorbellSensor,
     ZoneSensor_ACStatus,
@@ -30,11 +40,20 @@ from custom_components.qolsys_panel.binary_sensor import (
     ZonesSensor,
     async_setup_entry,
 )
+from custom_components.qolsys_panel.const import DOMAIN
+from custom_components.qolsys_panel.flapping import (
+    FLAPPING_THRESHOLD,
+    FLAPPING_WINDOW,
+    FlappingDetector,
+)
+from custom_components.qolsys_panel.runtime import DATA_RUNTIME, QolsysPanelRuntime
+from custom_components.qolsys_panel.zone_index import ZoneIndex
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntityDescription,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 
 UID = PANEL_MAC
 CALL_LATER = "custom_components.qolsys_panel.binary_sensor.async_call_later"
@@ -122,6 +141,21 @@ def test_partition_quick_exit(controller: MagicMock) -> None:
     assert set(attrs) == {"quick_exit_state", "delay", "start_time"}
 
 
+def test_partition_ready(controller: MagicMock) -> None:
+    """Ready sensor is off while zones block arming, and lists them."""
+    zones = MagicMock(spec=ZoneIndex)
+    zones.blocking_zones.return_value = {}
+    sensor = PartitionReadySensor(controller, "1", UID, zones)
+    assert sensor.unique_id == f"{UID}_partition1_ready"
+    assert sensor.is_on is True
+    assert sensor.extra_state_attributes == {"blocking_zones": []}
+
+    zones.blocking_zones.return_value = {"10": "Back Door", "2": "Door"}
+    assert sensor.is_on is False
+    assert sensor.extra_state_attributes == {"blocking_zones": ["Door", "Back Door"]}
+    zones.blocking_zones.assert_called_with("1")
+
+
 @pytest.mark.parametrize(
     ("alarm_type", "present"),
     [
@@ -232,6 +266,61 @@ def test_zones_sensor_is_on(
     assert sensor.is_on is expected
 
 
+def test_zones_sensor_event_rate(controller: MagicMock) -> None:
+    """The update rate of a zone is an attribute only while it is flapping."""
+    sensor = ZonesSensor(controller, "1", UID)
+    runtime = MagicMock()
+    runtime.flapping.is_flapping.return_value = False
+    runtime.flapping.event_rate.return_value = 75
+    with patch.object(
+        ZonesSensor, "_runtime", new_callable=PropertyMock, return_value=runtime
+    ):
+        assert sensor.extra_state_attributes is None
+        runtime.flapping.is_flapping.return_value = True
+        assert sensor.extra_state_attributes == {"event_rate": 75}
+    runtime.flapping.is_flapping.assert_called_with("1")
+
+
+async def test_zones_sensor_event_rate_cleared_on_recovery(
+    hass: HomeAssistant, controller: MagicMock
+) -> None:
+    """The state is written when the zone stops flapping, without its rate."""
+    zone = MagicMock(spec=QolsysZone)
+    zone.zone_id = "1"
+    zone.sensorname = "Back Door"
+    controller.state.zones = [zone]
+    controller.controller_state = ControllerState.CONNECTED
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    runtime = QolsysPanelRuntime()
+    runtime.flapping = FlappingDetector(hass, entry.entry_id, controller)
+    hass.data.setdefault(DATA_RUNTIME, {})[entry.entry_id] = runtime
+    sensor = ZonesSensor(controller, "1", UID)
+    platform = MockEntityPlatform(hass, domain="binary_sensor", platform_name=DOMAIN)
+    platform.config_entry = entry
+
+    with patch("custom_components.qolsys_panel.flapping.time.monotonic") as monotonic:
+        monotonic.return_value = 1000.0
+        runtime.flapping.async_start()
+        await platform.async_add_entities([sensor])
+        update = Event(QolsysNotification.ZONE_UPDATE, zone, {})
+        for _ in range(FLAPPING_THRESHOLD):
+            runtime.flapping._on_zone_update(update)
+        state = hass.states.get(sensor.entity_id)
+        assert state is not None
+        assert state.attributes["event_rate"] == FLAPPING_THRESHOLD
+
+        # No zone update follows: the recovery alone rewrites the state.
+        monotonic.return_value = 1000.0 + FLAPPING_WINDOW + 10
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=31))
+        await hass.async_block_till_done()
+
+    state = hass.states.get(sensor.entity_id)
+    assert state is not None
+    assert "event_rate" not in state.attributes
+    runtime.flapping.async_close()
+
+
 @pytest.mark.parametrize(
     ("sensortype", "expected"),
     [
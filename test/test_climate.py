@@ -1,5 +1,6 @@
 """Tests for the Qolsys Panel climate entities."""
 
+import asyncio
 from typing import cast
 from unittest.mock import AsyncMock, MagicMock
 
@@ -201,3 +202,34 @@ async def test_set_temperature_single(controller: MagicMock) -> None:
     cast(AsyncMock, climate._service.set_temperature).assert_awaited_once_with(
         72, QolsysHvacMode.HEAT
     )
+
+
+async def test_set_temperature_coalesced(controller: MagicMock) -> None:
+    """Setpoints requested while one is in flight collapse to the latest."""
+    climate = _climate(controller)
+    climate._service.hvac_mode = QolsysHvacMode.HEAT
+    release = asyncio.Event()
+
+    async def _set_temperature(temp: float, mode: QolsysHvacMode) -> None:
+        if temp == 70:
+            await release.wait()
+
+    mock_set = cast(AsyncMock, climate._service.set_temperature)
+    mock_set.side_effect = _set_temperature
+
+    first = asyncio.create_task(climate.async_set_temperature(**{ATTR_TEMPERATURE: 70}))
+    await asyncio.sleep(0)
+    await asyncio.gather(
+        climate.async_set_temperature(**{ATTR_TEMPERATURE: 71}),
+        climate.async_set_temperature(**{ATTR_TEMPERATURE: 72}),
+        _release_later(release),
+    )
+    await first
+
+    assert [c.args[0] for c in mock_set.await_args_list] == [70, 72]
+
+
+async def _release_later(event: asyncio.Event) -> None:
+    """Set the event once the queued setpoints have been requested."""
+    await asyncio.sleep(0)
+    event.set()
@@ -0,0 +1,288 @@
+"""Tests for the Qolsys Panel command helpers."""
+
+import asyncio
+
+import pytest
+from qolsys_controller.errors import QolsysOperationTimeoutError
+
+from custom_components.qolsys_panel.command import (
+    CONTROLLER_COMMAND_TIMEOUT,
+    CommandCoalescer,
+    CommandDeadlines,
+    CommandPriority,
+    CommandScheduler,
+)
+
+
+async def test_coalescer_keeps_latest_target() -> None:
+    """Targets queued behind an in-flight command collapse to the latest one."""
+    coalescer = CommandCoalescer()
+    release = asyncio.Event()
+    sent: list[int] = []
+
+    async def _send(value: int) -> None:
+        sent.append(value)
+        if value == 1:
+            await release.wait()
+
+    first = asyncio.create_task(coalescer.async_send(lambda: _send(1)))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(coalescer.async_send(lambda: _send(2)))
+    third = asyncio.create_task(coalescer.async_send(lambda: _send(3)))
+    await asyncio.sleep(0)
+
+    assert await second is False
+    release.set()
+    assert await first is True
+    assert await third is True
+    assert sent == [1, 3]
+
+
+async def test_coalescer_sends_pending_after_error() -> None:
+    """A failing in-flight command still hands over to the pending target."""
+    coalescer = CommandCoalescer()
+    release = asyncio.Event()
+    sent: list[int] = []
+
+    async def _fail() -> None:
+        await release.wait()
+        raise RuntimeError("boom")
+
+    async def _send() -> None:
+        sent.append(2)
+
+    first = asyncio.create_task(coalescer.async_send(_fail))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(coalescer.async_send(_send))
+    await asyncio.sleep(0)
+    release.set()
+
+    with pytest.raises(RuntimeError):
+        await first
+    assert await second is True
+    assert sent == [2]
+
+
+async def test_coalescer_cancelled_waiter() -> None:
+    """A cancelled pending command does not block later commands."""
+    coalescer = CommandCoalescer()
+    release = asyncio.Event()
+
+    async def _block() -> None:
+        await release.wait()
+
+    async def _noop() -> None:
+        return None
+
+    first = asyncio.create_task(coalescer.async_send(_block))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(coalescer.async_send(_noop))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    release.set()
+    assert await first is True
+    assert await coalescer.async_send(_noop) is True
+
+
+async def test_coalescer_waiter_cancelled_while_releasing() -> None:
+    """A waiter cancelled just before the handover does not stall the device."""
+    coalescer = CommandCoalescer()
+    release = asyncio.Event()
+
+    async def _block() -> None:
+        await release.wait()
+
+    async def _noop() -> None:
+        return None
+
+    first = asyncio.create_task(coalescer.async_send(_block))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(coalescer.async_send(_noop))
+    await asyncio.sleep(0)
+    # The in-flight command finishes before the cancelled waiter runs.
+    release.set()
+    waiter.cancel()
+    assert await first is True
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert await asyncio.wait_for(coalescer.async_send(_noop), 1) is True
+
+
+async def test_scheduler_security_not_blocked_by_background() -> None:
+    """A full background class does not delay security commands."""
+    scheduler = CommandScheduler(
+        {
+            CommandPriority.SECURITY: 1,
+            CommandPriority.INTERACTIVE: 1,
+            CommandPriority.BACKGROUND: 1,
+        }
+    )
+    release = asyncio.Event()
+
+    async def _block() -> None:
+        await release.wait()
+
+    async def _noop() -> str:
+        return "done"
+
+    first = asyncio.create_task(scheduler.async_run(CommandPriority.BACKGROUND, _block))
+    second = asyncio.create_task(
+        scheduler.async_run(CommandPriority.BACKGROUND, _block)
+    )
+    await asyncio.sleep(0)
+
+    assert await scheduler.async_run(CommandPriority.SECURITY, _noop) == "done"
+    metrics = scheduler.as_dict()
+    assert metrics["background"]["in_flight"] == 1
+    assert metrics["background"]["queue_depth"] == 1
+    assert metrics["security"]["wait_time"]["count"] == 1
+
+    release.set()
+    await asyncio.gather(first, second)
+    assert scheduler.as_dict()["background"]["max_queue_depth"] == 1
+
+
+async def test_scheduler_lower_class_yields_to_queued_higher_class() -> None:
+    """Lower classes do not start while a higher class has commands queued."""
+    scheduler = CommandScheduler(
+        {
+            CommandPriority.SECURITY: 1,
+            CommandPriority.INTERACTIVE: 1,
+            CommandPriority.BACKGROUND: 4,
+        }
+    )
+    release = asyncio.Event()
+    order: list[str] = []
+
+    async def _run(name: str) -> None:
+        order.append(name)
+        if name == "interactive-1":
+            await release.wait()
+
+    tasks = [
+        asyncio.create_task(
+            scheduler.async_run(
+                CommandPriority.INTERACTIVE, lambda: _run("interactive-1")
+            )
+        ),
+        asyncio.create_task(
+            scheduler.async_run(
+                CommandPriority.INTERACTIVE, lambda: _run("interactive-2")
+            )
+        ),
+        asyncio.create_task(
+            scheduler.async_run(CommandPriority.BACKGROUND, lambda: _run("background"))
+        ),
+    ]
+    await asyncio.sleep(0)
+    assert order == ["interactive-1"]
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert order == ["interactive-1", "interactive-2", "background"]
+
+
+async def test_scheduler_cancelled_waiter_frees_queue() -> None:
+    """A cancelled queued command no longer holds back other classes."""
+    scheduler = CommandScheduler(
+        {
+            CommandPriority.SECURITY: 1,
+            CommandPriority.INTERACTIVE: 1,
+            CommandPriority.BACKGROUND: 1,
+        }
+    )
+    release = asyncio.Event()
+
+    async def _block() -> None:
+        await release.wait()
+
+    async def _noop() -> None:
+        return None
+
+    first = asyncio.create_task(scheduler.async_run(CommandPriority.SECURITY, _block))
+    queued = asyncio.create_task(scheduler.async_run(CommandPriority.SECURITY, _noop))
+    await asyncio.sleep(0)
+    queued.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+
+    await scheduler.async_run(CommandPriority.BACKGROUND, _noop)
+    release.set()
+    await first
+
+
+async def test_deadlines_adapt_to_round_trip_times() -> None:
+    """The deadline starts at the maximum and follows observed round trips."""
+    deadlines = CommandDeadlines(factor=4.0, minimum=1.0, maximum=30.0, min_samples=3)
+
+    async def _noop() -> None:
+        return None
+
+    assert deadlines.deadline("light.turn_on") == 30.0
+    for _ in range(3):
+        await deadlines.async_run("light.turn_on", _noop)
+
+    assert deadlines.deadline("light.turn_on") == 1.0
+    assert deadlines.deadline("lock.lock") == 30.0
+    stats = deadlines.as_dict()["light.turn_on"]
+    assert stats["count"] == 3
+    assert stats["timeouts"] == 0
+
+
+async def test_deadlines_cancel_late_command() -> None:
+    """A command missing its deadline is cancelled and reported as a timeout."""
+    deadlines = CommandDeadlines(maximum=0.01)
+    cancelled = False
+
+    async def _slow() -> None:
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    with pytest.raises(QolsysOperationTimeoutError, match="lock.lock"):
+        await deadlines.async_run("lock.lock", _slow)
+
+    assert cancelled
+    assert deadlines.as_dict()["lock.lock"]["timeouts"] == 1
+
+
+async def test_deadlines_grow_after_timeouts() -> None:
+    """Timed out commands count as samples, so the deadline grows again."""
+    deadlines = CommandDeadlines(factor=2.0, minimum=0.01, maximum=30.0, min_samples=3)
+
+    async def _noop() -> None:
+        return None
+
+    async def _slow() -> None:
+        await asyncio.sleep(10)
+
+    for _ in range(3):
+        await deadlines.async_run("light.turn_on", _noop)
+    assert deadlines.deadline("light.turn_on") == 0.01
+
+    for _ in range(3):
+        with pytest.raises(QolsysOperationTimeoutError):
+            await deadlines.async_run("light.turn_on", _slow)
+    assert deadlines.deadline("light.turn_on") >= 0.02
+    assert deadlines.as_dict()["light.turn_on"]["count"] == 6
+
+
+async def test_deadlines_floor_of_arming() -> None:
+    """Arming and disarming wait at least as long as the controller."""
+    deadlines = CommandDeadlines(minimum=1.0, maximum=10.0, min_samples=1)
+
+    async def _noop() -> None:
+        return None
+
+    for command_type in ("arm", "disarm", "lock.lock"):
+        await deadlines.async_run(command_type, _noop)
+    assert deadlines.deadline("arm") == CONTROLLER_COMMAND_TIMEOUT
+    assert deadlines.deadline("disarm") == CONTROLLER_COMMAND_TIMEOUT
+    assert deadlines.deadline("lock.lock") == 1.0
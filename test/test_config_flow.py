@@ -2,6 +2,7 @@
 
 import asyncio
 from collections.abc import Iterable
+import logging
 from pathlib import Path
 from ssl import SSLError
 from typing import cast
@@ -25,8 +26,14 @@ from custom_components.qolsys_panel.const import (
     DOMAIN,
     OPTION_ARM_CODE,
     OPTION_DISARM_CODE,
+    OPTION_EVENT_JOURNAL,
+    OPTION_EXTERNAL_STATISTICS,
     OPTION_MOTION_SENSOR_DELAY,
     OPTION_MOTION_SENSOR_DELAY_ENABLED,
+    OPTION_OPTIMISTIC,
+    OPTION_SENSOR_DEADBAND_ENABLED,
+    OPTION_SENSOR_DEADBAND_MAX_INTERVAL,
+    OPTION_THROTTLE_FLAPPING,
     OPTION_TRIGGER_AUXILLIARY,
     OPTION_TRIGGER_FIRE,
     OPTION_TRIGGER_POLICE,
@@ -393,6 +400,31 @@ async def test_existing_pki_flow(
     assert len(mock_setup_entry.mock_calls) == 1
 
 
+async def test_flow_debug_logging(
+    hass: HomeAssistant,
+    mock_qolsys_controller: MagicMock,
+    mock_setup_entry: AsyncMock,
+    pki_dir: Path,
+):
+    """The controller logs at DEBUG while the flow connects, then as before."""
+    logger = logging.getLogger("qolsys_controller")
+    logger.setLevel(logging.WARNING)
+    levels: list[int] = []
+    mock_qolsys_controller.run_forever.side_effect = lambda **_: levels.append(
+        logger.level
+    )
+
+    result = await _start_menu_step(hass, "existing_pki")
+    assert logger.level == logging.WARNING
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], EXISTING_PKI_USER_INPUT
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert levels == [logging.DEBUG]
+    assert logger.level == logging.WARNING
+    logger.setLevel(logging.NOTSET)
+
+
 async def test_existing_pki_no_pki_found(
     hass: HomeAssistant,
     mock_qolsys_controller: MagicMock,
@@ -687,6 +719,12 @@ async def test_options_flow(
         OPTION_TRIGGER_FIRE: True,
         OPTION_MOTION_SENSOR_DELAY_ENABLED: True,
         OPTION_MOTION_SENSOR_DELAY: 120,
+        OPTION_OPTIMISTIC: True,
+        OPTION_THROTTLE_FLAPPING: True,
+        OPTION_SENSOR_DEADBAND_ENABLED: True,
+        OPTION_SENSOR_DEADBAND_MAX_INTERVAL: 600,
+        OPTION_EXTERNAL_STATISTICS: True,
+        OPTION_EVENT_JOURNAL: True,
     }
     result = await hass.config_entries.options.async_configure(
         result["flow_id"], user_input
@@ -0,0 +1,52 @@
+"""Tests for the Qolsys Panel scoped debug logging."""
+
+from datetime import timedelta
+import logging
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.qolsys_panel.debug import (
+    CONTROLLER_LOGGER,
+    ScopedDebugLogging,
+    async_open_debug_window,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+
+def test_scoped_debug_logging() -> None:
+    """The level is restored once the last hold is released."""
+    logger = logging.getLogger("qolsys_panel_test")
+    logger.setLevel(logging.INFO)
+    scoped = ScopedDebugLogging()
+    scoped.acquire([logger.name])
+    scoped.acquire([logger.name])
+    assert logger.level == logging.DEBUG
+    scoped.release([logger.name])
+    assert logger.level == logging.DEBUG
+    scoped.release([logger.name])
+    assert logger.level == logging.INFO
+    # Releasing a logger not held changes nothing.
+    scoped.release([logger.name])
+    assert logger.level == logging.INFO
+
+
+async def test_debug_window(hass: HomeAssistant) -> None:
+    """Opening the window again moves its end."""
+    logger = logging.getLogger(CONTROLLER_LOGGER)
+    logger.setLevel(logging.WARNING)
+    start = dt_util.utcnow()
+    async_open_debug_window(hass, timedelta(minutes=10))
+    assert logger.level == logging.DEBUG
+
+    until = async_open_debug_window(hass, timedelta(minutes=20))
+    assert until >= start + timedelta(minutes=20)
+
+    async_fire_time_changed(hass, start + timedelta(minutes=11))
+    await hass.async_block_till_done()
+    assert logger.level == logging.DEBUG
+
+    async_fire_time_changed(hass, until + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert logger.level == logging.WARNING
+    logger.setLevel(logging.NOTSET)
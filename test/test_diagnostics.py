@@ -1,16 +1,33 @@
 """Tests for the Qolsys Panel diagnostics."""
 
-from unittest.mock import MagicMock
+import copy
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from conftest import PANEL_MAC
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from qolsys_controller.enum_qolsys import QolsysNotification
+from qolsys_controller.observable import Event
 
-from custom_components.qolsys_panel.const import CONF_IMEI, CONF_RANDOM_MAC
+from custom_components.qolsys_panel.const import CONF_IMEI, CONF_RANDOM_MAC, DOMAIN
 from custom_components.qolsys_panel.diagnostics import (
+    JOURNAL_PERIOD,
+    RECORD_LISTS,
+    TO_REDACT,
     async_get_config_entry_diagnostics,
+    async_get_device_diagnostics,
+    redact_diagnostics,
 )
-from homeassistant.components.diagnostics import REDACTED
+from custom_components.qolsys_panel.runtime import (
+    DATA_RUNTIME,
+    EventHistory,
+    QolsysPanelRuntime,
+    UpdateStats,
+)
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
 from homeassistant.const import CONF_HOST, CONF_MAC
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 
 ENTRY_DATA = {
     CONF_HOST: "192.168.1.50",
@@ -65,3 +82,183 @@ async def test_diagnostics_with_runtime_data(hass: HomeAssistant) -> None:
     assert result["data"]["partitions"][0]["name"] == REDACTED
     assert result["data"]["zones"][0]["sensorname"] == REDACTED
     assert result["data"]["zones"][0]["id"] == 1
+
+
+async def test_diagnostics_snapshot_in_chunks(hass: HomeAssistant) -> None:
+    """Zone records are copied in chunks and keep their order."""
+    panel = MagicMock()
+    panel.state.partitions = []
+    panel.state.automation_devices = []
+    panel.panel.db.get_adc_devices.return_value = []
+
+    zones = []
+    for zone_id in range(5):
+        zone = MagicMock()
+        zone.to_dict.return_value = {"id": zone_id, "sensorname": f"Zone {zone_id}"}
+        zones.append(zone)
+    panel.state.zones = zones
+
+    with patch("custom_components.qolsys_panel.diagnostics.SNAPSHOT_CHUNK_SIZE", 2):
+        result = await async_get_config_entry_diagnostics(hass, _entry(panel))
+
+    assert [zone["id"] for zone in result["data"]["zones"]] == list(range(5))
+    assert all(zone["sensorname"] == REDACTED for zone in result["data"]["zones"])
+
+
+async def test_diagnostics_journal(hass: HomeAssistant) -> None:
+    """The journal entries of the last day are included, redacted."""
+    panel = MagicMock()
+    panel.state.partitions = panel.state.zones = []
+    panel.state.automation_devices = []
+    panel.panel.db.get_adc_devices.return_value = []
+    entry = _entry(panel)
+    entry.entry_id = "entry"
+    runtime = QolsysPanelRuntime()
+    runtime.journal = MagicMock()
+    runtime.journal.async_read = AsyncMock(
+        return_value=[
+            {
+                "t": 5.0,
+                "type": "ZONE_UPDATE",
+                "id": "1",
+                "data": {"sensorname": "Front Door", "sensorstatus": "Open"},
+            },
+            {"t": 6.0, "type": "ZONE_DELETE", "id": "1", "data": None},
+        ]
+    )
+    hass.data.setdefault(DATA_RUNTIME, {})["entry"] = runtime
+
+    result = await async_get_config_entry_diagnostics(hass, entry)
+
+    start, end = runtime.journal.async_read.await_args.args
+    assert end - start == JOURNAL_PERIOD
+    assert result["journal"] == {
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "entries": [
+            {
+                "t": 5.0,
+                "type": "ZONE_UPDATE",
+                "id": "1",
+                "data": {"sensorname": REDACTED, "sensorstatus": "Open"},
+            },
+            {"t": 6.0, "type": "ZONE_DELETE", "id": "1", "data": None},
+        ],
+    }
+
+    runtime.journal.async_read.side_effect = PermissionError("denied")
+    result = await async_get_config_entry_diagnostics(hass, entry)
+    assert result["journal"] == {"error": "denied"}
+
+
+def _payload() -> dict[str, Any]:
+    """Return a payload covering every way a record can hold a sensitive key."""
+    values: list[Any] = ["Front Door", "", None, 0, False, "aa:bb"]
+    records = [
+        {
+            "id": index,
+            "sensorname": values[index % len(values)],
+            "name": values[(index + 1) % len(values)],
+            CONF_MAC: values[(index + 2) % len(values)],
+            "zone_type": "1",
+        }
+        for index in range(12)
+    ] + [{"id": 99, "zone_type": "1"}]
+    return {
+        **ENTRY_DATA,
+        "hardware_version": "IQ4",
+        "language": "en",
+        CONF_HOST: "",
+        **{key: copy.deepcopy(records) for key in RECORD_LISTS},
+    }
+
+
+def test_redactor_matches_generic_redaction() -> None:
+    """The compiled redactor gives the same result as async_redact_data."""
+    payload = _payload()
+    original = copy.deepcopy(payload)
+
+    assert redact_diagnostics(payload) == async_redact_data(payload, TO_REDACT)
+    assert redact_diagnostics(ENTRY_DATA) == async_redact_data(ENTRY_DATA, TO_REDACT)
+    # The input snapshot is left untouched.
+    assert payload == original
+
+
+def test_redactor_leaves_no_sensitive_value() -> None:
+    """No sensitive key keeps a non-empty value after redaction."""
+    redacted = redact_diagnostics(_payload())
+
+    records = [redacted, *(record for key in RECORD_LISTS for record in redacted[key])]
+    for record in records:
+        for key in TO_REDACT:
+            assert record.get(key) in (None, "", REDACTED)
+
+
+async def test_device_diagnostics_zone(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """Zone diagnostics hold only that zone, its events and its entities."""
+    mock_config_entry.add_to_hass(hass)
+    identifier = f"{mock_config_entry.unique_id}_zone1"
+    device = dr.async_get(hass).async_get_or_create(
+        config_entry_id=mock_config_entry.entry_id, identifiers={(DOMAIN, identifier)}
+    )
+    entity = er.async_get(hass).async_get_or_create(
+        "binary_sensor",
+        DOMAIN,
+        f"{identifier}_state",
+        config_entry=mock_config_entry,
+        device_id=device.id,
+    )
+
+    panel = MagicMock()
+    zone = MagicMock()
+    zone.to_dict.return_value = {"zoneid": "1", "sensorname": "Front Door"}
+    panel.state.zone.return_value = zone
+    mock_config_entry.runtime_data = panel
+
+    runtime = QolsysPanelRuntime()
+    hass.data.setdefault(DATA_RUNTIME, {})[mock_config_entry.entry_id] = runtime
+    runtime.entity_stats[f"{identifier}_state"] = UpdateStats()
+    event = Event(QolsysNotification.ZONE_UPDATE, zone, {"state": {"status": "open"}})
+    runtime.events.record(identifier, event)
+
+    result = await async_get_device_diagnostics(hass, mock_config_entry, device)
+
+    panel.state.zone.assert_called_once_with("1")
+    assert result["zones"] == [{"zoneid": "1", "sensorname": REDACTED}]
+    assert [event["state"] for event in result["events"]] == [{"status": "open"}]
+    assert list(result["entities"]) == [entity.entity_id]
+    assert "automation_devices" not in result
+
+
+def test_event_history_observes_each_object_once() -> None:
+    """The history observes each zone once, and forgets a deleted zone."""
+    zone = MagicMock()
+    zone.zone_id = "1"
+    zone.to_dict_event.return_value = {"id": 1}
+    panel = MagicMock()
+    panel.state.partitions = []
+    panel.state.automation_devices = []
+    panel.state.zones = [zone]
+    panel.state.zone.return_value = zone
+    history = EventHistory()
+    history.async_start(panel, PANEL_MAC)
+
+    zone.register.assert_called_once_with(
+        QolsysNotification.ZONE_UPDATE, history._on_update
+    )
+    update = Event(QolsysNotification.ZONE_UPDATE, zone, {"id": 1, "state": {}})
+    history._on_update(update)
+    assert len(history.as_list(f"{PANEL_MAC}_zone1")) == 1
+
+    history._on_membership(Event(QolsysNotification.ZONE_DELETE, panel, {"id": 1}))
+    zone.unregister.assert_called_once_with(
+        QolsysNotification.ZONE_UPDATE, history._on_update
+    )
+    assert history.as_list(f"{PANEL_MAC}_zone1") == []
+
+    history.async_close()
+    panel.state.unregister.assert_any_call(
+        QolsysNotification.ZONE_ADD, history._on_membership
+    )
@@ -1,12 +1,32 @@
 """Tests for the Qolsys Panel base entities."""
 
+from datetime import timedelta
 from typing import cast
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, PropertyMock, patch
 
 from conftest import PANEL_MAC
 import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockEntityPlatform,
+    async_fire_time_changed,
+)
 from qolsys_controller.enum_qolsys import ControllerState, QolsysNotification
 
+from custom_components.qolsys_panel import (  # noqa: F401
+    alarm_control_panel,
+    binary_sensor,
+    climate,
+    cover,
+    light,
+    lock,
+    media_player,
+    scene,
+    sensor,
+    siren,
+    switch,
+    valve,
+    weather,
+)
 from custom_components.qolsys_panel.entity import (
     QolsysAutomationDeviceEntity,
     QolsysPanelEntity,
@@ -15,6 +35,11 @@ from custom_components.qolsys_panel.entity import (
     QolsysWeatherEntity,
     QolsysZoneEntity,
 )
+from custom_components.qolsys_panel.flapping import THROTTLE_SECONDS
+from custom_components.qolsys_panel.runtime import UpdateStats
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.util import dt as dt_util
 
 UID = PANEL_MAC
 
@@ -158,3 +183,109 @@ def test_automation_device_missing_raises(controller: MagicMock) -> None:
     controller.state.automation_device.return_value = None
     with pytest.raises(ValueError, match="virtual_node_id"):
         QolsysAutomationDeviceEntity(controller, "5", UID)
+
+
+async def test_panel_entity_update_stats(
+    hass: HomeAssistant, controller: MagicMock
+) -> None:
+    """Notifications and state writes are counted for diagnostics."""
+    entity = QolsysPanelEntity(controller, UID)
+    entity.hass = hass
+    entity.entity_id = "sensor.qolsys_test"
+    entity._update_stats = (stats := UpdateStats(),)
+
+    # The controller passes its Event, which must not force a refresh.
+    entity.schedule_update_ha_state(MagicMock())
+    await hass.async_block_till_done()
+    entity.async_write_ha_state()
+
+    assert stats.notifications == 1
+    assert stats.writes == 2
+    assert stats.suppressed_writes == 1
+    assert stats.write_time.count == 2
+    assert hass.states.get("sensor.qolsys_test") is not None
+
+
+async def test_notification_after_removal_not_written(
+    hass: HomeAssistant, controller: MagicMock
+) -> None:
+    """A notification arriving after removal writes no state."""
+    controller.controller_state = ControllerState.CONNECTED
+    entity = QolsysPanelEntity(controller, UID)
+    platform = MockEntityPlatform(hass)
+    await platform.async_add_entities([entity])
+    assert entity.entity_id is not None
+    await entity.async_remove()
+
+    entity.schedule_update_ha_state(MagicMock())
+    await hass.async_block_till_done()
+    assert hass.states.get(entity.entity_id) is None
+
+
+async def test_forced_refresh(hass: HomeAssistant, controller: MagicMock) -> None:
+    """An explicit force_refresh still updates the entity first."""
+    entity = QolsysPanelEntity(controller, UID)
+    entity.hass = hass
+    entity.entity_id = "sensor.qolsys_test"
+
+    with patch.object(entity, "async_update_ha_state") as update:
+        entity.schedule_update_ha_state(True)
+        await hass.async_block_till_done()
+    update.assert_called_once_with(True)
+
+
+async def test_zone_diagnostic_entity_throttled(
+    hass: HomeAssistant, controller: MagicMock
+) -> None:
+    """A diagnostic entity of a throttled zone writes once per period."""
+    entity = QolsysZoneEntity(controller, "10", UID)
+    entity.hass = hass
+    entity.entity_id = "sensor.qolsys_zone_test"
+    entity._attr_entity_category = EntityCategory.DIAGNOSTIC
+    entity._update_stats = (stats := UpdateStats(),)
+    runtime = MagicMock()
+    runtime.flapping.is_throttled.return_value = True
+
+    with patch.object(
+        QolsysZoneEntity, "_runtime", new_callable=PropertyMock, return_value=runtime
+    ):
+        for _ in range(3):
+            entity.schedule_update_ha_state(MagicMock())
+        await hass.async_block_till_done()
+        assert stats.notifications == 3
+        assert stats.writes == 0
+
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=THROTTLE_SECONDS + 1)
+        )
+        await hass.async_block_till_done()
+        assert stats.writes == 1
+        runtime.flapping.is_throttled.assert_called_with("10")
+
+        # Other entities of the zone are not throttled.
+        entity._attr_entity_category = None
+        entity.schedule_update_ha_state(MagicMock())
+        await hass.async_block_till_done()
+        assert stats.writes == 2
+
+
+def _subclasses(cls: type[QolsysPanelEntity]) -> set[type[QolsysPanelEntity]]:
+    """Return every subclass of a class, recursively."""
+    return {
+        sub for direct in cls.__subclasses__() for sub in {direct, *_subclasses(direct)}
+    }
+
+
+def test_unrecorded_attributes() -> None:
+    """Volatile and bulky attributes are kept out of the recorder."""
+    unrecorded = {
+        cls.__name__: cls._unrecorded_attributes
+        for cls in _subclasses(QolsysPanelEntity)
+        if cls._unrecorded_attributes
+    }
+    assert unrecorded == {
+        "PartitionQuickExitSensor": frozenset({"delay", "start_time"}),
+        "PartitionReadySensor": frozenset({"blocking_zones"}),
+        "ZonesSensor": frozenset({"event_rate"}),
+        "Partition_ZoneSummary": frozenset({"zones"}),
+    }
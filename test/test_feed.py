@@ -0,0 +1,118 @@
+"""Tests for the Qolsys Panel snapshot feed."""
+
+from typing import Any
+from unittest.mock import MagicMock
+
+from qolsys_controller.enum_qolsys import ControllerState, QolsysNotification
+from qolsys_controller.observable import Event, QolsysObservable
+
+from custom_components.qolsys_panel.feed import PanelFeed, Snapshot, panel_snapshot
+
+
+class _Zone(QolsysObservable):
+    """A controller zone notifying its event payload."""
+
+    def __init__(self, zone_id: str, status: str) -> None:
+        super().__init__()
+        self.zone_id = zone_id
+        self.status = status
+
+    def to_dict_event(self) -> dict[str, Any]:
+        return {
+            "id": int(self.zone_id),
+            "type": "zone",
+            "state": {"status": self.status},
+            "attributes": {"name": f"Zone {self.zone_id}", "partition_id": 1},
+            "timestamp": "2026-01-01T00:00:00Z",
+        }
+
+    def update(self, status: str) -> None:
+        self.status = status
+        self.notify(Event(QolsysNotification.ZONE_UPDATE, self, self.to_dict_event()))
+
+
+class _State(QolsysObservable):
+    """A controller state holding zones only."""
+
+    def __init__(self, zones: list[_Zone]) -> None:
+        super().__init__()
+        self.partitions: list[Any] = []
+        self.automation_devices: list[Any] = []
+        self.zones = zones
+
+    def zone(self, zone_id: str) -> _Zone | None:
+        return next((zone for zone in self.zones if zone.zone_id == zone_id), None)
+
+
+def _make_panel(zones: list[_Zone]) -> MagicMock:
+    """Return a controller mock whose state notifies like the controller's."""
+    panel = MagicMock()
+    panel.controller_state = ControllerState.CONNECTED
+    panel.state = _State(zones)
+    return panel
+
+
+def test_panel_snapshot() -> None:
+    """The snapshot flattens the state and attributes of every object."""
+    panel = _make_panel([_Zone("1", "closed")])
+
+    assert panel_snapshot(panel) == {
+        "panel": {"connected": True},
+        "partitions": {},
+        "zones": {"1": {"name": "Zone 1", "partition_id": 1, "status": "closed"}},
+        "devices": {},
+    }
+
+
+def test_feed_sends_changed_fields() -> None:
+    """Only changed fields are sent, and unchanged notifications are dropped."""
+    zone = _Zone("1", "closed")
+    panel = _make_panel([zone])
+    feed = PanelFeed(panel)
+    deltas: list[Snapshot] = []
+
+    unsubscribe = feed.async_subscribe(deltas.append)
+    zone.update("open")
+    zone.update("open")
+    panel.controller_state = ControllerState.RECONNECTING
+    panel.state.notify(Event(QolsysNotification.PANEL_STATUS_UPDATE, panel, {}))
+
+    assert deltas == [
+        {"zones": {"1": {"status": "open"}}},
+        {"panel": {"connected": False}},
+    ]
+    assert feed.snapshot()["zones"]["1"]["status"] == "open"
+
+    unsubscribe()
+    zone.update("closed")
+    assert len(deltas) == 2
+    assert not zone._observers[QolsysNotification.ZONE_UPDATE]
+
+
+def test_feed_follows_added_and_deleted_objects() -> None:
+    """Added objects are sent whole and observed; deleted ones are sent as None."""
+    panel = _make_panel([])
+    feed = PanelFeed(panel)
+    deltas: list[Snapshot] = []
+    feed.async_subscribe(deltas.append)
+
+    zone = _Zone("2", "closed")
+    panel.state.zones.append(zone)
+    panel.state.notify(
+        Event(QolsysNotification.ZONE_ADD, panel.state, zone.to_dict_event())
+    )
+    zone.update("open")
+    panel.state.zones.remove(zone)
+    panel.state.notify(
+        Event(QolsysNotification.ZONE_DELETE, panel.state, zone.to_dict_event())
+    )
+
+    assert deltas == [
+        {"zones": {"2": {"name": "Zone 2", "partition_id": 1, "status": "closed"}}},
+        {"zones": {"2": {"status": "open"}}},
+        {"zones": {"2": None}},
+    ]
+    assert not zone._observers[QolsysNotification.ZONE_UPDATE]
+
+    feed.async_close()
+    assert not any(panel.state._observers.values())
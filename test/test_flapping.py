@@ -0,0 +1,81 @@
+"""Tests for the Qolsys Panel flapping zone detection."""
+
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+from qolsys_controller.enum_qolsys import QolsysNotification
+from qolsys_controller.observable import Event
+from qolsys_controller.zone import QolsysZone
+
+from custom_components.qolsys_panel.const import DOMAIN
+from custom_components.qolsys_panel.flapping import (
+    FLAPPING_THRESHOLD,
+    FLAPPING_WINDOW,
+    FlappingDetector,
+    SlidingWindowCounter,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.util import dt as dt_util
+
+
+def test_sliding_window_counter() -> None:
+    """Events leave the count one bucket at a time as the window slides."""
+    counter = SlidingWindowCounter(window=60.0, buckets=12)
+    for now in (1000.0, 1001.0, 1030.0):
+        counter.add(now)
+    assert counter.count(1030.0) == 3
+    assert counter.count(1059.0) == 3
+    # The bucket of the first two events (1000-1005s) left the window.
+    assert counter.count(1065.0) == 1
+    assert counter.count(1095.0) == 0
+
+    counter.add(2000.0)
+    assert counter.count(2000.0) == 1
+
+
+async def test_flapping_zone_issue(hass: HomeAssistant) -> None:
+    """A flapping zone raises a repair issue until its update rate settles."""
+    zone = MagicMock(spec=QolsysZone)
+    zone.zone_id = "10"
+    zone.sensorname = "Back Door"
+    panel = MagicMock()
+    panel.state.zones = [zone]
+    detector = FlappingDetector(hass, "entry", panel, throttle=True)
+    issue_id = "flapping_zone_entry_10"
+    update = Event(QolsysNotification.ZONE_UPDATE, zone, {})
+
+    with patch("custom_components.qolsys_panel.flapping.time.monotonic") as monotonic:
+        monotonic.return_value = 1000.0
+        detector.async_start()
+        for _ in range(FLAPPING_THRESHOLD - 1):
+            detector._on_zone_update(update)
+        assert not detector.is_flapping("10")
+        assert detector.event_rate("10") == FLAPPING_THRESHOLD - 1
+
+        detector._on_zone_update(update)
+        assert detector.is_throttled("10")
+        issue = ir.async_get(hass).async_get_issue(DOMAIN, issue_id)
+        assert issue is not None
+        assert issue.translation_placeholders == {
+            "zone": "Back Door",
+            "zone_id": "10",
+            "rate": str(FLAPPING_THRESHOLD),
+        }
+
+        # Still above half the threshold: the zone keeps flapping.
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=31))
+        await hass.async_block_till_done()
+        assert detector.is_flapping("10")
+
+        monotonic.return_value = 1000.0 + FLAPPING_WINDOW + 10
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=62))
+        await hass.async_block_till_done()
+        assert not detector.is_flapping("10")
+        assert ir.async_get(hass).async_get_issue(DOMAIN, issue_id) is None
+
+    detector.async_close()
+    zone.unregister.assert_called_once_with(
+        QolsysNotification.ZONE_UPDATE, detector._on_zone_update
+    )
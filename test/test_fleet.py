@@ -0,0 +1,61 @@
+"""Tests for the Qolsys Panel fleet report."""
+
+from unittest.mock import MagicMock
+
+from qolsys_controller.zone import QolsysZone
+
+from custom_components.qolsys_panel.fleet import fleet_report
+
+
+def _make_zone(
+    zone_id: str,
+    partition_id: str,
+    latest_dbm: int | None,
+    battery_level: int | None = None,
+) -> MagicMock:
+    """Return a controller zone mock with signal and battery values."""
+    zone = MagicMock(spec=QolsysZone)
+    zone.zone_id = zone_id
+    zone.sensorname = f"Zone {zone_id}"
+    zone.partition_id = partition_id
+    zone.latestdBm = latest_dbm
+    zone.averagedBm = latest_dbm
+    zone.powerg_battery_level = battery_level
+    zone.powerg_battery_voltage = None
+    return zone
+
+
+def test_fleet_report() -> None:
+    """Percentiles, outliers and partition aggregates are read from the columns."""
+    zones = [
+        _make_zone(str(i), "1" if i <= 5 else "2", -50 - i, 90) for i in range(1, 11)
+    ]
+    zones.append(_make_zone("11", "2", -95, 10))
+    zones.append(_make_zone("12", "2", None))
+
+    report = fleet_report(zones)
+
+    assert report["zones"] == 12
+    latest = report["metrics"]["latest_dbm"]
+    assert latest["count"] == 11
+    assert (latest["min"], latest["max"], latest["p50"]) == (-95, -51, -56)
+    assert latest["outliers"] == [{"zone_id": "11", "name": "Zone 11", "value": -95}]
+    battery = report["metrics"]["powerg_battery_level"]
+    assert battery["outliers"] == [{"zone_id": "11", "name": "Zone 11", "value": 10}]
+    assert report["metrics"]["powerg_battery_voltage"] == {"count": 0}
+
+    partitions = report["partitions"]
+    assert partitions["1"]["zones"] == 5
+    assert partitions["1"]["latest_dbm"] == {"count": 5, "mean": -53.0, "min": -55}
+    assert partitions["2"]["zones"] == 7
+    assert partitions["2"]["powerg_battery_level"]["min"] == 10
+    assert "powerg_battery_voltage" not in partitions["2"]
+
+
+def test_fleet_report_single_value() -> None:
+    """A single value is every percentile and no outlier."""
+    report = fleet_report([_make_zone("1", "1", -60)])
+
+    latest = report["metrics"]["latest_dbm"]
+    assert latest["p5"] == latest["p95"] == -60
+    assert latest["outliers"] == []
@@ -3,8 +3,10 @@
 import asyncio
 from collections.abc import Generator
 import logging
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from conftest import PANEL_MAC
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 from qolsys_controller.enum_qolsys import ControllerState, QolsysNotification
@@ -15,7 +17,10 @@ from custom_components.qolsys_panel.const import (
     DOMAIN,
     OPTION_ARM_CODE,
     OPTION_DISARM_CODE,
+    OPTION_EVENT_JOURNAL,
 )
+from custom_components.qolsys_panel.feed import PanelFeed
+from custom_components.qolsys_panel.runtime import async_get_runtime
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant
 
@@ -63,6 +68,8 @@ def _get_status_callback(controller: MagicMock):
         call.args[1]
         for call in controller.state.register.call_args_list
         if call.args[0] is QolsysNotification.PANEL_STATUS_UPDATE
+        # The panel feed, followed by the recent events, observes it too.
+        and not isinstance(getattr(call.args[1], "__self__", None), PanelFeed)
     ]
     assert len(callbacks) == 1
     return callbacks[0]
@@ -100,6 +107,12 @@ async def test_log_when_unavailable(
     assert caplog.text.count(LOST_MESSAGE) == 1
     assert caplog.text.count(RESTORED_MESSAGE) == 1
 
+    # The outage is recorded for diagnostics.
+    runtime = async_get_runtime(hass, mock_config_entry.entry_id)
+    assert runtime is not None
+    assert runtime.connection.reconnects == 1
+    assert runtime.connection.outages.count == 1
+
 
 async def test_no_log_on_shutdown(
     hass: HomeAssistant,
@@ -144,6 +157,52 @@ async def test_unload_unregisters_connection_logger(
     )
 
 
+async def test_remove_entry_deletes_journal(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_controller: MagicMock,
+):
+    """Test removing the entry deletes its event journal."""
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={OPTION_EVENT_JOURNAL: True}
+    )
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    directory = Path(hass.config.path("qolsys_panel", "journal", PANEL_MAC))
+    assert await hass.async_add_executor_job(directory.is_dir)
+
+    await hass.config_entries.async_remove(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert not await hass.async_add_executor_job(directory.exists)
+
+
+async def test_setup_without_journal_directory(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_controller: MagicMock,
+    caplog: pytest.LogCaptureFixture,
+):
+    """Test an unreadable journal directory disables the journal only."""
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={OPTION_EVENT_JOURNAL: True}
+    )
+    with patch(
+        "custom_components.qolsys_panel.journal.JournalWriter.load",
+        side_effect=PermissionError("denied"),
+    ):
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert mock_config_entry.state is ConfigEntryState.LOADED
+    runtime = async_get_runtime(hass, mock_config_entry.entry_id)
+    assert runtime is not None
+    assert runtime.journal is None
+    assert "Panel event journal disabled, cannot open it: denied" in caplog.text
+
+
 @pytest.mark.parametrize(
     ("error", "expected_state"),
     [
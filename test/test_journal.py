@@ -0,0 +1,159 @@
+"""Tests for the Qolsys Panel event journal."""
+
+import asyncio
+from datetime import UTC, datetime
+from pathlib import Path
+import threading
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from qolsys_controller.enum_qolsys import QolsysNotification
+from qolsys_controller.observable import Event
+
+from custom_components.qolsys_panel.journal import (
+    INDEX_FILE,
+    EventJournal,
+    JournalWriter,
+)
+from homeassistant.core import HomeAssistant
+
+
+def _entry(timestamp: float) -> dict[str, Any]:
+    return {"t": timestamp, "type": "ZONE_UPDATE", "id": "10", "data": {"x": "y"}}
+
+
+def test_writer_rotation(tmp_path: Path) -> None:
+    """Full segments are rotated, the oldest deleted and the index kept."""
+    writer = JournalWriter(tmp_path)
+    writer.load()
+    with (
+        patch("custom_components.qolsys_panel.journal.SEGMENT_BYTES", 100),
+        patch("custom_components.qolsys_panel.journal.MAX_SEGMENTS", 3),
+    ):
+        for timestamp in range(10):
+            writer.write([_entry(float(timestamp)), _entry(timestamp + 0.5)])
+
+    assert sorted(path.name for path in tmp_path.glob("*.jsonl")) == [
+        "00000008.jsonl",
+        "00000009.jsonl",
+        "00000010.jsonl",
+    ]
+    assert writer.segments[0] == {
+        "name": "00000008.jsonl",
+        "first": 7.0,
+        "last": 7.5,
+        "entries": 2,
+    }
+    assert [entry["t"] for entry in writer.read(8.0, 9.0)] == [8.0, 8.5, 9.0]
+
+    # A lost index is rebuilt from the segments.
+    (tmp_path / INDEX_FILE).unlink()
+    rebuilt = JournalWriter(tmp_path)
+    rebuilt.load()
+    assert rebuilt.segments == writer.segments
+
+    reloaded = JournalWriter(tmp_path)
+    (tmp_path / INDEX_FILE).write_text("not json")
+    reloaded.load()
+    assert reloaded.segments == writer.segments
+
+
+async def test_event_journal(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Feed deltas and panel events are journaled off the loop."""
+    panel = MagicMock()
+    feed = MagicMock()
+    journal = EventJournal(hass, panel, tmp_path)
+    await journal.async_start(feed)
+    subscriber = feed.async_subscribe.call_args.args[0]
+
+    with patch("custom_components.qolsys_panel.journal.time.time", return_value=5.0):
+        subscriber({"partitions": {"1": {"last_error": "Zone open"}}})
+        subscriber({"zones": {"10": None}})
+        subscriber({"panel": {"connected": False}})
+        journal._on_panel_event(
+            Event(QolsysNotification.PANEL_DOORBELL, panel, {"value": 1})
+        )
+    assert journal.as_dict()["queued"] == 4
+    await journal.async_close()
+
+    entries = await journal.async_read(
+        datetime.fromtimestamp(0, UTC), datetime.fromtimestamp(10, UTC)
+    )
+    assert entries == [
+        {
+            "t": 5.0,
+            "type": "PARTITION_UPDATE",
+            "id": "1",
+            "data": {"last_error": "Zone open"},
+        },
+        {"t": 5.0, "type": "ZONE_DELETE", "id": "10", "data": None},
+        {
+            "t": 5.0,
+            "type": "PANEL_STATUS_UPDATE",
+            "id": None,
+            "data": {"connected": False},
+        },
+        {"t": 5.0, "type": "PANEL_DOORBELL", "id": None, "data": {"value": 1}},
+    ]
+    assert journal.as_dict() == {
+        "segments": 1,
+        "entries": 4,
+        "queued": 0,
+        "written": 4,
+        "dropped": 0,
+    }
+    feed.async_subscribe.return_value.assert_called_once_with()
+    panel.state.unregister.assert_any_call(
+        QolsysNotification.PANEL_DOORBELL, journal._on_panel_event
+    )
+
+
+async def test_event_journal_jobs_run_one_at_a_time(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """A read waits for the write in progress, even one of a closing flush."""
+    journal = EventJournal(hass, MagicMock(), tmp_path)
+    await journal.async_start(MagicMock())
+    calls: list[str] = []
+    writing = threading.Event()
+    release = threading.Event()
+    write = journal._writer.write
+
+    def slow_write(entries: list[dict[str, Any]]) -> None:
+        calls.append("write")
+        writing.set()
+        release.wait(5)
+        write(entries)
+        calls.append("written")
+
+    with patch.object(journal._writer, "write", slow_write):
+        journal.async_append("ZONE_UPDATE", "10", None, now=5.0)
+        flush = hass.async_create_task(journal._async_flush())
+        await hass.async_add_executor_job(writing.wait, 5)
+        read = hass.async_create_task(
+            journal.async_read(
+                datetime.fromtimestamp(0, UTC), datetime.fromtimestamp(10, UTC)
+            )
+        )
+        await asyncio.sleep(0)
+        assert not read.done()
+        release.set()
+        await flush
+        assert [entry["t"] for entry in await read] == [5.0]
+    assert calls == ["write", "written"]
+    await journal.async_close()
+
+
+async def test_event_journal_unreadable_directory(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """The journal does not start when its directory cannot be created."""
+    (tmp_path / "journal").write_text("")
+    panel = MagicMock()
+    feed = MagicMock()
+    journal = EventJournal(hass, panel, tmp_path / "journal")
+    with pytest.raises(OSError):
+        await journal.async_start(feed)
+    feed.async_subscribe.assert_not_called()
+    panel.state.register.assert_not_called()
@@ -1,18 +1,28 @@
 """Tests for the Qolsys Panel lights."""
 
+import asyncio
+from datetime import timedelta
+from typing import cast
 from unittest.mock import AsyncMock, MagicMock
 
 from conftest import PANEL_MAC
 import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+from qolsys_controller.errors import CommandExecutionError
 
+from custom_components.qolsys_panel.command import CommandDeadlines
+from custom_components.qolsys_panel.const import DEFAULT_OPTIMISTIC_TIMEOUT
 from custom_components.qolsys_panel.light import (
     AutomationDevice_Light,
     async_setup_entry,
     to_hass_level,
     to_qolsys_level,
 )
+from custom_components.qolsys_panel.runtime import DATA_RUNTIME, QolsysPanelRuntime
 from homeassistant.components.light import ATTR_BRIGHTNESS, ColorMode
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
 
 UID = PANEL_MAC
 
@@ -102,3 +112,89 @@ async def test_turn_off(controller: MagicMock) -> None:
     light._service.turn_off = AsyncMock()
     await light.async_turn_off()
     light._service.turn_off.assert_awaited_once()
+
+
+def _optimistic_light(
+    hass: HomeAssistant, controller: MagicMock
+) -> tuple[AutomationDevice_Light, QolsysPanelRuntime]:
+    """Return a light attached to an entry with optimistic commands enabled."""
+    runtime = QolsysPanelRuntime(optimistic=True)
+    hass.data[DATA_RUNTIME] = {"entry": runtime}
+    light = AutomationDevice_Light(controller, "5", 0, UID)
+    light.hass = hass
+    light.platform = MagicMock()
+    light.platform.config_entry.entry_id = "entry"
+    light.async_write_ha_state = MagicMock()
+    light._service.is_on = False
+    light._service.turn_on = AsyncMock()
+    return light, runtime
+
+
+async def test_optimistic_turn_on_confirmed(
+    hass: HomeAssistant, controller: MagicMock
+) -> None:
+    """The expected state shows at once and is confirmed by the panel update."""
+    light, runtime = _optimistic_light(hass, controller)
+
+    await light.async_turn_on()
+    assert light.is_on is True
+    cast(MagicMock, light.async_write_ha_state).assert_called()
+
+    light._service.is_on = True
+    light._reconcile_optimistic()
+
+    assert light._optimistic_state is None
+    assert runtime.confirmation_latency.count == 1
+    assert runtime.optimistic_rollbacks == 0
+
+
+async def test_optimistic_turn_on_rolled_back(
+    hass: HomeAssistant, controller: MagicMock
+) -> None:
+    """An unconfirmed optimistic state is rolled back after the deadline."""
+    light, runtime = _optimistic_light(hass, controller)
+
+    await light.async_turn_on()
+    assert light.is_on is True
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=DEFAULT_OPTIMISTIC_TIMEOUT + 1)
+    )
+    await hass.async_block_till_done()
+
+    assert light.is_on is False
+    assert runtime.optimistic_rollbacks == 1
+    assert runtime.confirmation_latency.count == 0
+
+
+async def test_optimistic_command_error(
+    hass: HomeAssistant, controller: MagicMock
+) -> None:
+    """A failed command drops the optimistic state immediately."""
+    light, _ = _optimistic_light(hass, controller)
+    cast(AsyncMock, light._service.turn_on).side_effect = CommandExecutionError("boom")
+
+    with pytest.raises(CommandExecutionError):
+        await light.async_turn_on()
+
+    assert light.is_on is False
+    assert light._cancel_optimistic_deadline is None
+
+
+async def test_command_deadline_exceeded(
+    hass: HomeAssistant, controller: MagicMock
+) -> None:
+    """A command the panel does not answer in time fails and rolls back."""
+    light, runtime = _optimistic_light(hass, controller)
+    runtime.deadlines = CommandDeadlines(maximum=0.01)
+
+    async def _slow() -> None:
+        await asyncio.sleep(10)
+
+    cast(AsyncMock, light._service.turn_on).side_effect = _slow
+
+    with pytest.raises(HomeAssistantError):
+        await light.async_turn_on()
+
+    assert light.is_on is False
+    assert runtime.deadlines.as_dict()["light.turn_on"]["timeouts"] == 1
@@ -0,0 +1,69 @@
+"""Tests for the Qolsys Panel recent events ring buffer."""
+
+from unittest.mock import MagicMock
+
+from qolsys_controller.enum_qolsys import QolsysNotification
+from qolsys_controller.observable import Event
+
+from custom_components.qolsys_panel.recent_events import RecentEvents
+
+
+def test_ring_buffer_wraps() -> None:
+    """Once full, each event overwrites the oldest one."""
+    events = RecentEvents(MagicMock(), capacity=3)
+    for now in range(5):
+        events.add("zone_status", now, 1, "open", now=float(now))
+    assert len(events) == 3
+    assert [event.object_id for event in events.query()] == [2, 3, 4]
+    assert [event.object_id for event in events.query(limit=2)] == [3, 4]
+
+
+def test_feed_and_panel_events() -> None:
+    """Feed deltas and panel events are kept as compact records."""
+    panel = MagicMock()
+    panel.state.zone.return_value.partition_id = "1"
+    feed = MagicMock()
+    events = RecentEvents(panel)
+    events.async_start(feed)
+    subscriber = feed.async_subscribe.call_args.args[0]
+
+    subscriber({"zones": {"10": {"status": "open", "latest_dbm": -60}}})
+    subscriber({"zones": {"11": {"latest_dbm": -61}}})
+    subscriber(
+        {"partitions": {"1": {"alarm_array": ["police_emergency", "fire_emergency"]}}}
+    )
+    subscriber({"partitions": {"1": {"alarm_array": [], "status": "bogus"}}})
+    subscriber({"partitions": {"2": None}})
+    subscriber({"panel": {"connected": False}})
+    events._on_panel_event(Event(QolsysNotification.PANEL_DOORBELL, panel, {}))
+
+    assert [
+        {key: value for key, value in event.as_dict().items() if key != "time"}
+        for event in events.query()
+    ] == [
+        {"type": "zone_status", "id": "10", "partition": "1", "value": "open"},
+        {
+            "type": "alarm_type",
+            "id": "1",
+            "partition": "1",
+            "value": "police_emergency",
+        },
+        {"type": "alarm_type", "id": "1", "partition": "1", "value": "fire_emergency"},
+        {"type": "partition_status", "id": "1", "partition": "1", "value": "unknown"},
+        {"type": "alarm_type", "id": "1", "partition": "1", "value": None},
+        {"type": "connection", "id": None, "partition": None, "value": "disconnected"},
+        {"type": "doorbell", "id": None, "partition": None, "value": None},
+    ]
+    assert [event.event_type for event in events.query(partition_id=1)] == [
+        "zone_status",
+        "alarm_type",
+        "alarm_type",
+        "partition_status",
+        "alarm_type",
+    ]
+    assert len(events.query(zone_id=10)) == 1
+    assert len(events.query(zone_id=1)) == 0
+    assert len(events.query(event_types={"doorbell", "connection"})) == 2
+
+    events.async_close()
+    feed.async_subscribe.return_value.assert_called_once_with()
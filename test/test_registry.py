@@ -0,0 +1,94 @@
+"""Tests for the Qolsys Panel object registry."""
+
+from typing import Any
+from unittest.mock import MagicMock
+
+from conftest import PANEL_MAC
+from qolsys_controller.enum_qolsys import QolsysNotification
+from qolsys_controller.observable import Event, QolsysObservable
+
+from custom_components.qolsys_panel.registry import PanelRegistry, panel_lookup
+
+
+class _State(QolsysObservable):
+    """A controller state holding partitions, zones, devices and scenes."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.partitions: list[Any] = []
+        self.zones: list[Any] = []
+        self.automation_devices: list[Any] = []
+        self.scenes: list[Any] = []
+
+
+def _make_panel() -> MagicMock:
+    """Return a controller mock with one object of each kind."""
+    panel = MagicMock()
+    panel.state = _State()
+    panel.state.partitions.append(MagicMock(id="1"))
+    panel.state.zones.append(MagicMock(zone_id="10"))
+    panel.state.automation_devices.append(MagicMock(virtual_node_id="5"))
+    panel.state.scenes.append(MagicMock(scene_id="2"))
+    return panel
+
+
+def test_lookup_by_id_and_unique_id() -> None:
+    """Objects are found by id and by the unique_id of their device."""
+    panel = _make_panel()
+    registry = PanelRegistry(panel, PANEL_MAC)
+    registry.async_start()
+
+    assert registry.partition("1") is panel.state.partitions[0]
+    assert registry.zone("10") is panel.state.zones[0]
+    assert registry.automation_device("5") is panel.state.automation_devices[0]
+    assert registry.scene("2") is panel.state.scenes[0]
+    assert registry.zone("11") is None
+
+    assert registry.resolve(f"{PANEL_MAC}_partition1") == ("partition", "1")
+    assert registry.resolve(f"{PANEL_MAC}_zone10") == ("zone", "10")
+    assert registry.resolve(f"{PANEL_MAC}_autdev_5") == ("device", "5")
+    assert registry.resolve(f"{PANEL_MAC}_scene_2") == ("scene", "2")
+    assert registry.resolve(f"{PANEL_MAC}_zone10_tamper") is None
+    assert registry.unique_id("zone", "10") == f"{PANEL_MAC}_zone10"
+
+
+def test_follows_added_and_deleted_objects() -> None:
+    """An added or deleted object is inserted or removed alone."""
+    panel = _make_panel()
+    registry = PanelRegistry(panel, PANEL_MAC)
+    registry.async_start()
+
+    zone = MagicMock(zone_id="11")
+    panel.state.zones.append(zone)
+    panel.state.notify(Event(QolsysNotification.ZONE_ADD, panel.state, {"id": 11}))
+    assert registry.zone("11") is zone
+    assert registry.resolve(f"{PANEL_MAC}_zone11") == ("zone", "11")
+    assert registry.resolve(f"{PANEL_MAC}_partition1") == ("partition", "1")
+
+    panel.state.zones.remove(zone)
+    panel.state.notify(Event(QolsysNotification.ZONE_DELETE, panel.state, {"id": 11}))
+    assert registry.zone("11") is None
+    assert registry.resolve(f"{PANEL_MAC}_zone11") is None
+    assert registry.zone("10") is panel.state.zones[0]
+    assert registry.resolve(f"{PANEL_MAC}_zone10") == ("zone", "10")
+
+    # A deleted object is removed without reading the controller list.
+    panel.state.zones = MagicMock()
+    panel.state.notify(Event(QolsysNotification.ZONE_DELETE, panel.state, {"id": 10}))
+    panel.state.zones.__iter__.assert_not_called()
+    assert registry.zone("10") is None
+    assert registry.resolve(f"{PANEL_MAC}_partition1") == ("partition", "1")
+
+
+def test_panel_lookup() -> None:
+    """The registry is used while started, the controller state otherwise."""
+    panel = _make_panel()
+    assert panel_lookup(panel) is panel.state
+
+    registry = PanelRegistry(panel, PANEL_MAC)
+    registry.async_start()
+    assert panel_lookup(panel) is registry
+
+    registry.async_close()
+    assert panel_lookup(panel) is panel.state
+    assert registry.zone("10") is None
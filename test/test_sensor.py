@@ -1,13 +1,16 @@
 """Tests for the Qolsys Panel sensors."""
 
-from unittest.mock import MagicMock
+from datetime import timedelta
+from unittest.mock import MagicMock, PropertyMock, patch
 
 from conftest import PANEL_MAC
 import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
 from qolsys_controller.automation.service_battery import BatteryService
 from qolsys_controller.automation.service_meter import MeterService
 from qolsys_controller.automation.service_sensor import SensorService
 from qolsys_controller.enum_qolsys import (
+    ControllerState,
     PartitionError,
     QolsysMeterScale,
     QolsysNotification,
@@ -15,11 +18,14 @@ from qolsys_controller.enum_qolsys import (
 )
 from qolsys_controller.observable import Event
 
+from custom_components.qolsys_panel.aggregator import StatisticsAggregator
+from custom_components.qolsys_panel.runtime import UpdateStats
 from custom_components.qolsys_panel.sensor import (
     AutomationDevice_BatteryValue,
     AutomationDevice_Meter,
     AutomationDevice_Sensor,
     Partition_LastError,
+    Partition_ZoneSummary,
     ZoneSensor_AverageDBM,
     ZoneSensor_BatteryLevel,
     ZoneSensor_BatteryVoltage,
@@ -28,8 +34,10 @@ from custom_components.qolsys_panel.sensor import (
     ZoneSensor_PowerG_Temperature,
     async_setup_entry,
 )
+from custom_components.qolsys_panel.zone_index import ZoneIndex
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util, slugify
 
 UID = PANEL_MAC
 
@@ -285,3 +293,90 @@ def test_partition_last_error(controller: MagicMock) -> None:
     sensor._partition.last_error = PartitionError.USER_CODE_ERROR
     assert sensor.native_value == "USER_CODE_ERROR"
     assert sensor._attr_options == [error.name for error in PartitionError]
+
+
+def test_partition_zone_summary(controller: MagicMock) -> None:
+    """The zone summary sensor counts the zones and lists their names."""
+    zones = MagicMock(spec=ZoneIndex)
+    zones.summary.return_value = {"10": "Back Door", "2": "Front Door"}
+    sensor = Partition_ZoneSummary(controller, "1", UID, zones, "open")
+
+    assert sensor.unique_id == f"{UID}_partition1_open_zones"
+    assert sensor.translation_key == "open_zones"
+    assert sensor.native_value == 2
+    assert sensor.extra_state_attributes == {"zones": ["Front Door", "Back Door"]}
+    zones.summary.assert_called_with("1", "open")
+
+
+async def test_automation_meter_deadband(
+    hass: HomeAssistant, controller: MagicMock
+) -> None:
+    """Power changes within the deadband are written after the maximum interval."""
+    meter = AutomationDevice_Meter(controller, "5", 0, QolsysMeterScale.WATTS, UID)
+    meter.hass = hass
+    meter.entity_id = "sensor.qolsys_power"
+    meter._update_stats = (stats := UpdateStats(),)
+    controller.controller_state = ControllerState.CONNECTED
+    runtime = MagicMock(deadband_max_interval=900)
+
+    def _power() -> str:
+        state = hass.states.get("sensor.qolsys_power")
+        assert state is not None
+        return state.state
+
+    with patch.object(
+        AutomationDevice_Meter,
+        "_runtime",
+        new_callable=PropertyMock,
+        return_value=runtime,
+    ):
+        meter._meter.value = 100.0
+        meter.async_write_ha_state()
+
+        # 2 W is within both the 5 W and the 5% deadband.
+        meter._meter.value = 102.0
+        meter.schedule_update_ha_state()
+        await hass.async_block_till_done()
+        assert stats.deadband_skips == 1
+        assert _power() == "100.0"
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=901))
+        await hass.async_block_till_done()
+        assert _power() == "102.0"
+
+        meter._meter.value = 110.0
+        meter.schedule_update_ha_state()
+        await hass.async_block_till_done()
+        assert _power() == "110.0"
+        assert stats.deadband_skips == 1
+
+    # Totals are not filtered.
+    energy = AutomationDevice_Meter(controller, "5", 0, QolsysMeterScale.KWH, UID)
+    assert energy._deadband_kind is None
+
+
+async def test_automation_meter_statistics(
+    hass: HomeAssistant, controller: MagicMock
+) -> None:
+    """Meter values go to external statistics instead of a state class."""
+    meter = AutomationDevice_Meter(controller, "5", 0, QolsysMeterScale.KWH, UID)
+    meter.hass = hass
+    meter.entity_id = "sensor.qolsys_energy"
+    runtime = MagicMock(deadband_max_interval=None)
+    runtime.statistics = StatisticsAggregator(hass)
+    statistic_id = f"qolsys_panel:{slugify(meter.unique_id)}"
+
+    with patch.object(
+        AutomationDevice_Meter,
+        "_runtime",
+        new_callable=PropertyMock,
+        return_value=runtime,
+    ):
+        assert meter.state_class is None
+        meter._meter.value = 12.5
+        meter.schedule_update_ha_state()
+        await hass.async_block_till_done()
+
+    assert runtime.statistics.has_series(statistic_id)
+    assert meter._statistic_metadata(statistic_id)["has_sum"] is True
+    assert meter.state_class == SensorStateClass.TOTAL_INCREASING
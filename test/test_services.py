@@ -1,12 +1,19 @@
 """Tests for the Qolsys Panel services."""
 
-from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import Any, cast
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from conftest import PANEL_MAC
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
-from qolsys_controller.errors import CommandExecutionError
+from qolsys_controller.enum_qolsys import (
+    PartitionArmingType,
+    ZoneSensorType,
+    ZoneStatus,
+)
+from qolsys_controller.errors import CommandExecutionError, QolsysUserCodeError
 
 from custom_components.qolsys_panel.const import (
     CONF_IMEI,
@@ -16,17 +23,41 @@ from custom_components.qolsys_panel.const import (
     OPTION_TRIGGER_FIRE,
     OPTION_TRIGGER_POLICE,
 )
+from custom_components.qolsys_panel.entity import QolsysAutomationDeviceEntity
+from custom_components.qolsys_panel.recent_events import RecentEvents
+from custom_components.qolsys_panel.registry import PanelRegistry
+from custom_components.qolsys_panel.runtime import DATA_RUNTIME, QolsysPanelRuntime
 from custom_components.qolsys_panel.services import (
+    ARM_PARTITIONS_SCHEMA,
+    BULK_COMMAND_SCHEMA,
+    BYPASS_ZONES_SCHEMA,
+    DATA_ENTRY_RESOLVER,
+    DEBUG_WINDOW_SCHEMA,
+    DISARM_PARTITIONS_SCHEMA,
+    FLEET_REPORT_SCHEMA,
+    QUERY_ZONES_SCHEMA,
+    RECENT_EVENTS_SCHEMA,
+    _partition_service,
+    async_arm_partitions,
+    async_bulk_command,
+    async_bypass_zones,
+    async_debug_window,
+    async_disarm_partitions,
+    async_fleet_report,
+    async_query_zones,
     async_quick_exit,
+    async_recent_events,
     async_trigger_auxilliary,
     async_trigger_fire,
     async_trigger_police,
 )
+from custom_components.qolsys_panel.zone_index import ZoneIndex
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import CONF_HOST, CONF_MAC, CONF_MODEL
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_platform import DATA_DOMAIN_PLATFORM_ENTITIES
 
 PARTITION_ID = "1"
 ALL_OPTIONS_ON = {
@@ -84,14 +115,6 @@ def _register_entity(hass: HomeAssistant, entry: MockConfigEntry) -> str:
     return entity_entry.entity_id
 
 
-def _make_ent(entity_id: str) -> MagicMock:
-    """Return a mock alarm entity as passed to the service handler."""
-    ent = MagicMock()
-    ent.entity_id = entity_id
-    ent._partition_id = PARTITION_ID
-    return ent
-
-
 def _make_call(hass: HomeAssistant, data: dict[str, Any]) -> MagicMock:
     """Return a mock ServiceCall."""
     call = MagicMock()
@@ -103,9 +126,11 @@ def _make_call(hass: HomeAssistant, data: dict[str, Any]) -> MagicMock:
 async def test_trigger_police(hass: HomeAssistant) -> None:
     """Police trigger forwards partition and silent flag to the controller."""
     entry = _make_entry(hass, ALL_OPTIONS_ON)
-    ent = _make_ent(_register_entity(hass, entry))
+    entity_id = _register_entity(hass, entry)
 
-    await async_trigger_police(ent, _make_call(hass, {"silent": True}))
+    await async_trigger_police(
+        entity_id, PARTITION_ID, _make_call(hass, {"silent": True})
+    )
 
     entry.runtime_data.commands.panel.trigger_police.assert_awaited_once_with(
         PARTITION_ID, True
@@ -115,9 +140,11 @@ async def test_trigger_police(hass: HomeAssistant) -> None:
 async def test_trigger_auxilliary(hass: HomeAssistant) -> None:
     """Auxiliary trigger forwards partition and silent flag to the controller."""
     entry = _make_entry(hass, ALL_OPTIONS_ON)
-    ent = _make_ent(_register_entity(hass, entry))
+    entity_id = _register_entity(hass, entry)
 
-    await async_trigger_auxilliary(ent, _make_call(hass, {"silent": False}))
+    await async_trigger_auxilliary(
+        entity_id, PARTITION_ID, _make_call(hass, {"silent": False})
+    )
 
     entry.runtime_data.commands.panel.trigger_auxilliary.assert_awaited_once_with(
         PARTITION_ID, False
@@ -127,9 +154,9 @@ async def test_trigger_auxilliary(hass: HomeAssistant) -> None:
 async def test_trigger_fire(hass: HomeAssistant) -> None:
     """Fire trigger forwards the partition to the controller."""
     entry = _make_entry(hass, ALL_OPTIONS_ON)
-    ent = _make_ent(_register_entity(hass, entry))
+    entity_id = _register_entity(hass, entry)
 
-    await async_trigger_fire(ent, _make_call(hass, {}))
+    await async_trigger_fire(entity_id, PARTITION_ID, _make_call(hass, {}))
 
     entry.runtime_data.commands.panel.trigger_fire.assert_awaited_once_with(
         PARTITION_ID
@@ -139,9 +166,9 @@ async def test_trigger_fire(hass: HomeAssistant) -> None:
 async def test_quick_exit(hass: HomeAssistant) -> None:
     """Quick exit forwards the partition and duration to the controller."""
     entry = _make_entry(hass, ALL_OPTIONS_ON)
-    ent = _make_ent(_register_entity(hass, entry))
+    entity_id = _register_entity(hass, entry)
 
-    await async_quick_exit(ent, _make_call(hass, {"duration": 45}))
+    await async_quick_exit(entity_id, PARTITION_ID, _make_call(hass, {"duration": 45}))
 
     entry.runtime_data.commands.panel.quick_exit.assert_awaited_once_with(
         PARTITION_ID, 45
@@ -161,13 +188,13 @@ COMMAND_HANDLERS = [
 async def test_command_error(hass: HomeAssistant, handler, command, data) -> None:
     """A controller command error surfaces as a HomeAssistantError."""
     entry = _make_entry(hass, ALL_OPTIONS_ON)
-    ent = _make_ent(_register_entity(hass, entry))
+    entity_id = _register_entity(hass, entry)
     getattr(
         entry.runtime_data.commands.panel, command
     ).side_effect = CommandExecutionError("boom")
 
     with pytest.raises(HomeAssistantError):
-        await handler(ent, _make_call(hass, data))
+        await handler(entity_id, PARTITION_ID, _make_call(hass, data))
 
 
 # (handler, call data) for every service handler.
@@ -190,10 +217,10 @@ OPTION_HANDLERS = [
 async def test_entity_not_registered(hass: HomeAssistant, handler, data) -> None:
     """An unknown entity raises a HomeAssistantError."""
     _make_entry(hass, ALL_OPTIONS_ON)
-    ent = _make_ent("alarm_control_panel.does_not_exist")
+    entity_id = "alarm_control_panel.does_not_exist"
 
     with pytest.raises(HomeAssistantError):
-        await handler(ent, _make_call(hass, data))
+        await handler(entity_id, PARTITION_ID, _make_call(hass, data))
 
 
 @pytest.mark.parametrize(("handler", "data"), ALL_HANDLERS)
@@ -201,20 +228,20 @@ async def test_not_loaded(hass: HomeAssistant, handler, data) -> None:
     """A config entry that is not loaded raises a HomeAssistantError."""
     entry = _make_entry(hass, ALL_OPTIONS_ON)
     entry.mock_state(hass, ConfigEntryState.SETUP_ERROR)
-    ent = _make_ent(_register_entity(hass, entry))
+    entity_id = _register_entity(hass, entry)
 
     with pytest.raises(HomeAssistantError):
-        await handler(ent, _make_call(hass, data))
+        await handler(entity_id, PARTITION_ID, _make_call(hass, data))
 
 
 @pytest.mark.parametrize(("handler", "option", "data"), OPTION_HANDLERS)
 async def test_option_disabled(hass: HomeAssistant, handler, option, data) -> None:
     """A trigger service refuses to run when disabled in options."""
     entry = _make_entry(hass, {option: False})
-    ent = _make_ent(_register_entity(hass, entry))
+    entity_id = _register_entity(hass, entry)
 
     with pytest.raises(HomeAssistantError):
-        await handler(ent, _make_call(hass, data))
+        await handler(entity_id, PARTITION_ID, _make_call(hass, data))
 
 
 @pytest.mark.parametrize(("handler", "data"), ALL_HANDLERS)
@@ -225,7 +252,669 @@ async def test_missing_config_entry(hass: HomeAssistant, handler, data) -> None:
     entity_entry = registry.async_get_or_create(
         "alarm_control_panel", DOMAIN, "orphan_partition"
     )
-    ent = _make_ent(entity_entry.entity_id)
+    entity_id = entity_entry.entity_id
 
     with pytest.raises(ServiceValidationError):
-        await handler(ent, _make_call(hass, data))
+        await handler(entity_id, PARTITION_ID, _make_call(hass, data))
+
+
+async def test_resolver_cache_invalidated(hass: HomeAssistant) -> None:
+    """Resolutions are cached until the entity or its config entry changes."""
+    entry = _make_entry(hass, ALL_OPTIONS_ON)
+    entity_id = _register_entity(hass, entry)
+    call = _make_call(hass, {"silent": False})
+
+    await async_trigger_police(entity_id, PARTITION_ID, call)
+    assert entity_id in hass.data[DATA_ENTRY_RESOLVER]._cache
+
+    # The entry unloading drops the cached resolution.
+    entry.mock_state(hass, ConfigEntryState.NOT_LOADED)
+    assert entity_id not in hass.data[DATA_ENTRY_RESOLVER]._cache
+    with pytest.raises(HomeAssistantError):
+        await async_trigger_police(entity_id, PARTITION_ID, call)
+
+    # So does removing the entity from the registry.
+    entry.mock_state(hass, ConfigEntryState.LOADED)
+    await async_trigger_police(entity_id, PARTITION_ID, call)
+    er.async_get(hass).async_remove(entity_id)
+    await hass.async_block_till_done()
+    assert entity_id not in hass.data[DATA_ENTRY_RESOLVER]._cache
+
+
+async def test_partition_service_concurrent(hass: HomeAssistant) -> None:
+    """Every targeted partition is handled, concurrently."""
+    entity_ids = list(_partitions_setup(hass, ["1", "2"]))
+    started: list[tuple[str, str]] = []
+    release = asyncio.Event()
+
+    async def _handler(entity_id: str, partition_id: str, call: Any) -> None:
+        started.append((entity_id, partition_id))
+        await release.wait()
+
+    task = hass.async_create_task(
+        _partition_service(_handler)(_make_call(hass, {"entity_id": entity_ids}))
+    )
+    await asyncio.sleep(0)
+    assert sorted(started) == [(entity_ids[0], "1"), (entity_ids[1], "2")]
+    release.set()
+    await task
+
+
+async def test_partition_service_all(hass: HomeAssistant) -> None:
+    """Targeting all entities handles every partition of the loaded panels."""
+    entity_ids = list(_partitions_setup(hass, ["1", "2"]))
+    handler = AsyncMock()
+
+    await _partition_service(handler)(_make_call(hass, {"entity_id": "all"}))
+
+    assert sorted(call.args[:2] for call in handler.await_args_list) == [
+        (entity_ids[0], "1"),
+        (entity_ids[1], "2"),
+    ]
+
+
+async def test_partition_service_aggregates_errors(hass: HomeAssistant) -> None:
+    """Failures of several partitions are reported together."""
+    entity_ids = list(_partitions_setup(hass, ["1", "2"]))
+    handler = AsyncMock(side_effect=HomeAssistantError("boom"))
+
+    with pytest.raises(HomeAssistantError) as err:
+        await _partition_service(handler)(_make_call(hass, {"entity_id": entity_ids}))
+
+    assert err.value.translation_key == "partition_commands_failed"
+    assert handler.await_count == 2
+
+
+async def test_partition_service_single_error(hass: HomeAssistant) -> None:
+    """A single failure is raised unchanged, after the others were sent."""
+    entity_ids = list(_partitions_setup(hass, ["1", "2"]))
+    error = CommandExecutionError("boom")
+    handler = AsyncMock(side_effect=[error, None])
+
+    with pytest.raises(CommandExecutionError) as err:
+        await _partition_service(handler)(_make_call(hass, {"entity_id": entity_ids}))
+
+    assert err.value is error
+    assert handler.await_count == 2
+
+
+async def test_partition_service_unknown_entity(hass: HomeAssistant) -> None:
+    """Targeting an entity that is not a partition is rejected."""
+    _partitions_setup(hass, ["1"])
+    handler = AsyncMock()
+
+    with pytest.raises(ServiceValidationError):
+        await _partition_service(handler)(
+            _make_call(hass, {"entity_id": ["alarm_control_panel.other"]})
+        )
+
+    handler.assert_not_awaited()
+
+
+def _make_automation_ent(entity_id: str, **methods: AsyncMock) -> MagicMock:
+    """Return a mock automation device entity with the given command methods."""
+    ent = MagicMock(spec=QolsysAutomationDeviceEntity)
+    ent.entity_id = entity_id
+    for name, method in methods.items():
+        setattr(ent, name, method)
+    return ent
+
+
+def _add_platform_entities(hass: HomeAssistant, *ents: MagicMock) -> None:
+    """Add the given entities to the loaded entities of the integration."""
+    tables = hass.data.setdefault(DATA_DOMAIN_PLATFORM_ENTITIES, {})
+    for ent in ents:
+        domain = ent.entity_id.split(".", 1)[0]
+        tables.setdefault((domain, DOMAIN), {})[ent.entity_id] = ent
+
+
+def _make_bulk_call(hass: HomeAssistant, data: dict[str, Any]) -> MagicMock:
+    """Return a mock ServiceCall for the bulk command service expecting a response."""
+    call = _make_call(hass, BULK_COMMAND_SCHEMA(data))
+    call.return_response = True
+    return call
+
+
+async def _bulk_command(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
+    """Run the bulk command service handler and return its response."""
+    return cast(dict[str, Any], await async_bulk_command(_make_bulk_call(hass, data)))
+
+
+async def test_bulk_command(hass: HomeAssistant) -> None:
+    """Bulk command dispatches to every device and reports per-device results."""
+    light = _make_automation_ent("light.kitchen", async_turn_off=AsyncMock())
+    outlet = _make_automation_ent("switch.porch", async_turn_off=AsyncMock())
+
+    _add_platform_entities(hass, light, outlet)
+    response = await _bulk_command(
+        hass,
+        {"entity_id": ["light.kitchen", "switch.porch"], "command": "turn_off"},
+    )
+
+    light.async_turn_off.assert_awaited_once_with()
+    outlet.async_turn_off.assert_awaited_once_with()
+    assert response["command"] == "turn_off"
+    assert response["elapsed_ms"] >= 0
+    assert response["results"]["light.kitchen"]["success"] is True
+    assert response["results"]["switch.porch"]["success"] is True
+
+
+async def test_bulk_command_partial_failure(hass: HomeAssistant) -> None:
+    """A failing device is reported without aborting the other devices."""
+    ok = _make_automation_ent("lock.front", async_lock=AsyncMock())
+    bad = _make_automation_ent(
+        "lock.back", async_lock=AsyncMock(side_effect=CommandExecutionError("jam"))
+    )
+
+    _add_platform_entities(hass, ok, bad)
+    response = await _bulk_command(
+        hass, {"entity_id": ["lock.front", "lock.back"], "command": "lock"}
+    )
+
+    assert response["results"]["lock.front"]["success"] is True
+    assert response["results"]["lock.back"]["success"] is False
+    assert "jam" in response["results"]["lock.back"]["error"]
+
+
+async def test_bulk_command_unexpected_error(hass: HomeAssistant) -> None:
+    """An unexpected error of a device is reported like the handled ones."""
+    ok = _make_automation_ent("switch.porch", async_turn_on=AsyncMock())
+    bad = _make_automation_ent(
+        "light.kitchen", async_turn_on=AsyncMock(side_effect=RuntimeError("boom"))
+    )
+
+    _add_platform_entities(hass, ok, bad)
+    response = await _bulk_command(
+        hass, {"entity_id": ["light.kitchen", "switch.porch"], "command": "turn_on"}
+    )
+
+    ok.async_turn_on.assert_awaited_once_with()
+    assert response["results"]["switch.porch"]["success"] is True
+    assert response["results"]["light.kitchen"]["success"] is False
+    assert response["results"]["light.kitchen"]["error"] == "boom"
+    assert response["results"]["light.kitchen"]["elapsed_ms"] >= 0
+
+
+async def test_bulk_command_max_concurrency(hass: HomeAssistant) -> None:
+    """No more than max_concurrency commands are in flight at once."""
+    in_flight = 0
+    peak = 0
+
+    async def _close() -> None:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+
+    ents = [
+        _make_automation_ent(
+            f"valve.v{i}", async_close_valve=AsyncMock(side_effect=_close)
+        )
+        for i in range(6)
+    ]
+
+    _add_platform_entities(hass, *ents)
+    await async_bulk_command(
+        _make_bulk_call(
+            hass,
+            {
+                "entity_id": [ent.entity_id for ent in ents],
+                "command": "close",
+                "max_concurrency": 2,
+            },
+        )
+    )
+
+    assert peak == 2
+
+
+@pytest.mark.parametrize(
+    ("entity_id", "command"),
+    [("light.unknown", "turn_off"), ("light.kitchen", "lock")],
+)
+async def test_bulk_command_invalid_target(
+    hass: HomeAssistant, entity_id: str, command: str
+) -> None:
+    """Unknown entities and unsupported commands are rejected before sending."""
+    light = _make_automation_ent("light.kitchen", async_turn_off=AsyncMock())
+
+    _add_platform_entities(hass, light)
+
+    with pytest.raises(ServiceValidationError):
+        await async_bulk_command(
+            _make_bulk_call(hass, {"entity_id": [entity_id], "command": command})
+        )
+
+    light.async_turn_off.assert_not_awaited()
+
+
+def _make_zone(zone_id: str, status: ZoneStatus, bypassable: bool = True) -> MagicMock:
+    """Return a controller zone mock on the test partition."""
+    zone = MagicMock()
+    zone.zone_id = zone_id
+    zone.partition_id = PARTITION_ID
+    zone.sensorname = f"Zone {zone_id}"
+    zone.sensortype = ZoneSensorType.DOOR_WINDOW
+    zone.sensorstatus = status
+    zone.is_battery_enabled.return_value = False
+    zone.is_bypassable.return_value = bypassable
+    return zone
+
+
+def _bypass_setup(
+    hass: HomeAssistant, zones: list[MagicMock]
+) -> tuple[MockConfigEntry, MagicMock]:
+    """Register a partition and one binary sensor per zone, and their indexes.
+
+    Returns the config entry and the controller partition. Zone entities are
+    registered as binary_sensor.zone<zone_id>.
+    """
+    entry = _make_entry(hass, ALL_OPTIONS_ON)
+    panel = entry.runtime_data
+    panel.state.zones = zones
+    panel.state.automation_devices = panel.state.scenes = []
+    panel.panel.AUTO_BYPASS = "true"
+    partition = MagicMock()
+    partition.id = PARTITION_ID
+    partition.arm = AsyncMock()
+    panel.state.partitions = [partition]
+    _register_entity(hass, entry)
+    for zone in zones:
+        er.async_get(hass).async_get_or_create(
+            "binary_sensor",
+            DOMAIN,
+            f"{PANEL_MAC}_zone{zone.zone_id}",
+            config_entry=entry,
+            suggested_object_id=f"zone{zone.zone_id}",
+        )
+
+    runtime = QolsysPanelRuntime()
+    runtime.registry = PanelRegistry(panel, PANEL_MAC)
+    runtime.registry.async_start()
+    runtime.zones = ZoneIndex(panel)
+    runtime.zones.async_start()
+    hass.data.setdefault(DATA_RUNTIME, {})[entry.entry_id] = runtime
+    return entry, partition
+
+
+async def _bypass_zones(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
+    """Run the bypass zones service handler and return its response."""
+    call = _make_call(hass, BYPASS_ZONES_SCHEMA(data))
+    call.return_response = True
+    return cast(dict[str, Any], await async_bypass_zones(call))
+
+
+async def test_bypass_zones_and_arm(hass: HomeAssistant) -> None:
+    """Arming a partition bypasses its open zones in the same command."""
+    zones = [_make_zone("1", ZoneStatus.OPEN), _make_zone("2", ZoneStatus.CLOSED)]
+    _, partition = _bypass_setup(hass, zones)
+
+    response = await _bypass_zones(
+        hass,
+        {
+            "entity_id": er.async_get(hass).async_get_entity_id(
+                "alarm_control_panel", DOMAIN, f"{PANEL_MAC}_partition1"
+            ),
+            "arm_mode": "arm_away",
+            "code": "1234",
+        },
+    )
+
+    partition.arm.assert_awaited_once_with(
+        PartitionArmingType.ARM_AWAY, user_code="1234"
+    )
+    assert response["partitions"] == {PARTITION_ID: {"bypass": ["1"], "armed": True}}
+
+
+async def test_bypass_zones_check_only(hass: HomeAssistant) -> None:
+    """Without an arm mode the selected zones are only checked."""
+    zones = [_make_zone("1", ZoneStatus.OPEN), _make_zone("2", ZoneStatus.OPEN)]
+    _, partition = _bypass_setup(hass, zones)
+
+    response = await _bypass_zones(
+        hass,
+        {"zones": ["binary_sensor.zone1", "binary_sensor.zone2"]},
+    )
+
+    partition.arm.assert_not_awaited()
+    assert response["partitions"][PARTITION_ID]["bypass"] == ["1", "2"]
+
+
+@pytest.mark.parametrize(
+    ("zones", "auto_bypass", "translation_key"),
+    [
+        (
+            [_make_zone("1", ZoneStatus.OPEN), _make_zone("2", ZoneStatus.OPEN)],
+            "true",
+            "zone_not_selected",
+        ),
+        ([_make_zone("1", ZoneStatus.OPEN, False)], "true", "zone_not_bypassable"),
+        ([_make_zone("1", ZoneStatus.OPEN)], "false", "auto_bypass_disabled"),
+    ],
+)
+async def test_bypass_zones_invalid(
+    hass: HomeAssistant,
+    zones: list[MagicMock],
+    auto_bypass: str,
+    translation_key: str,
+) -> None:
+    """Zones the panel would not bypass as selected fail before arming."""
+    entry, partition = _bypass_setup(hass, zones)
+    entry.runtime_data.panel.AUTO_BYPASS = auto_bypass
+
+    with pytest.raises(ServiceValidationError) as err:
+        await _bypass_zones(
+            hass,
+            {"zones": ["binary_sensor.zone1"], "arm_mode": "arm_home"},
+        )
+
+    assert err.value.translation_key == translation_key
+    partition.arm.assert_not_awaited()
+
+
+def _partitions_setup(
+    hass: HomeAssistant, partition_ids: list[str]
+) -> dict[str, MagicMock]:
+    """Register one alarm entity per partition, and the panel registry.
+
+    Returns the controller partitions by entity_id. Partition entities are
+    registered as alarm_control_panel.partition<id>.
+    """
+    entry = _make_entry(hass, ALL_OPTIONS_ON)
+    panel = entry.runtime_data
+    panel.state.partitions = []
+    panel.state.zones = panel.state.automation_devices = panel.state.scenes = []
+    partitions: dict[str, MagicMock] = {}
+    for partition_id in partition_ids:
+        partition = MagicMock()
+        partition.id = partition_id
+        partition.arm = AsyncMock()
+        partition.disarm = AsyncMock()
+        entity_id = (
+            er.async_get(hass)
+            .async_get_or_create(
+                "alarm_control_panel",
+                DOMAIN,
+                f"{PANEL_MAC}_partition{partition_id}",
+                config_entry=entry,
+                suggested_object_id=f"partition{partition_id}",
+            )
+            .entity_id
+        )
+        panel.state.partitions.append(partition)
+        partitions[entity_id] = partition
+
+    runtime = QolsysPanelRuntime()
+    runtime.registry = PanelRegistry(panel, PANEL_MAC)
+    runtime.registry.async_start()
+    hass.data.setdefault(DATA_RUNTIME, {})[entry.entry_id] = runtime
+    return partitions
+
+
+async def test_arm_partitions_concurrent(hass: HomeAssistant) -> None:
+    """Every partition is armed concurrently with the same code."""
+    partitions = _partitions_setup(hass, ["1", "2"])
+    release = asyncio.Event()
+
+    async def _arm(*args: Any, **kwargs: Any) -> None:
+        await release.wait()
+
+    for partition in partitions.values():
+        partition.arm.side_effect = _arm
+
+    call = _make_call(
+        hass,
+        ARM_PARTITIONS_SCHEMA(
+            {"entity_id": list(partitions), "arm_mode": "arm_night", "code": "1234"}
+        ),
+    )
+    call.return_response = True
+    task = hass.async_create_task(async_arm_partitions(call))
+    await asyncio.sleep(0)
+    for partition in partitions.values():
+        partition.arm.assert_called_once_with(
+            PartitionArmingType.ARM_NIGHT, user_code="1234"
+        )
+    release.set()
+    response = cast(dict[str, Any], await task)
+
+    assert set(response) == {"elapsed_ms", "partitions"}
+    assert list(response["partitions"]) == list(partitions)
+    for result in response["partitions"].values():
+        assert result["success"] is True
+        assert "error" not in result
+        assert result["elapsed_ms"] >= 0
+
+
+async def test_disarm_partitions_partial_failure(hass: HomeAssistant) -> None:
+    """A failed partition is reported without stopping the others."""
+    partitions = _partitions_setup(hass, ["1", "2"])
+    failing = partitions["alarm_control_panel.partition2"]
+    failing.disarm.side_effect = QolsysUserCodeError()
+    data = DISARM_PARTITIONS_SCHEMA({"entity_id": list(partitions), "code": "0000"})
+
+    call = _make_call(hass, data)
+    call.return_response = True
+    response = cast(dict[str, Any], await async_disarm_partitions(call))
+
+    for partition in partitions.values():
+        partition.disarm.assert_awaited_once_with(user_code="0000")
+    results = response["partitions"]
+    assert results["alarm_control_panel.partition1"]["success"] is True
+    assert results["alarm_control_panel.partition2"]["success"] is False
+    assert results["alarm_control_panel.partition2"]["error"] == "Invalid user code"
+
+    call = _make_call(hass, data)
+    call.return_response = False
+    with pytest.raises(HomeAssistantError) as err:
+        await async_disarm_partitions(call)
+    assert err.value.translation_key == "partition_commands_failed"
+    assert err.value.translation_placeholders == {
+        "errors": "alarm_control_panel.partition2: Invalid user code"
+    }
+
+
+async def test_arm_partitions_like_the_entity(hass: HomeAssistant) -> None:
+    """The service fails fast and journals the failure like the alarm entity."""
+    partitions = _partitions_setup(hass, ["1", "2"])
+    runtime = next(iter(hass.data[DATA_RUNTIME].values()))
+    runtime.zones = MagicMock()
+    runtime.zones.bypass_required_zones.side_effect = lambda partition_id: (
+        {"3": "Door"} if partition_id == "2" else {}
+    )
+    runtime.journal = MagicMock()
+    call = _make_call(
+        hass,
+        ARM_PARTITIONS_SCHEMA({"entity_id": list(partitions), "arm_mode": "arm_away"}),
+    )
+    call.return_response = True
+    response = cast(dict[str, Any], await async_arm_partitions(call))
+
+    results = response["partitions"]
+    assert results["alarm_control_panel.partition1"]["success"] is True
+    assert results["alarm_control_panel.partition2"] == {
+        "success": False,
+        "error": "ARM_AWAY: Zone bypass required:['3']",
+        "elapsed_ms": results["alarm_control_panel.partition2"]["elapsed_ms"],
+    }
+    partitions["alarm_control_panel.partition2"].arm.assert_not_awaited()
+    runtime.journal.async_append.assert_called_once_with(
+        "ARM_FAILURE",
+        "2",
+        {"arm_mode": "ARM_AWAY", "error": "ARM_AWAY: Zone bypass required:['3']"},
+    )
+
+
+async def test_arm_partitions_unknown_entity(hass: HomeAssistant) -> None:
+    """An entity that is not a Qolsys partition fails before any command."""
+    partitions = _partitions_setup(hass, ["1"])
+    call = _make_call(
+        hass,
+        ARM_PARTITIONS_SCHEMA(
+            {
+                "entity_id": [*partitions, "alarm_control_panel.other"],
+                "arm_mode": "arm_away",
+            }
+        ),
+    )
+
+    with pytest.raises(ServiceValidationError) as err:
+        await async_arm_partitions(call)
+
+    assert err.value.translation_key == "entity_not_found"
+    for partition in partitions.values():
+        partition.arm.assert_not_awaited()
+
+
+async def test_query_zones(hass: HomeAssistant) -> None:
+    """Zones are queried from the index of each panel, with their sensor."""
+    zones = [_make_zone("1", ZoneStatus.OPEN), _make_zone("2", ZoneStatus.CLOSED)]
+    for zone in zones:
+        zone.sensorname = f"Door {zone.zone_id}"
+    _bypass_setup(hass, zones)
+
+    partition = er.async_get(hass).async_get_entity_id(
+        "alarm_control_panel", DOMAIN, f"{PANEL_MAC}_partition1"
+    )
+    call = _make_call(
+        hass,
+        QUERY_ZONES_SCHEMA(
+            {"partition": partition, "sensor_type": "door_window", "status": "open"}
+        ),
+    )
+    response = cast(dict[str, Any], await async_query_zones(call))
+
+    assert response == {
+        "count": 1,
+        "zones": [
+            {
+                "zone_id": "1",
+                "name": "Door 1",
+                "partition_id": PARTITION_ID,
+                "sensor_type": "door_window",
+                "status": "open",
+                "battery": None,
+                "entity_id": "binary_sensor.zone1",
+            }
+        ],
+    }
+
+    call = _make_call(hass, QUERY_ZONES_SCHEMA({"name_prefix": "door"}))
+    response = cast(dict[str, Any], await async_query_zones(call))
+    assert response["count"] == 2
+
+
+async def test_fleet_report(hass: HomeAssistant) -> None:
+    """The report covers every panel, or the zones of one partition."""
+    _partitions_setup(hass, ["1", "2"])
+    entry = hass.config_entries.async_entries(DOMAIN)[0]
+    zones = []
+    for zone_id, partition_id in (("1", "1"), ("2", "2")):
+        zone = MagicMock()
+        zone.zone_id = zone_id
+        zone.sensorname = f"Zone {zone_id}"
+        zone.partition_id = partition_id
+        zone.latestdBm = -60
+        zone.averagedBm = zone.powerg_battery_level = None
+        zone.powerg_battery_voltage = None
+        zones.append(zone)
+    entry.runtime_data.state.zones = zones
+
+    response = cast(
+        dict[str, Any],
+        await async_fleet_report(_make_call(hass, FLEET_REPORT_SCHEMA({}))),
+    )
+    report = response["panels"][entry.entry_id]
+    assert report["title"] == entry.title
+    assert report["zones"] == 2
+    assert set(report["partitions"]) == {"1", "2"}
+
+    call = _make_call(
+        hass, FLEET_REPORT_SCHEMA({"partition": "alarm_control_panel.partition2"})
+    )
+    response = cast(dict[str, Any], await async_fleet_report(call))
+    report = response["panels"][entry.entry_id]
+    assert report["zones"] == 1
+    assert report["metrics"]["latest_dbm"]["count"] == 1
+    assert list(report["partitions"]) == ["2"]
+
+
+async def test_recent_events(hass: HomeAssistant) -> None:
+    """Events are returned per panel, or for a partition or a zone."""
+    _partitions_setup(hass, ["1", "2"])
+    entry = hass.config_entries.async_entries(DOMAIN)[0]
+    zone = MagicMock()
+    zone.zone_id = "10"
+    zone.partition_id = "2"
+    entry.runtime_data.state.zones = [zone]
+    runtime = hass.data[DATA_RUNTIME][entry.entry_id]
+    runtime.registry = PanelRegistry(entry.runtime_data, PANEL_MAC)
+    runtime.registry.async_start()
+    runtime.recent_events = RecentEvents(entry.runtime_data)
+    runtime.recent_events.add("zone_status", 10, 2, "open", now=0.0)
+    runtime.recent_events.add("alarm_state", 1, 1, "alarm", now=1.0)
+    runtime.recent_events.add("doorbell", now=2.0)
+    zone_entity = (
+        er.async_get(hass)
+        .async_get_or_create(
+            "binary_sensor",
+            DOMAIN,
+            f"{PANEL_MAC}_zone10",
+            config_entry=entry,
+            suggested_object_id="zone10",
+        )
+        .entity_id
+    )
+
+    response = cast(
+        dict[str, Any],
+        await async_recent_events(_make_call(hass, RECENT_EVENTS_SCHEMA({}))),
+    )
+    panel = response["panels"][entry.entry_id]
+    assert panel["title"] == entry.title
+    assert [event["type"] for event in panel["events"]] == [
+        "zone_status",
+        "alarm_state",
+        "doorbell",
+    ]
+
+    call = _make_call(
+        hass, RECENT_EVENTS_SCHEMA({"partition": "alarm_control_panel.partition2"})
+    )
+    response = cast(dict[str, Any], await async_recent_events(call))
+    assert response["panels"][entry.entry_id]["events"] == [
+        {
+            "time": "1970-01-01T00:00:00+00:00",
+            "type": "zone_status",
+            "id": "10",
+            "partition": "2",
+            "value": "open",
+        }
+    ]
+
+    call = _make_call(
+        hass, RECENT_EVENTS_SCHEMA({"zone": zone_entity, "type": "alarm_state"})
+    )
+    response = cast(dict[str, Any], await async_recent_events(call))
+    assert response["panels"][entry.entry_id]["events"] == []
+
+    call = _make_call(
+        hass, RECENT_EVENTS_SCHEMA({"zone": "alarm_control_panel.partition1"})
+    )
+    with pytest.raises(ServiceValidationError) as err:
+        await async_recent_events(call)
+    assert err.value.translation_key == "entity_not_found"
+
+
+async def test_debug_window(hass: HomeAssistant) -> None:
+    """The response is the end of the controller debug window."""
+    with patch(
+        "custom_components.qolsys_panel.services.async_open_debug_window",
+        return_value=datetime(2026, 1, 1, tzinfo=UTC),
+    ) as open_window:
+        response = await async_debug_window(
+            _make_call(hass, DEBUG_WINDOW_SCHEMA({"minutes": 5}))
+        )
+    open_window.assert_called_once_with(hass, timedelta(minutes=5))
+    assert response == {"until": "2026-01-01T00:00:00+00:00"}
@@ -2,7 +2,7 @@
 
 from unittest.mock import AsyncMock, patch
 
-from custom_components.qolsys_panel.utils import get_local_ip
+from custom_components.qolsys_panel.utils import RollingStats, get_local_ip
 from homeassistant.core import HomeAssistant
 
 ADAPTERS_PATH = "custom_components.qolsys_panel.utils.network.async_get_adapters"
@@ -23,3 +23,22 @@ async def test_get_local_ip_no_default_adapter(hass: HomeAssistant) -> None:
     adapters = [{"default": False, "ipv4": [{"address": "10.0.0.1"}]}]
     with patch(ADAPTERS_PATH, AsyncMock(return_value=adapters)):
         assert await get_local_ip(hass) == ""
+
+
+def test_rolling_stats() -> None:
+    """Percentiles use the nearest rank over the most recent samples."""
+    stats = RollingStats(size=4)
+    assert stats.percentile(50) is None
+
+    for value in (10.0, 0.1, 0.2, 0.3, 0.4):
+        stats.add(value)
+
+    assert stats.count == 5
+    assert stats.percentile(50) == 0.2
+    assert stats.percentile(100) == 0.4
+    assert stats.as_dict() == {
+        "count": 5,
+        "p50_ms": 200.0,
+        "p95_ms": 400.0,
+        "max_ms": 400.0,
+    }
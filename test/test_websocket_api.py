@@ -0,0 +1,97 @@
+"""Tests for the Qolsys Panel WebSocket API."""
+
+from unittest.mock import MagicMock
+
+from conftest import PANEL_MAC
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.typing import WebSocketGenerator
+from qolsys_controller.enum_qolsys import QolsysNotification
+from test_feed import _make_panel, _Zone
+
+from custom_components.qolsys_panel.const import DOMAIN
+from custom_components.qolsys_panel.feed import PanelFeed
+from custom_components.qolsys_panel.runtime import DATA_RUNTIME, QolsysPanelRuntime
+from custom_components.qolsys_panel.websocket_api import async_setup_websocket_api
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+
+@pytest.fixture
+async def panel(hass: HomeAssistant) -> MagicMock:
+    """Set up the WebSocket API and a loaded entry for a panel with one zone."""
+    assert await async_setup_component(hass, "websocket_api", {})
+    async_setup_websocket_api(hass)
+    panel: MagicMock = _make_panel([_Zone("1", "closed")])
+    entry = MockConfigEntry(domain=DOMAIN, unique_id=PANEL_MAC, entry_id="entry")
+    entry.add_to_hass(hass)
+    entry.runtime_data = panel
+    entry.mock_state(hass, ConfigEntryState.LOADED)
+    runtime = QolsysPanelRuntime()
+    runtime.feed = PanelFeed(panel)
+    hass.data.setdefault(DATA_RUNTIME, {})[entry.entry_id] = runtime
+    return panel
+
+
+async def test_snapshot(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, panel: MagicMock
+) -> None:
+    """The snapshot command returns the whole panel in one message."""
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id(
+        {"type": "qolsys_panel/snapshot", "entry_id": "entry"}
+    )
+    msg = await client.receive_json()
+
+    assert msg["success"]
+    assert msg["result"]["zones"] == {
+        "1": {"name": "Zone 1", "partition_id": 1, "status": "closed"}
+    }
+
+
+async def test_snapshot_entry_not_loaded(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, panel: MagicMock
+) -> None:
+    """An unknown entry is reported as not found."""
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id({"type": "qolsys_panel/snapshot", "entry_id": "x"})
+    msg = await client.receive_json()
+
+    assert not msg["success"]
+    assert msg["error"]["code"] == "not_found"
+
+
+async def test_subscribe(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, panel: MagicMock
+) -> None:
+    """A subscription gets the snapshot, then only the fields that change."""
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id(
+        {"type": "qolsys_panel/subscribe", "entry_id": "entry"}
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+    subscription = msg["id"]
+    snapshot = (await client.receive_json())["event"]
+    assert snapshot["zones"]["1"]["status"] == "closed"
+
+    zone = panel.state.zones[0]
+    zone.update("open")
+    zone.update("open")
+    zone.update("closed")
+    assert (await client.receive_json())["event"] == {
+        "zones": {"1": {"status": "open"}}
+    }
+    assert (await client.receive_json())["event"] == {
+        "zones": {"1": {"status": "closed"}}
+    }
+
+    await client.send_json_auto_id(
+        {"type": "unsubscribe_events", "subscription": subscription}
+    )
+    assert (await client.receive_json())["success"]
+    assert not zone._observers[QolsysNotification.ZONE_UPDATE]
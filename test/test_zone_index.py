@@ -0,0 +1,260 @@
+"""Tests for the Qolsys Panel zone indexes."""
+
+from collections.abc import Iterator, Set as AbstractSet
+from typing import Any
+from unittest.mock import MagicMock
+
+from qolsys_controller.enum_qolsys import QolsysNotification, ZoneSensorType, ZoneStatus
+from qolsys_controller.observable import Event
+from qolsys_controller.zone import QolsysZone
+
+from custom_components.qolsys_panel.zone_index import ZoneIndex
+
+
+def _make_zone(
+    zone_id: str,
+    name: str,
+    *,
+    sensor_type: ZoneSensorType = ZoneSensorType.DOOR_WINDOW,
+    status: ZoneStatus = ZoneStatus.CLOSED,
+    partition_id: str = "1",
+    battery: str | None = "Normal",
+) -> MagicMock:
+    """Return a controller zone mock."""
+    zone = MagicMock(spec=QolsysZone)
+    zone.zone_id = zone_id
+    zone.sensorname = name
+    zone.sensortype = sensor_type
+    zone.sensorstatus = status
+    zone.partition_id = partition_id
+    zone.is_battery_enabled.return_value = battery is not None
+    zone.battery_status = battery
+    return zone
+
+
+def _make_index(zones: list[MagicMock]) -> tuple[ZoneIndex, MagicMock]:
+    """Return a started index over the zones, and the controller mock."""
+    panel = MagicMock()
+    panel.state.zones = zones
+    panel.state.zone.side_effect = lambda zone_id: next(
+        (zone for zone in panel.state.zones if zone.zone_id == zone_id), None
+    )
+    index = ZoneIndex(panel)
+    index.async_start()
+    return index, panel
+
+
+def _ids(zones: list[dict[str, Any]]) -> list[str]:
+    return [zone["zone_id"] for zone in zones]
+
+
+def test_query_intersects_indexes() -> None:
+    """Every criterion narrows the result; zone ids sort numerically."""
+    index, _ = _make_index(
+        [
+            _make_zone("10", "Front Door", status=ZoneStatus.OPEN),
+            _make_zone("2", "Back Door", status=ZoneStatus.OPEN),
+            _make_zone("3", "Kitchen Window", partition_id="2", status=ZoneStatus.OPEN),
+            _make_zone(
+                "4", "Hall Motion", sensor_type=ZoneSensorType.MOTION, battery="Low"
+            ),
+            _make_zone(
+                "5", "front porch", sensor_type=ZoneSensorType.MOTION, battery=None
+            ),
+        ]
+    )
+
+    assert _ids(index.query()) == ["2", "3", "4", "5", "10"]
+    assert _ids(
+        index.query(partition_id="1", sensor_types=["door_window"], statuses=["open"])
+    ) == ["2", "10"]
+    assert _ids(index.query(statuses=["open", "closed"], partition_id="2")) == ["3"]
+    assert _ids(index.query(battery="low")) == ["4"]
+    assert _ids(index.query(name_prefix="FRONT")) == ["5", "10"]
+    assert _ids(index.query(name_prefix="front", sensor_types=["motion"])) == ["5"]
+    assert index.query(sensor_types=["water"]) == []
+    assert index.query(name_prefix="Front D")[0] == {
+        "zone_id": "10",
+        "name": "Front Door",
+        "partition_id": "1",
+        "sensor_type": "door_window",
+        "status": "open",
+        "battery": "normal",
+    }
+
+
+class _UnwalkedSet(AbstractSet[str]):
+    """An index set that may only be looked up in."""
+
+    def __init__(self, zone_ids: set[str]) -> None:
+        self._zone_ids = zone_ids
+
+    def __contains__(self, zone_id: object) -> bool:
+        return zone_id in self._zone_ids
+
+    def __len__(self) -> int:
+        return len(self._zone_ids)
+
+    def __iter__(self) -> Iterator[str]:
+        raise AssertionError("walked a set larger than the smallest criterion")
+
+
+def test_query_walks_smallest_criterion() -> None:
+    """Only the zones of the most selective criterion are walked."""
+    index, _ = _make_index(
+        [
+            _make_zone("1", "Front Door"),
+            _make_zone("2", "Back Door"),
+            _make_zone("3", "Hall Motion", battery="Low"),
+        ]
+    )
+    index._indexes["partition_id"]["1"] = _UnwalkedSet(
+        index._indexes["partition_id"]["1"]
+    )
+
+    assert _ids(index.query(partition_id="1", battery="low")) == ["3"]
+    assert _ids(index.query(battery="low", statuses=["closed", "closed"])) == ["3"]
+
+
+def test_zone_update_reindexes_zone() -> None:
+    """A zone notification moves only that zone between index entries."""
+    zone = _make_zone("1", "Front Door")
+    index, _ = _make_index([zone])
+
+    zone.sensorstatus = ZoneStatus.OPEN
+    zone.sensorname = "Garage Door"
+    index._on_zone_update(Event(QolsysNotification.ZONE_UPDATE, zone, {}))
+
+    assert index.query(statuses=["closed"]) == []
+    assert _ids(index.query(statuses=["open"])) == ["1"]
+    assert index.query(name_prefix="front") == []
+    assert _ids(index.query(name_prefix="garage")) == ["1"]
+    zone.register.assert_called_once_with(
+        QolsysNotification.ZONE_UPDATE, index._on_zone_update
+    )
+
+    # A zone that is not indexed is ignored.
+    other = _make_zone("2", "Other")
+    index._on_zone_update(Event(QolsysNotification.ZONE_UPDATE, other, {}))
+    assert _ids(index.query()) == ["1"]
+
+
+class _FrozenNames(list[tuple[str, str]]):
+    """Sorted names that may not change."""
+
+    def insert(self, *args: Any) -> None:
+        raise AssertionError("names changed")
+
+    def __delitem__(self, *args: Any) -> None:
+        raise AssertionError("names changed")
+
+
+def test_status_update_touches_status_only() -> None:
+    """A status change leaves the names and the other index entries alone."""
+    zone = _make_zone("1", "Front Door")
+    index, _ = _make_index([zone])
+    index._names = _FrozenNames(index._names)
+    partition = index._indexes["partition_id"]["1"]
+
+    zone.sensorstatus = ZoneStatus.OPEN
+    index._on_zone_update(Event(QolsysNotification.ZONE_UPDATE, zone, {}))
+
+    assert _ids(index.query(statuses=["open"])) == ["1"]
+    assert index._indexes["partition_id"]["1"] is partition
+    assert "closed" not in index._indexes["status"]
+
+
+def test_zone_add_and_delete() -> None:
+    """Added zones are indexed and deleted ones dropped from every index."""
+    index, panel = _make_index([])
+
+    zone = _make_zone("7", "Basement Water", sensor_type=ZoneSensorType.WATER)
+    panel.state.zones.append(zone)
+    index._on_zone_add(Event(QolsysNotification.ZONE_ADD, panel.state, {"id": 7}))
+    assert _ids(index.query(sensor_types=["water"])) == ["7"]
+
+    index._on_zone_delete(Event(QolsysNotification.ZONE_DELETE, panel.state, {"id": 7}))
+    assert index.query() == []
+    assert index.query(sensor_types=["water"]) == []
+    assert index.query(name_prefix="b") == []
+    zone.unregister.assert_called_once_with(
+        QolsysNotification.ZONE_UPDATE, index._on_zone_update
+    )
+
+    index.async_close()
+    panel.state.unregister.assert_any_call(
+        QolsysNotification.ZONE_ADD, index._on_zone_add
+    )
+
+
+def test_partition_summaries() -> None:
+    """Summaries follow the old and new fields of the zone that changed."""
+    door = _make_zone("1", "Door", status=ZoneStatus.OPEN)
+    motion = _make_zone("2", "Motion", status=ZoneStatus.TAMPERED, battery="Low")
+    index, _ = _make_index([door, motion])
+    calls: list[str] = []
+    index.async_listen_summary("1", lambda: calls.append("1"))
+    index.async_listen_summary("2", lambda: calls.append("2"))
+
+    assert index.summary("1", "open") == {"1": "Door"}
+    assert index.summary("1", "tampered") == {"2": "Motion"}
+    assert index.summary("1", "low_battery") == {"2": "Motion"}
+    assert index.summary("2", "open") == {}
+
+    # A change that keeps the summaries as they are calls no listener.
+    door.sensortype = ZoneSensorType.TILT
+    index._on_zone_update(Event(QolsysNotification.ZONE_UPDATE, door, {}))
+    assert calls == []
+
+    door.sensorstatus = ZoneStatus.CLOSED
+    index._on_zone_update(Event(QolsysNotification.ZONE_UPDATE, door, {}))
+    assert index.summary("1", "open") == {}
+    assert calls == ["1"]
+
+    motion.partition_id = "2"
+    motion.battery_status = "Normal"
+    index._on_zone_update(Event(QolsysNotification.ZONE_UPDATE, motion, {}))
+    assert index.summary("1", "tampered") == {}
+    assert index.summary("1", "low_battery") == {}
+    assert index.summary("2", "tampered") == {"2": "Motion"}
+    assert sorted(calls) == ["1", "1", "2"]
+
+
+def test_blocking_zones() -> None:
+    """Not ready zones block arming unless the panel bypasses them."""
+    door = _make_zone("1", "Door", status=ZoneStatus.OPEN)
+    motion = _make_zone("2", "Motion", status=ZoneStatus.UNREACHABLE)
+    window = _make_zone("3", "Window", partition_id="2")
+    door.is_bypassable.return_value = True
+    motion.is_bypassable.return_value = False
+    index, panel = _make_index([door, motion, window])
+
+    panel.panel.AUTO_BYPASS = "true"
+    assert index.blocking_zones("1") == {"2": "Motion"}
+    panel.panel.AUTO_BYPASS = "false"
+    assert index.blocking_zones("1") == {"1": "Door", "2": "Motion"}
+    assert index.blocking_zones("2") == {}
+
+    calls: list[str] = []
+    index.async_listen_summary("1", lambda: calls.append("1"))
+    door.sensorstatus = ZoneStatus.CLOSED
+    index._on_zone_update(Event(QolsysNotification.ZONE_UPDATE, door, {}))
+    assert index.blocking_zones("1") == {"2": "Motion"}
+    assert calls == ["1"]
+
+
+def test_bypass_required_zones() -> None:
+    """Only bypassable open zones stop arming, with auto bypass disabled."""
+    door = _make_zone("1", "Door", status=ZoneStatus.OPEN)
+    motion = _make_zone("2", "Motion", status=ZoneStatus.OPEN)
+    window = _make_zone("3", "Window", status=ZoneStatus.UNREACHABLE)
+    for zone in (door, window):
+        zone.is_bypassable.return_value = True
+    motion.is_bypassable.return_value = False
+    index, panel = _make_index([door, motion, window])
+
+    panel.panel.AUTO_BYPASS = "true"
+    assert index.bypass_required_zones("1") == {}
+    assert index.bypassable_zones("1") == {"1": "Door"}
+    panel.panel.AUTO_BYPASS = "false"
+    assert index.bypass_required_zones("1") == {"1": "Door"}